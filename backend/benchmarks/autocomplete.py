@@ -0,0 +1,44 @@
+import os
+import random
+import string
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("SERVER_ADDRESS", "0.0.0.0:8000")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from src.application.login_index import LoginIndex
+
+USERS = 1_000_000
+LOOKUPS = 20_000
+
+
+def random_login(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_lowercase + string.digits + "_", k=rng.randint(4, 16)))
+
+
+def main() -> None:
+    rng = random.Random(42)
+    logins = [random_login(rng) for _ in range(USERS)]
+
+    index = LoginIndex()
+    started = time.perf_counter()
+    index.rebuild((str(user_id), login, None) for user_id, login in enumerate(logins))
+    build_seconds = time.perf_counter() - started
+
+    prefixes = [rng.choice(logins)[: rng.randint(1, 4)] for _ in range(LOOKUPS)]
+    timings = []
+    for prefix in prefixes:
+        started = time.perf_counter()
+        index.complete(prefix)
+        timings.append((time.perf_counter() - started) * 1_000_000)
+    timings.sort()
+
+    print(f"{USERS:,} users, index built in {build_seconds:.2f} s")
+    print(f"p50: {timings[len(timings) // 2]:8.1f} us")
+    print(f"p99: {timings[int(len(timings) * 0.99)]:8.1f} us")
+    print(f"max: {timings[-1]:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import json
+import os
+import timeit
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("SERVER_ADDRESS", "0.0.0.0:8000")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from src.application.post_fragments import PostFragmentCache
+from src.domain.models.posts import PostRead
+
+ITEMS = 1000
+NUMBER = 5
+REPEAT = 5
+
+
+def make_rows(count: int) -> list[dict]:
+    now = datetime(2024, 6, 1)
+    author_id = str(uuid4())
+    return [
+        {
+            "id": str(uuid4()),
+            "authorId": author_id,
+            "authorLogin": "author",
+            "authorAvatar": "/static/uploads/avatar.png",
+            "title": f"Post {i}",
+            "content": "lorem ipsum " * 25,
+            "content_truncated": True,
+            "image_url": None,
+            "rating": i % 17,
+            "user_rating": 1 if i % 3 == 0 else None,
+            "comments_count": i % 11,
+            "favorites_count": i % 5,
+            "is_favorited": i % 2 == 0,
+            "tags": ["python", "web"],
+            "createdAt": now - timedelta(minutes=i),
+            "updatedAt": now - timedelta(minutes=i),
+        }
+        for i in range(count)
+    ]
+
+
+def validated_stdlib(rows: list[dict]) -> bytes:
+    # Previous path: validated construction, jsonable_encoder, then JSONResponse.render.
+    items = [PostRead(**row) for row in rows]
+    return json.dumps(
+        jsonable_encoder(items),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def trusted_orjson(rows: list[dict]) -> bytes:
+    # Current path: model_construct in the repository, list_response with orjson.
+    items = [PostRead.model_construct(**row) for row in rows]
+    return orjson.dumps([item.model_dump() for item in items])
+
+
+def warm_fragments(rows: list[dict]):
+    cache = PostFragmentCache(max_bytes=64 * 1024 * 1024)
+    items = [PostRead.model_construct(**row) for row in rows]
+    cache.render(items)
+    return lambda _: cache.render(items)
+
+
+def per_item_microseconds(serialize, rows: list[dict]) -> float:
+    best = min(timeit.repeat(lambda: serialize(rows), number=NUMBER, repeat=REPEAT))
+    return best / NUMBER / len(rows) * 1_000_000
+
+
+def main() -> None:
+    rows = make_rows(ITEMS)
+    assert json.loads(validated_stdlib(rows)) == json.loads(trusted_orjson(rows))
+
+    before = per_item_microseconds(validated_stdlib, rows)
+    after = per_item_microseconds(trusted_orjson, rows)
+    fragments = per_item_microseconds(warm_fragments(rows), rows)
+    print(f"{ITEMS} posts per response")
+    print(f"validated + jsonable_encoder + json: {before:8.2f} us/item")
+    print(f"model_construct + orjson:            {after:8.2f} us/item")
+    print(f"warm post fragment cache:            {fragments:8.2f} us/item")
+    print(
+        f"speedup:                             {before / after:8.2f}x / {before / fragments:.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
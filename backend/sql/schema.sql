@@ -1,32 +1,58 @@
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 CREATE TABLE users (
     id UUID PRIMARY KEY,
     email TEXT NOT NULL UNIQUE,
     login TEXT NOT NULL UNIQUE,
     password_hash TEXT NOT NULL,
+    followers_count INTEGER NOT NULL DEFAULT 0,
+    pull_timeline BOOLEAN NOT NULL DEFAULT FALSE,
     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
 
+CREATE INDEX ix_users_login_trgm ON users USING GIN (login gin_trgm_ops);
+CREATE INDEX ix_users_email_trgm ON users USING GIN (email gin_trgm_ops);
+CREATE INDEX ix_users_login_prefix ON users (lower(login) text_pattern_ops);
+
 CREATE TABLE posts (
     id UUID PRIMARY KEY,
     author_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
     title TEXT NOT NULL,
     content TEXT NOT NULL,
+    rating_sum INTEGER NOT NULL DEFAULT 0,
+    comments_count INTEGER NOT NULL DEFAULT 0,
+    favorites_count INTEGER NOT NULL DEFAULT 0,
+    hot_score DOUBLE PRECISION NOT NULL DEFAULT 0,
     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
-    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    search_vector TSVECTOR GENERATED ALWAYS AS (
+        setweight(to_tsvector('russian', title), 'A') ||
+        setweight(to_tsvector('russian', content), 'B')
+    ) STORED
 );
 
+CREATE INDEX ix_posts_created_at_id ON posts (created_at DESC, id DESC);
+CREATE INDEX ix_posts_author_id_created_at_id ON posts (author_id, created_at DESC, id DESC);
+CREATE INDEX ix_posts_hot_score_id ON posts (hot_score DESC, id DESC);
+CREATE INDEX ix_posts_search_vector ON posts USING GIN (search_vector);
+
 CREATE TABLE tags (
     id SERIAL PRIMARY KEY,
-    name TEXT NOT NULL UNIQUE
+    name TEXT NOT NULL UNIQUE,
+    post_count INTEGER NOT NULL DEFAULT 0
 );
 
 CREATE TABLE post_tags (
     post_id UUID NOT NULL REFERENCES posts(id) ON DELETE CASCADE,
     tag_id INTEGER NOT NULL REFERENCES tags(id) ON DELETE CASCADE,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     PRIMARY KEY (post_id, tag_id)
 );
 
+CREATE INDEX ix_post_tags_tag_id_created_at_post_id
+    ON post_tags (tag_id, created_at DESC, post_id DESC);
+
 CREATE TABLE favorites (
     user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
     post_id UUID NOT NULL REFERENCES posts(id) ON DELETE CASCADE,
@@ -34,6 +60,9 @@ CREATE TABLE favorites (
     PRIMARY KEY (user_id, post_id)
 );
 
+CREATE INDEX ix_favorites_user_id_created_at_post_id
+    ON favorites (user_id, created_at DESC, post_id DESC);
+
 CREATE TABLE comments (
     id UUID PRIMARY KEY,
     post_id UUID NOT NULL REFERENCES posts(id) ON DELETE CASCADE,
@@ -42,6 +71,9 @@ CREATE TABLE comments (
     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
 
+CREATE INDEX ix_comments_post_id_created_at_id ON comments (post_id, created_at DESC, id DESC);
+CREATE INDEX ix_comments_author_id ON comments (author_id);
+
 CREATE TABLE subscriptions (
     follower_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
     following_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
@@ -50,4 +82,17 @@ CREATE TABLE subscriptions (
     CHECK (follower_id <> following_id)
 );
 
+CREATE INDEX ix_subscriptions_following_id ON subscriptions (following_id);
+
+CREATE TABLE timeline_entries (
+    user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    post_id UUID NOT NULL REFERENCES posts(id) ON DELETE CASCADE,
+    author_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    created_at TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (user_id, post_id)
+);
 
+CREATE INDEX ix_timeline_entries_user_id_created_at_post_id
+    ON timeline_entries (user_id, created_at DESC, post_id DESC);
+CREATE INDEX ix_timeline_entries_user_id_author_id ON timeline_entries (user_id, author_id);
+CREATE INDEX ix_timeline_entries_post_id ON timeline_entries (post_id);
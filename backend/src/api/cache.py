@@ -0,0 +1,20 @@
+from fastapi import APIRouter
+
+from src.application.favorite_cache import favorite_membership_cache
+from src.application.post_cache import post_read_cache
+from src.application.post_fragments import post_fragment_cache
+from src.application.rating_buffer import rating_buffer
+from src.application.search_cache import search_result_cache
+
+router = APIRouter()
+
+
+@router.get("/stats", summary="Статистика кэшей")
+async def get_cache_stats():
+    return {
+        "posts": post_read_cache.stats(),
+        "post_fragments": post_fragment_cache.stats(),
+        "search": search_result_cache.stats(),
+        "favorites": favorite_membership_cache.stats(),
+        "rating_buffer": rating_buffer.stats(),
+    }
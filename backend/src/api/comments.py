@@ -1,7 +1,12 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
 
+from src.api.conditional import not_modified_response
 from src.api.dependencies import get_comments_service, get_current_user
+from src.api.fields import comment_fields
+from src.api.pagination import set_next_cursor
+from src.api.responses import list_response
 from src.application.comments_service import CommentsService
+from src.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from src.domain.models.posts import CommentCreate, CommentRead
 from src.domain.models.users import UserRead
 
@@ -11,9 +16,21 @@ router = APIRouter()
 @router.get("/{post_id}/comments", summary="Комментарии к посту")
 async def get_comments(
     post_id: str,
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    fields: frozenset[str] | None = Depends(comment_fields),
     service: CommentsService = Depends(get_comments_service),
-) -> list[CommentRead]:
-    return await service.get_comments(post_id)
+):
+    etag = await service.get_comments_etag(post_id, limit, cursor, fields)
+    if not_modified := not_modified_response(request, etag):
+        return not_modified
+
+    response.headers["ETag"] = etag
+    page = await service.get_comments(post_id, limit, cursor, fields)
+    set_next_cursor(response, page.next_cursor)
+    return list_response(page.items, response, fields)
 
 
 @router.post("/{post_id}/comments", summary="Добавить комментарий", response_model=CommentRead)
@@ -0,0 +1,9 @@
+from fastapi import Request, Response, status
+
+from src.core.etag import etag_matches
+
+
+def not_modified_response(request: Request, etag: str) -> Response | None:
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return None
@@ -5,9 +5,18 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.auth_service import AuthService
 from src.application.comments_service import CommentsService
+from src.application.favorite_cache import FavoriteMembershipCache, favorite_membership_cache
 from src.application.favorites_service import FavoritesService
+from src.application.login_index import LoginIndex, login_index
+from src.application.post_cache import PostReadCache, post_read_cache
+from src.application.post_fragments import PostFragmentCache, post_fragment_cache
+from src.application.post_search_index import PostSearchIndex, post_search_index
 from src.application.posts_service import PostsService
+from src.application.rating_buffer import RatingBuffer, rating_buffer
 from src.application.ratings_service import RatingsService
+from src.application.search_cache import SearchResultCache, search_result_cache
+from src.application.subscriptions_service import SubscriptionsService
+from src.application.tags_service import TagsService
 from src.application.uploads_service import UploadsService
 from src.application.users_service import UsersService
 from src.core.settings import settings
@@ -19,6 +28,10 @@ from src.infrastructure.repositories.comment_repository_impl import CommentRepos
 from src.infrastructure.repositories.favorite_repository_impl import FavoriteRepositoryImpl
 from src.infrastructure.repositories.post_repository_impl import PostRepositoryImpl
 from src.infrastructure.repositories.rating_repository_impl import RatingRepositoryImpl
+from src.infrastructure.repositories.subscription_repository_impl import (
+    SubscriptionRepositoryImpl,
+)
+from src.infrastructure.repositories.tag_repository_impl import TagRepositoryImpl
 from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
@@ -29,12 +42,26 @@ async def get_password_hasher() -> PasswordHasher:
     return sha256HashCreator()
 
 
-async def get_user_repository(session: AsyncSession = Depends(get_session)) -> UserRepositoryImpl:
-    return UserRepositoryImpl(session)
+async def get_login_index() -> LoginIndex:
+    return login_index
 
 
-async def get_post_repository(session: AsyncSession = Depends(get_session)) -> PostRepositoryImpl:
-    return PostRepositoryImpl(session)
+async def get_user_repository(
+    session: AsyncSession = Depends(get_session),
+    index: LoginIndex = Depends(get_login_index),
+) -> UserRepositoryImpl:
+    return UserRepositoryImpl(session, index)
+
+
+async def get_favorite_cache() -> FavoriteMembershipCache | None:
+    return favorite_membership_cache if settings.favorite_cache_enabled else None
+
+
+async def get_post_repository(
+    session: AsyncSession = Depends(get_session),
+    favorites: FavoriteMembershipCache | None = Depends(get_favorite_cache),
+) -> PostRepositoryImpl:
+    return PostRepositoryImpl(session, favorites)
 
 
 async def get_comment_repository(
@@ -45,8 +72,9 @@ async def get_comment_repository(
 
 async def get_favorite_repository(
     session: AsyncSession = Depends(get_session),
+    favorites: FavoriteMembershipCache | None = Depends(get_favorite_cache),
 ) -> FavoriteRepositoryImpl:
-    return FavoriteRepositoryImpl(session)
+    return FavoriteRepositoryImpl(session, favorites)
 
 
 async def get_rating_repository(
@@ -55,11 +83,44 @@ async def get_rating_repository(
     return RatingRepositoryImpl(session)
 
 
+async def get_subscription_repository(
+    session: AsyncSession = Depends(get_session),
+) -> SubscriptionRepositoryImpl:
+    return SubscriptionRepositoryImpl(session)
+
+
+async def get_tag_repository(session: AsyncSession = Depends(get_session)) -> TagRepositoryImpl:
+    return TagRepositoryImpl(session)
+
+
+async def get_post_read_cache() -> PostReadCache | None:
+    return post_read_cache if settings.post_cache_enabled else None
+
+
+async def get_post_fragment_cache() -> PostFragmentCache | None:
+    return post_fragment_cache if settings.post_fragment_cache_bytes > 0 else None
+
+
+async def get_search_result_cache() -> SearchResultCache | None:
+    return search_result_cache if settings.search_cache_enabled else None
+
+
+async def get_rating_buffer() -> RatingBuffer | None:
+    return rating_buffer if settings.rating_buffer_enabled else None
+
+
+async def get_post_search_index() -> PostSearchIndex | None:
+    return post_search_index if settings.search_backend == "bm25" else None
+
+
 async def get_user_service(
     repo: UserRepositoryImpl = Depends(get_user_repository),
     hasher: PasswordHasher = Depends(get_password_hasher),
+    search_cache: SearchResultCache | None = Depends(get_search_result_cache),
+    cache: PostReadCache | None = Depends(get_post_read_cache),
+    search_index: PostSearchIndex | None = Depends(get_post_search_index),
 ) -> UsersService:
-    return UsersService(repo, hasher)
+    return UsersService(repo, hasher, search_cache, cache, search_index)
 
 
 async def get_auth_service(
@@ -71,26 +132,46 @@ async def get_auth_service(
 
 async def get_posts_service(
     repo: PostRepositoryImpl = Depends(get_post_repository),
+    cache: PostReadCache | None = Depends(get_post_read_cache),
+    search_index: PostSearchIndex | None = Depends(get_post_search_index),
+    search_cache: SearchResultCache | None = Depends(get_search_result_cache),
 ) -> PostsService:
-    return PostsService(repo)
+    return PostsService(repo, cache, search_index, search_cache)
 
 
 async def get_comments_service(
     repo: CommentRepositoryImpl = Depends(get_comment_repository),
+    cache: PostReadCache | None = Depends(get_post_read_cache),
 ) -> CommentsService:
-    return CommentsService(repo)
+    return CommentsService(repo, cache)
 
 
 async def get_favorites_service(
     repo: FavoriteRepositoryImpl = Depends(get_favorite_repository),
+    cache: PostReadCache | None = Depends(get_post_read_cache),
 ) -> FavoritesService:
-    return FavoritesService(repo)
+    return FavoritesService(repo, cache)
 
 
 async def get_ratings_service(
     repo: RatingRepositoryImpl = Depends(get_rating_repository),
+    cache: PostReadCache | None = Depends(get_post_read_cache),
+    buffer: RatingBuffer | None = Depends(get_rating_buffer),
 ) -> RatingsService:
-    return RatingsService(repo)
+    return RatingsService(repo, cache, buffer)
+
+
+async def get_subscriptions_service(
+    repo: SubscriptionRepositoryImpl = Depends(get_subscription_repository),
+    user_repo: UserRepositoryImpl = Depends(get_user_repository),
+) -> SubscriptionsService:
+    return SubscriptionsService(repo, user_repo)
+
+
+async def get_tags_service(
+    repo: TagRepositoryImpl = Depends(get_tag_repository),
+) -> TagsService:
+    return TagsService(repo)
 
 
 async def get_uploads_service(
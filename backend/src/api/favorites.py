@@ -1,7 +1,12 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response
 
-from src.api.dependencies import get_current_user, get_favorites_service
+from src.api.dependencies import get_current_user, get_favorites_service, get_post_fragment_cache
+from src.api.fields import post_fields
+from src.api.pagination import set_next_cursor
+from src.api.responses import post_list_response
 from src.application.favorites_service import FavoritesService
+from src.application.post_fragments import PostFragmentCache
+from src.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from src.domain.models.users import UserRead
 
 router = APIRouter()
@@ -9,10 +14,17 @@ router = APIRouter()
 
 @router.get("", summary="Избранные посты")
 async def get_favorites(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    fields: frozenset[str] | None = Depends(post_fields),
+    fragments: PostFragmentCache | None = Depends(get_post_fragment_cache),
     service: FavoritesService = Depends(get_favorites_service),
     current_user: UserRead = Depends(get_current_user),
 ):
-    return await service.get_favorites(current_user.id)
+    page = await service.get_favorites(current_user.id, limit, cursor, fields)
+    set_next_cursor(response, page.next_cursor)
+    return post_list_response(page.items, response, fields, fragments)
 
 
 @router.post("/{post_id}", summary="Добавить в избранное")
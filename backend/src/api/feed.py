@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends, Query, Response
+
+from src.api.dependencies import get_current_user, get_post_fragment_cache, get_posts_service
+from src.api.fields import post_fields
+from src.api.pagination import set_next_cursor
+from src.api.responses import post_list_response
+from src.application.post_fragments import PostFragmentCache
+from src.application.posts_service import PostsService
+from src.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from src.domain.models.users import UserRead
+
+router = APIRouter()
+
+
+@router.get("", summary="Лента подписок")
+async def get_feed(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    fields: frozenset[str] | None = Depends(post_fields),
+    fragments: PostFragmentCache | None = Depends(get_post_fragment_cache),
+    service: PostsService = Depends(get_posts_service),
+    current_user: UserRead = Depends(get_current_user),
+):
+    page = await service.get_feed(current_user.id, limit, cursor, fields)
+    set_next_cursor(response, page.next_cursor)
+    return post_list_response(page.items, response, fields, fragments)
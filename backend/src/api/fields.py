@@ -0,0 +1,23 @@
+from collections.abc import Callable
+
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel
+
+from src.domain.fields import parse_fields
+from src.domain.models.posts import CommentRead, PostRead
+from src.domain.models.users import UserPublic
+
+
+def fields_query(model: type[BaseModel]) -> Callable[..., frozenset[str] | None]:
+    def dependency(fields: str | None = Query(None)) -> frozenset[str] | None:
+        try:
+            return parse_fields(fields, model)
+        except ValueError as err:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(err)) from err
+
+    return dependency
+
+
+post_fields = fields_query(PostRead)
+comment_fields = fields_query(CommentRead)
+user_fields = fields_query(UserPublic)
@@ -0,0 +1,8 @@
+from fastapi import Response
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def set_next_cursor(response: Response, next_cursor: str | None) -> None:
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
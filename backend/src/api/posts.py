@@ -1,8 +1,20 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import ORJSONResponse
 
-from src.api.dependencies import get_current_user, get_current_user_optional, get_posts_service
+from src.api.conditional import not_modified_response
+from src.api.dependencies import (
+    get_current_user,
+    get_current_user_optional,
+    get_post_fragment_cache,
+    get_posts_service,
+)
+from src.api.fields import post_fields
+from src.api.pagination import set_next_cursor
+from src.api.responses import dump_items, post_list_response
+from src.application.post_fragments import PostFragmentCache
 from src.application.posts_service import PostsService
-from src.domain.models.posts import PostCreateApi, PostRead, PostUpdate
+from src.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from src.domain.models.posts import PostBatchRequest, PostCreateApi, PostRead, PostSort, PostUpdate
 from src.domain.models.users import UserRead
 
 router = APIRouter()
@@ -17,31 +29,72 @@ async def create_post(
     return await service.create_post(post, current_user.id)
 
 
+@router.post("/batch", summary="Получить посты по списку id")
+async def get_posts_batch(
+    batch: PostBatchRequest,
+    fields: frozenset[str] | None = Depends(post_fields),
+    service: PostsService = Depends(get_posts_service),
+    current_user: UserRead | None = Depends(get_current_user_optional),
+):
+    user_id = current_user.id if current_user else None
+    result = await service.get_posts_batch(batch.ids, user_id, fields)
+    return ORJSONResponse({"items": dump_items(result.items, fields), "missing": result.missing})
+
+
 @router.get("/my", summary="Мои посты")
 async def get_my_posts(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    fields: frozenset[str] | None = Depends(post_fields),
+    fragments: PostFragmentCache | None = Depends(get_post_fragment_cache),
     service: PostsService = Depends(get_posts_service),
     current_user: UserRead = Depends(get_current_user),
 ):
-    return await service.get_my_posts(current_user.id)
+    page = await service.get_my_posts(current_user.id, limit, cursor, fields)
+    set_next_cursor(response, page.next_cursor)
+    return post_list_response(page.items, response, fields, fragments)
 
 
 @router.get("", summary="Все посты")
 async def get_posts(
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    sort: PostSort = "new",
+    fields: frozenset[str] | None = Depends(post_fields),
+    fragments: PostFragmentCache | None = Depends(get_post_fragment_cache),
     service: PostsService = Depends(get_posts_service),
     current_user: UserRead | None = Depends(get_current_user_optional),
 ):
     user_id = current_user.id if current_user else None
-    return await service.get_all_posts(user_id)
+    etag = await service.get_feed_etag(user_id, limit, cursor, sort, fields)
+    if not_modified := not_modified_response(request, etag):
+        return not_modified
+
+    page = await service.get_all_posts(user_id, limit, cursor, sort, fields)
+    set_next_cursor(response, page.next_cursor)
+    response.headers["ETag"] = etag
+    return post_list_response(page.items, response, fields, fragments)
 
 
 @router.get("/{post_id}", summary="Получить пост", response_model=PostRead)
 async def get_post(
     post_id: str,
+    request: Request,
+    response: Response,
     service: PostsService = Depends(get_posts_service),
     current_user: UserRead | None = Depends(get_current_user_optional),
 ):
     user_id = current_user.id if current_user else None
-    return await service.get_post(post_id, user_id)
+    post = await service.get_post(post_id, user_id)
+    etag = service.post_etag(post)
+    if not_modified := not_modified_response(request, etag):
+        return not_modified
+
+    response.headers["ETag"] = etag
+    return post
 
 
 @router.put("/{post_id}", summary="Обновить пост")
@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 
-from src.api.dependencies import get_current_user, get_ratings_service
+from src.api.dependencies import get_current_user, get_current_user_optional, get_ratings_service
 from src.application.ratings_service import RatingsService
-from src.domain.models.posts import RatingCreate
+from src.domain.models.posts import RatingBatch, RatingBatchRequest, RatingCreate
 from src.domain.models.users import UserRead
 
 router = APIRouter()
+bulk_router = APIRouter()
 
 
 @router.post("/{post_id}/rate", summary="Оценить пост")
@@ -16,3 +17,23 @@ async def rate_post(
     current_user: UserRead = Depends(get_current_user),
 ):
     return await service.rate_post(current_user.id, post_id, rating.value)
+
+
+@bulk_router.get("", summary="Рейтинги постов по списку id", response_model=RatingBatch)
+async def get_ratings(
+    post_ids: str = Query(..., min_length=1),
+    service: RatingsService = Depends(get_ratings_service),
+    current_user: UserRead | None = Depends(get_current_user_optional),
+):
+    user_id = current_user.id if current_user else None
+    ids = [post_id.strip() for post_id in post_ids.split(",") if post_id.strip()]
+    return await service.get_ratings(ids, user_id)
+
+
+@bulk_router.post("/batch", summary="Оценить несколько постов", response_model=RatingBatch)
+async def rate_posts(
+    batch: RatingBatchRequest,
+    service: RatingsService = Depends(get_ratings_service),
+    current_user: UserRead = Depends(get_current_user),
+):
+    return await service.rate_posts(current_user.id, batch.votes)
@@ -0,0 +1,34 @@
+from collections.abc import Sequence
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+from src.application.post_fragments import PostFragmentCache
+from src.domain.models.posts import PostRead
+
+
+def dump_items(items: Sequence[BaseModel], fields: frozenset[str] | None = None) -> list[dict]:
+    include = set(fields) if fields is not None else None
+    return [item.model_dump(include=include) for item in items]
+
+
+def list_response(
+    items: Sequence[BaseModel], response: Response, fields: frozenset[str] | None = None
+) -> ORJSONResponse:
+    # Returned responses bypass FastAPI's jsonable_encoder pass; carry over headers
+    # (X-Next-Cursor, ETag) set on the injected response.
+    return ORJSONResponse(dump_items(items, fields), headers=dict(response.headers))
+
+
+def post_list_response(
+    posts: Sequence[PostRead],
+    response: Response,
+    fields: frozenset[str] | None = None,
+    fragments: PostFragmentCache | None = None,
+) -> Response:
+    if fragments is None or fields is not None:
+        return list_response(posts, response, fields)
+    return Response(
+        fragments.render(posts), media_type="application/json", headers=dict(response.headers)
+    )
@@ -1,8 +1,24 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 
-from src.api.dependencies import get_current_user_optional, get_posts_service, get_user_service
+from src.api.dependencies import (
+    get_current_user_optional,
+    get_login_index,
+    get_post_fragment_cache,
+    get_posts_service,
+    get_user_service,
+)
+from src.api.fields import post_fields, user_fields
+from src.api.pagination import set_next_cursor
+from src.api.responses import list_response, post_list_response
+from src.application.login_index import (
+    DEFAULT_AUTOCOMPLETE_LIMIT,
+    MAX_AUTOCOMPLETE_LIMIT,
+    LoginIndex,
+)
+from src.application.post_fragments import PostFragmentCache
 from src.application.posts_service import PostsService
 from src.application.users_service import UsersService
+from src.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from src.domain.models.users import UserRead
 
 router = APIRouter()
@@ -10,17 +26,40 @@ router = APIRouter()
 
 @router.get("/posts", summary="Поиск постов")
 async def search_posts(
+    response: Response,
     q: str = Query(..., min_length=1),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    fields: frozenset[str] | None = Depends(post_fields),
+    fragments: PostFragmentCache | None = Depends(get_post_fragment_cache),
     service: PostsService = Depends(get_posts_service),
     current_user: UserRead | None = Depends(get_current_user_optional),
 ):
     user_id = current_user.id if current_user else None
-    return await service.search_posts(q, user_id)
+    page = await service.search_posts(q, user_id, limit, cursor, fields)
+    set_next_cursor(response, page.next_cursor)
+    return post_list_response(page.items, response, fields, fragments)
+
+
+@router.get("/users/autocomplete", summary="Автодополнение логинов")
+async def autocomplete_users(
+    response: Response,
+    prefix: str = Query(..., min_length=1),
+    limit: int = Query(DEFAULT_AUTOCOMPLETE_LIMIT, ge=1, le=MAX_AUTOCOMPLETE_LIMIT),
+    index: LoginIndex = Depends(get_login_index),
+):
+    return list_response(index.complete(prefix.removeprefix("@"), limit), response)
 
 
 @router.get("/users", summary="Поиск пользователей")
 async def search_users(
+    response: Response,
     q: str = Query(..., min_length=1),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    fields: frozenset[str] | None = Depends(user_fields),
     service: UsersService = Depends(get_user_service),
 ):
-    return await service.search_users(q)
+    page = await service.search_users(q, limit, cursor, fields)
+    set_next_cursor(response, page.next_cursor)
+    return list_response(page.items, response, fields)
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends
+
+from src.api.dependencies import get_current_user, get_subscriptions_service
+from src.application.subscriptions_service import SubscriptionsService
+from src.domain.models.users import UserRead
+
+router = APIRouter()
+
+
+@router.post("/{user_id}/follow", summary="Подписаться")
+async def follow_user(
+    user_id: str,
+    service: SubscriptionsService = Depends(get_subscriptions_service),
+    current_user: UserRead = Depends(get_current_user),
+):
+    await service.follow(current_user.id, user_id)
+    return {"status": "followed"}
+
+
+@router.delete("/{user_id}/follow", summary="Отписаться")
+async def unfollow_user(
+    user_id: str,
+    service: SubscriptionsService = Depends(get_subscriptions_service),
+    current_user: UserRead = Depends(get_current_user),
+):
+    await service.unfollow(current_user.id, user_id)
+    return {"status": "unfollowed"}
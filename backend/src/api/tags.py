@@ -0,0 +1,49 @@
+from fastapi import APIRouter, Depends, Query, Response
+
+from src.api.dependencies import (
+    get_current_user_optional,
+    get_post_fragment_cache,
+    get_posts_service,
+    get_tags_service,
+)
+from src.api.fields import post_fields
+from src.api.pagination import set_next_cursor
+from src.api.responses import post_list_response
+from src.application.post_fragments import PostFragmentCache
+from src.application.posts_service import PostsService
+from src.application.tags_service import TagsService
+from src.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from src.domain.models.posts import TagRead
+from src.domain.models.users import UserRead
+
+router = APIRouter()
+
+
+@router.get("", summary="Популярные теги", response_model=list[TagRead])
+async def get_popular_tags(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    service: TagsService = Depends(get_tags_service),
+):
+    return await service.get_popular_tags(limit)
+
+
+@router.get("/{name}", summary="Получить тег", response_model=TagRead)
+async def get_tag(name: str, service: TagsService = Depends(get_tags_service)):
+    return await service.get_tag(name)
+
+
+@router.get("/{name}/posts", summary="Посты по тегу")
+async def get_tag_posts(
+    name: str,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    fields: frozenset[str] | None = Depends(post_fields),
+    fragments: PostFragmentCache | None = Depends(get_post_fragment_cache),
+    service: PostsService = Depends(get_posts_service),
+    current_user: UserRead | None = Depends(get_current_user_optional),
+):
+    user_id = current_user.id if current_user else None
+    page = await service.get_tag_posts(name, user_id, limit, cursor, fields)
+    set_next_cursor(response, page.next_cursor)
+    return post_list_response(page.items, response, fields, fragments)
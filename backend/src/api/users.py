@@ -1,8 +1,19 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
 
-from src.api.dependencies import get_current_user, get_posts_service, get_user_service
+from src.api.conditional import not_modified_response
+from src.api.dependencies import (
+    get_current_user,
+    get_post_fragment_cache,
+    get_posts_service,
+    get_user_service,
+)
+from src.api.fields import post_fields
+from src.api.pagination import set_next_cursor
+from src.api.responses import post_list_response
+from src.application.post_fragments import PostFragmentCache
 from src.application.posts_service import PostsService
 from src.application.users_service import UsersService
+from src.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from src.domain.models.users import UserCreateApi, UserProfileUpdate, UserPublic, UserRead
 
 router = APIRouter()
@@ -36,17 +47,32 @@ async def update_my_profile(
 @router.get("/{user_id}", summary="Получить пользователя", response_model=UserPublic)
 async def get_user(
     user_id: str,
+    request: Request,
+    response: Response,
     service: UsersService = Depends(get_user_service),
 ):
-    return await service.get_user(user_id)
+    user = await service.get_user(user_id)
+    etag = service.profile_etag(user)
+    if not_modified := not_modified_response(request, etag):
+        return not_modified
+
+    response.headers["ETag"] = etag
+    return user
 
 
 @router.get("/{user_id}/posts", summary="Посты пользователя")
 async def get_user_posts(
     user_id: str,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    fields: frozenset[str] | None = Depends(post_fields),
+    fragments: PostFragmentCache | None = Depends(get_post_fragment_cache),
     posts_service: PostsService = Depends(get_posts_service),
 ):
-    return await posts_service.get_user_posts(user_id)
+    page = await posts_service.get_user_posts(user_id, limit=limit, cursor=cursor, fields=fields)
+    set_next_cursor(response, page.next_cursor)
+    return post_list_response(page.items, response, fields, fragments)
 
 
 @router.delete("/{user_id}", summary="Удаление профиля")
@@ -1,15 +1,37 @@
 from fastapi import HTTPException, status
 
-from src.domain.models.posts import CommentCreate, CommentRead
+from src.application.post_cache import PostReadCache
+from src.core.etag import make_etag
+from src.core.pagination import DEFAULT_PAGE_SIZE, parse_page_cursor
+from src.domain.models.posts import CommentCreate, CommentPage, CommentRead
 from src.domain.repositories.comment_repository import CommentRepository
 
 
 class CommentsService:
-    def __init__(self, repository: CommentRepository):
+    def __init__(self, repository: CommentRepository, cache: PostReadCache | None = None):
         self.repository = repository
-
-    async def get_comments(self, post_id: str) -> list[CommentRead]:
-        return await self.repository.get_by_post(post_id)
+        self.cache = cache
+
+    async def get_comments(
+        self,
+        post_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> CommentPage:
+        return await self.repository.get_by_post(post_id, limit, parse_page_cursor(cursor), fields)
+
+    async def get_comments_etag(
+        self,
+        post_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> str:
+        validators = await self.repository.get_comments_validators(
+            post_id, limit, parse_page_cursor(cursor)
+        )
+        return make_etag(post_id, limit, cursor, *sorted(fields or ()), *validators)
 
     async def create_comment(self, post_id: str, author_id: str, content: str) -> CommentRead:
         if not content or not content.strip():
@@ -18,7 +40,9 @@ class CommentsService:
             )
 
         comment = CommentCreate(content=content.strip())
-        return await self.repository.create(post_id, author_id, comment)
+        created = await self.repository.create(post_id, author_id, comment)
+        self._bump(post_id)
+        return created
 
     async def delete_comment(self, comment_id: str, current_user_id: str) -> None:
         comment = await self.repository.get_by_id(comment_id)
@@ -31,3 +55,8 @@ class CommentsService:
             )
 
         await self.repository.delete(comment_id)
+        self._bump(comment.postId)
+
+    def _bump(self, post_id: str) -> None:
+        if self.cache is not None:
+            self.cache.bump(post_id)
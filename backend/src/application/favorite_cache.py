@@ -0,0 +1,107 @@
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from uuid import UUID
+
+from src.core.cache import LRUCache
+from src.core.settings import settings
+
+
+class FavoriteMembershipCache:
+    def __init__(self, max_ids: int, max_user_ids: int, ttl: float):
+        self.max_ids = max_ids
+        self.max_user_ids = min(max_user_ids, max_ids)
+        self.ttl = ttl
+        self._users: OrderedDict[UUID, tuple[float, set[UUID]]] = OrderedDict()
+        self._oversized = LRUCache(1024, ttl)
+        self.size = 0
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def get(self, user_id: UUID) -> set[UUID] | None:
+        entry = self._users.get(user_id)
+        if entry is not None and entry[0] <= time.monotonic():
+            self._drop(user_id)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._users.move_to_end(user_id)
+        self.hits += 1
+        return entry[1]
+
+    def should_load(self, user_id: UUID) -> bool:
+        return self._oversized.get(user_id) is None
+
+    def load(self, user_id: UUID, post_ids: Iterable[UUID], version: int) -> set[UUID] | None:
+        # A favorite written while the ids were being read may be missing from
+        # them, so such a load is dropped and the next render tries again.
+        if version != self.version:
+            return None
+        favorited = set(post_ids)
+        if len(favorited) > self.max_user_ids:
+            self._oversized.set(user_id, True)
+            return None
+
+        self._drop(user_id)
+        self._users[user_id] = (time.monotonic() + self.ttl, favorited)
+        self.size += len(favorited)
+        self._evict()
+        return favorited
+
+    def add(self, user_id: UUID, post_id: UUID) -> None:
+        self.version += 1
+        entry = self._users.get(user_id)
+        if entry is None or post_id in entry[1]:
+            return
+        entry[1].add(post_id)
+        self.size += 1
+        if len(entry[1]) > self.max_user_ids:
+            self._drop(user_id)
+        self._evict()
+
+    def discard(self, user_id: UUID, post_id: UUID) -> None:
+        self.version += 1
+        entry = self._users.get(user_id)
+        if entry is not None and post_id in entry[1]:
+            entry[1].discard(post_id)
+            self.size -= 1
+
+    def clear(self) -> None:
+        self._users.clear()
+        self._oversized.clear()
+        self.size = 0
+
+    def stats(self) -> dict:
+        return {
+            "users": len(self._users),
+            "ids": self.size,
+            "max_ids": self.max_ids,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _drop(self, user_id: UUID) -> None:
+        entry = self._users.pop(user_id, None)
+        if entry is not None:
+            self.size -= len(entry[1])
+
+    def _evict(self) -> None:
+        while self.size > self.max_ids:
+            _, (_, evicted) = self._users.popitem(last=False)
+            self.size -= len(evicted)
+            self.evictions += 1
+
+
+favorite_membership_cache = FavoriteMembershipCache(
+    settings.favorite_cache_max_ids,
+    settings.favorite_cache_user_max_ids,
+    settings.favorite_cache_ttl_seconds,
+)
@@ -1,15 +1,26 @@
 from fastapi import HTTPException, status
 
-from src.domain.models.posts import PostRead
+from src.application.post_cache import PostReadCache
+from src.core.pagination import DEFAULT_PAGE_SIZE, parse_page_cursor
+from src.domain.models.posts import PostPage
 from src.domain.repositories.favorite_repository import FavoriteRepository
 
 
 class FavoritesService:
-    def __init__(self, repository: FavoriteRepository):
+    def __init__(self, repository: FavoriteRepository, cache: PostReadCache | None = None):
         self.repository = repository
+        self.cache = cache
 
-    async def get_favorites(self, user_id: str) -> list[PostRead]:
-        return await self.repository.get_user_favorites(user_id)
+    async def get_favorites(
+        self,
+        user_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> PostPage:
+        return await self.repository.get_user_favorites(
+            user_id, limit, parse_page_cursor(cursor), fields
+        )
 
     async def add_to_favorites(self, user_id: str, post_id: str) -> None:
         added = await self.repository.add(user_id, post_id)
@@ -18,8 +29,14 @@ class FavoritesService:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Already in favorites or invalid post",
             )
+        self._bump(post_id)
 
     async def remove_from_favorites(self, user_id: str, post_id: str) -> None:
         removed = await self.repository.remove(user_id, post_id)
         if not removed:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not in favorites")
+        self._bump(post_id)
+
+    def _bump(self, post_id: str) -> None:
+        if self.cache is not None:
+            self.cache.bump(post_id)
@@ -0,0 +1,55 @@
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+
+from src.domain.models.users import UserSuggestion
+
+DEFAULT_AUTOCOMPLETE_LIMIT = 10
+MAX_AUTOCOMPLETE_LIMIT = 50
+
+
+class LoginIndex:
+    def __init__(self):
+        self._keys: list[tuple[str, str]] = []
+        self._users: dict[str, tuple[str, str, str | None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def rebuild(self, users: Iterable[tuple[str, str, str | None]]) -> None:
+        self._users = {
+            user_id: (login.casefold(), login, avatar_url) for user_id, login, avatar_url in users
+        }
+        self._keys = sorted((entry[0], user_id) for user_id, entry in self._users.items())
+
+    def upsert(self, user_id: str, login: str, avatar_url: str | None) -> None:
+        self.remove(user_id)
+        key = login.casefold()
+        self._users[user_id] = (key, login, avatar_url)
+        insort(self._keys, (key, user_id))
+
+    def remove(self, user_id: str) -> None:
+        entry = self._users.pop(user_id, None)
+        if entry is None:
+            return
+
+        position = bisect_left(self._keys, (entry[0], user_id))
+        del self._keys[position]
+
+    def complete(
+        self, prefix: str, limit: int = DEFAULT_AUTOCOMPLETE_LIMIT
+    ) -> list[UserSuggestion]:
+        prefix = prefix.casefold()
+        if not prefix:
+            return []
+
+        suggestions = []
+        for position in range(bisect_left(self._keys, (prefix,)), len(self._keys)):
+            key, user_id = self._keys[position]
+            if not key.startswith(prefix) or len(suggestions) == limit:
+                break
+            _, login, avatar_url = self._users[user_id]
+            suggestions.append(UserSuggestion.model_construct(login=login, avatar_url=avatar_url))
+        return suggestions
+
+
+login_index = LoginIndex()
@@ -0,0 +1,45 @@
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from src.core.cache import LRUCache
+from src.core.settings import settings
+
+
+class PostReadCache:
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = LRUCache(maxsize, ttl)
+        self.global_version = 0
+        self._post_versions: dict[str, int] = {}
+
+    def post_version(self, post_id: str) -> int:
+        return self._post_versions.get(post_id, 0)
+
+    def bump(self, post_id: str | None = None) -> None:
+        self.global_version += 1
+        if post_id is not None:
+            self._post_versions[post_id] = self.global_version
+
+    def feed_key(self, *params: Hashable) -> tuple:
+        return ("feed", self.global_version, *params)
+
+    def post_key(self, post_id: str) -> tuple:
+        return ("post", post_id, self.post_version(post_id))
+
+    async def get_or_load(self, key: tuple, loader: Callable[[], Awaitable[Any]]) -> Any:
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        value = await loader()
+        if value is not None:
+            self._cache.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return {**self._cache.stats(), "global_version": self.global_version}
+
+
+post_read_cache = PostReadCache(settings.post_cache_size, settings.post_cache_ttl_seconds)
@@ -0,0 +1,62 @@
+from collections.abc import Sequence
+
+import orjson
+
+from src.core.cache import ByteBudgetLRUCache
+from src.core.settings import settings
+from src.domain.models.posts import PostRead
+
+VIEWER_FIELDS: set[str] = {"user_rating", "is_favorited"}
+
+
+class PostFragmentCache:
+    def __init__(self, max_bytes: int):
+        self._fragments = ByteBudgetLRUCache(max_bytes)
+
+    @staticmethod
+    def version(post: PostRead) -> tuple:
+        # Everything viewer-independent that can change without a new post id; content and
+        # tag edits move updatedAt.
+        return (
+            post.id,
+            post.updatedAt,
+            post.rating,
+            post.comments_count,
+            post.favorites_count,
+            post.authorLogin,
+            post.authorAvatar,
+            post.content_truncated,
+        )
+
+    def fragment(self, post: PostRead) -> bytes:
+        key = self.version(post)
+        fragment = self._fragments.get(key)
+        if fragment is None:
+            # Stored without the closing brace so viewer fields can be appended in place.
+            fragment = orjson.dumps(post.model_dump(exclude=VIEWER_FIELDS))[:-1]
+            self._fragments.set(key, fragment)
+        return fragment
+
+    def render(self, posts: Sequence[PostRead]) -> bytes:
+        return b"[" + b",".join(self._render_one(post) for post in posts) + b"]"
+
+    def _render_one(self, post: PostRead) -> bytes:
+        return b"".join(
+            (
+                self.fragment(post),
+                b',"user_rating":',
+                orjson.dumps(post.user_rating),
+                b',"is_favorited":',
+                b"true" if post.is_favorited else b"false",
+                b"}",
+            )
+        )
+
+    def clear(self) -> None:
+        self._fragments.clear()
+
+    def stats(self) -> dict:
+        return self._fragments.stats()
+
+
+post_fragment_cache = PostFragmentCache(settings.post_fragment_cache_bytes)
@@ -0,0 +1,86 @@
+import asyncio
+import heapq
+import os
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+from uuid import UUID
+
+from src.core.pagination import ScoreCursor, encode_score_cursor
+from src.core.settings import settings
+from src.domain.bm25 import BM25Index, pack_segment
+
+
+class PostSearchIndex:
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.index = BM25Index()
+        self.dirty = False
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def add(self, post_id: str, title: str, content: str, updated_at: datetime) -> None:
+        self.index.add(post_id, title, content, updated_at.timestamp())
+        self.dirty = True
+
+    def remove(self, post_id: str) -> None:
+        if self.index.remove(post_id):
+            self.dirty = True
+
+    def is_current(self, post_id: str, updated_at: datetime) -> bool:
+        return self.index.version(post_id) == updated_at.timestamp()
+
+    def post_ids(self) -> set[str]:
+        return set(self.index.versions())
+
+    def search(
+        self, query: str, limit: int, cursor: ScoreCursor | None = None
+    ) -> tuple[list[str], str | None]:
+        hits: Iterator[tuple[float, UUID]] = (
+            (score, UUID(post_id)) for post_id, score in self.index.search(query).items()
+        )
+        if cursor is not None:
+            hits = (hit for hit in hits if hit < cursor)
+        top = heapq.nlargest(limit + 1, hits)
+
+        next_cursor = None
+        if len(top) > limit:
+            top = top[:limit]
+            next_cursor = encode_score_cursor(*top[-1])
+        return [str(post_id) for _, post_id in top], next_cursor
+
+    def load(self) -> bool:
+        try:
+            self.index = BM25Index.from_segment(self.path.read_bytes())
+        except (OSError, ValueError):
+            self.index = BM25Index()
+            return False
+        self.dirty = False
+        return True
+
+    async def save(self) -> None:
+        if not self.dirty:
+            return
+
+        # The index is only read on the event loop; compression and the file write
+        # run in a thread. Posts indexed meanwhile mark it dirty for the next save.
+        parts = self.index.segment_parts()
+        self.dirty = False
+        try:
+            await asyncio.to_thread(self._write, *parts)
+        except BaseException:
+            self.dirty = True
+            raise
+
+    def _write(self, header: bytes, body: bytes) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_bytes(pack_segment(header, body))
+        os.replace(tmp_path, self.path)
+
+    def stats(self) -> dict:
+        return {"documents": len(self.index), "dirty": self.dirty, "path": str(self.path)}
+
+
+post_search_index = PostSearchIndex(settings.search_index_path)
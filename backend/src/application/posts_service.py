@@ -1,33 +1,155 @@
 from fastapi import HTTPException, status
 
-from src.domain.models.posts import PostCreate, PostCreateApi, PostRead, PostUpdate
+from src.application.post_cache import PostReadCache
+from src.application.post_search_index import PostSearchIndex
+from src.application.search_cache import POSTS, SearchResultCache, normalize_query
+from src.core.etag import make_etag
+from src.core.pagination import (
+    DEFAULT_PAGE_SIZE,
+    PageCursor,
+    ScoreCursor,
+    parse_page_cursor,
+    parse_score_cursor,
+)
+from src.domain.models.posts import (
+    PostBatch,
+    PostCreate,
+    PostCreateApi,
+    PostPage,
+    PostRead,
+    PostSort,
+    PostUpdate,
+)
 from src.domain.repositories.post_repository import PostRepository
+from src.domain.tags import normalize_tags
 
 
 class PostsService:
-    def __init__(self, repository: PostRepository):
+    def __init__(
+        self,
+        repository: PostRepository,
+        cache: PostReadCache | None = None,
+        search_index: PostSearchIndex | None = None,
+        search_cache: SearchResultCache | None = None,
+    ):
         self.repository = repository
+        self.cache = cache
+        self.search_index = search_index
+        self.search_cache = search_cache
 
     async def create_post(self, post: PostCreateApi, author_id: str) -> PostRead:
-        post_create = PostCreate(title=post.title, content=post.content)
-        return await self.repository.create(post_create, author_id)
+        post_create = PostCreate(
+            title=post.title, content=post.content, tags=self._normalize_tags(post.tags)
+        )
+        created = await self.repository.create(post_create, author_id)
+        self._bump(created.id)
+        self._bump_search()
+        self._index(created)
+        return created
 
     async def get_post(self, post_id: str, current_user_id: str | None = None) -> PostRead:
-        post = await self.repository.get_by_id(post_id, current_user_id)
+        if current_user_id is None and self.cache is not None:
+            post = await self.cache.get_or_load(
+                self.cache.post_key(post_id), lambda: self.repository.get_by_id(post_id, None)
+            )
+        else:
+            post = await self.repository.get_by_id(post_id, current_user_id)
         if not post:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
         return post
 
-    async def get_all_posts(self, current_user_id: str | None = None) -> list[PostRead]:
-        return await self.repository.get_all(current_user_id)
+    async def get_posts_batch(
+        self,
+        post_ids: list[str],
+        current_user_id: str | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> PostBatch:
+        requested = list(dict.fromkeys(post_ids))
+        found = await self.repository.get_many(requested, current_user_id, fields)
+        return PostBatch(
+            items=[found[post_id] for post_id in requested if post_id in found],
+            missing=[post_id for post_id in requested if post_id not in found],
+        )
+
+    async def get_all_posts(
+        self,
+        current_user_id: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        sort: PostSort = "new",
+        fields: frozenset[str] | None = None,
+    ) -> PostPage:
+        page_cursor = self._sort_cursor(cursor, sort)
+        if current_user_id is None and self.cache is not None:
+            return await self.cache.get_or_load(
+                self.cache.feed_key(sort, limit, cursor, fields),
+                lambda: self.repository.get_all(None, limit, page_cursor, sort, fields),
+            )
+        return await self.repository.get_all(current_user_id, limit, page_cursor, sort, fields)
+
+    async def get_feed(
+        self,
+        user_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> PostPage:
+        return await self.repository.get_timeline(user_id, limit, parse_page_cursor(cursor), fields)
 
-    async def get_my_posts(self, author_id: str) -> list[PostRead]:
-        return await self.repository.get_by_author(author_id, author_id)
+    async def get_tag_posts(
+        self,
+        tag_name: str,
+        current_user_id: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> PostPage:
+        return await self.repository.get_by_tag(
+            tag_name.lower(), current_user_id, limit, parse_page_cursor(cursor), fields
+        )
+
+    async def get_feed_etag(
+        self,
+        current_user_id: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        sort: PostSort = "new",
+        fields: frozenset[str] | None = None,
+    ) -> str:
+        page_cursor = self._sort_cursor(cursor, sort)
+        if current_user_id is None and self.cache is not None:
+            validators = await self.cache.get_or_load(
+                self.cache.feed_key("validators", sort, limit, cursor),
+                lambda: self.repository.get_feed_validators(limit, page_cursor, sort),
+            )
+        else:
+            validators = await self.repository.get_feed_validators(
+                limit, page_cursor, sort, current_user_id
+            )
+        return make_etag(current_user_id, *sorted(fields or ()), *validators)
+
+    async def get_my_posts(
+        self,
+        author_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> PostPage:
+        return await self.repository.get_by_author(
+            author_id, author_id, limit, parse_page_cursor(cursor), fields
+        )
 
     async def get_user_posts(
-        self, author_id: str, current_user_id: str | None = None
-    ) -> list[PostRead]:
-        return await self.repository.get_by_author(author_id, current_user_id)
+        self,
+        author_id: str,
+        current_user_id: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> PostPage:
+        return await self.repository.get_by_author(
+            author_id, current_user_id, limit, parse_page_cursor(cursor), fields
+        )
 
     async def update_post(
         self, post_id: str, post_data: PostUpdate, current_user_id: str
@@ -41,9 +163,15 @@ class PostsService:
                 status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
             )
 
+        if post_data.tags is not None:
+            post_data = post_data.model_copy(update={"tags": self._normalize_tags(post_data.tags)})
+
         updated = await self.repository.update(post_id, post_data)
         if not updated:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
+        self._bump(post_id)
+        self._bump_search()
+        self._index(updated)
         return updated
 
     async def delete_post(self, post_id: str, current_user_id: str) -> None:
@@ -59,6 +187,97 @@ class PostsService:
         deleted = await self.repository.delete(post_id)
         if not deleted:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
+        self._bump(post_id)
+        self._bump_search()
+        self._unindex(post_id)
+
+    async def search_posts(
+        self,
+        query: str,
+        current_user_id: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> PostPage:
+        query = normalize_query(query)
+        score_cursor = parse_score_cursor(cursor)
+        if self.search_cache is None:
+            return await self._search(query, current_user_id, limit, score_cursor, fields)
+
+        key = self.search_cache.key(POSTS, query, limit, cursor)
+        cached = self.search_cache.get(key)
+        if cached is not None:
+            post_ids, next_cursor = cached
+            return await self._get_page(post_ids, next_cursor, current_user_id, fields)
+
+        page = await self._search(query, current_user_id, limit, score_cursor, fields)
+        self.search_cache.set(key, [post.id for post in page.items], page.next_cursor)
+        return page
+
+    @staticmethod
+    def post_etag(post: PostRead) -> str:
+        return make_etag(
+            post.id,
+            post.updatedAt.isoformat(),
+            post.rating,
+            post.comments_count,
+            post.favorites_count,
+            post.user_rating,
+            post.is_favorited,
+            post.authorLogin,
+            post.authorAvatar,
+        )
+
+    async def _search(
+        self,
+        query: str,
+        current_user_id: str | None,
+        limit: int,
+        cursor: ScoreCursor | None,
+        fields: frozenset[str] | None,
+    ) -> PostPage:
+        if self.search_index is None:
+            return await self.repository.search(query, current_user_id, limit, cursor, fields)
+
+        post_ids, next_cursor = self.search_index.search(query, limit, cursor)
+        return await self._get_page(post_ids, next_cursor, current_user_id, fields)
+
+    async def _get_page(
+        self,
+        post_ids: list[str],
+        next_cursor: str | None,
+        current_user_id: str | None,
+        fields: frozenset[str] | None,
+    ) -> PostPage:
+        found = await self.repository.get_many(post_ids, current_user_id, fields)
+        return PostPage(
+            items=[found[post_id] for post_id in post_ids if post_id in found],
+            next_cursor=next_cursor,
+        )
+
+    def _bump(self, post_id: str) -> None:
+        if self.cache is not None:
+            self.cache.bump(post_id)
+
+    def _bump_search(self) -> None:
+        if self.search_cache is not None:
+            self.search_cache.bump(POSTS)
+
+    def _index(self, post: PostRead) -> None:
+        if self.search_index is not None:
+            self.search_index.add(post.id, post.title, post.content, post.updatedAt)
+
+    def _unindex(self, post_id: str) -> None:
+        if self.search_index is not None:
+            self.search_index.remove(post_id)
+
+    @staticmethod
+    def _normalize_tags(tags: list[str]) -> list[str]:
+        try:
+            return normalize_tags(tags)
+        except ValueError as err:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(err)) from err
 
-    async def search_posts(self, query: str, current_user_id: str | None = None) -> list[PostRead]:
-        return await self.repository.search(query, current_user_id)
+    @staticmethod
+    def _sort_cursor(cursor: str | None, sort: PostSort) -> PageCursor | ScoreCursor | None:
+        return parse_score_cursor(cursor) if sort == "hot" else parse_page_cursor(cursor)
@@ -0,0 +1,247 @@
+import asyncio
+import os
+from contextlib import suppress
+from pathlib import Path
+from typing import TextIO
+
+from src.core.cache import LRUCache
+from src.core.settings import settings
+from src.domain.models.posts import PostRatingState
+
+Vote = tuple[str, str]
+
+
+class RatingBuffer:
+    def __init__(self, path: str, max_pending: int, state_ttl: float = 5.0):
+        self.base_path = Path(path)
+        self.max_pending = max_pending
+        self._votes: dict[Vote, int] = {}
+        self._unsynced: list[tuple[Vote, int, asyncio.Future[None]]] = []
+        self._writer: asyncio.Task[None] | None = None
+        self._journal_lock = asyncio.Lock()
+        self._journal: TextIO | None = None
+        self._full = asyncio.Event()
+        # Flushed post totals and votes let a vote be answered without a database read;
+        # a flush invalidates the totals it changed.
+        self._totals = LRUCache(max_pending, state_ttl)
+        self._flushed_votes = LRUCache(max_pending, state_ttl)
+        self.accepted = 0
+        self.flushed = 0
+
+    def __len__(self) -> int:
+        return len(self._votes)
+
+    @property
+    def path(self) -> Path:
+        # Every worker process journals to its own file; the pid is read on use
+        # because the singleton is created before the server forks its workers.
+        return self._journal_path(os.getpid())
+
+    @property
+    def flushing_path(self) -> Path:
+        return _flushing(self.path)
+
+    async def add(self, user_id: str, post_id: str, value: int) -> None:
+        # The vote is acknowledged only once its journal line is synced, so a crashed
+        # process replays it on the next start instead of losing it.
+        await self._enqueue((user_id, post_id), value)
+
+    async def add_all(self, user_id: str, votes: dict[str, int]) -> None:
+        await asyncio.gather(
+            *(self._enqueue((user_id, post_id), value) for post_id, value in votes.items())
+        )
+
+    def pending(self, user_id: str, post_id: str) -> int | None:
+        return self._votes.get((user_id, post_id))
+
+    def rating_state(self, user_id: str, post_id: str) -> PostRatingState | None:
+        # A flushed vote that is no longer known counts as none until the next flush
+        # corrects the total.
+        rating = self._totals.get(post_id)
+        if rating is None:
+            return None
+        return PostRatingState(
+            rating=rating, user_rating=self._flushed_votes.get((user_id, post_id)) or None
+        )
+
+    def remember(self, user_id: str, post_id: str, state: PostRatingState) -> None:
+        self._totals.set(post_id, state.rating)
+        self._flushed_votes.set((user_id, post_id), state.user_rating or 0)
+
+    async def drain(self) -> dict[Vote, int]:
+        async with self._journal_lock:
+            votes, self._votes = self._votes, {}
+            self._full.clear()
+            self._close_journal()
+            if votes and self.path.exists():
+                os.replace(self.path, self.flushing_path)
+        return votes
+
+    def commit(self, votes: dict[Vote, int]) -> None:
+        self.flushed += len(votes)
+        for (user_id, post_id), value in votes.items():
+            self._totals.invalidate(post_id)
+            self._flushed_votes.set((user_id, post_id), value)
+        self.flushing_path.unlink(missing_ok=True)
+
+    async def restore(self, votes: dict[Vote, int]) -> None:
+        # Votes cast while the batch was in flight are newer and win.
+        async with self._journal_lock:
+            restored = {vote: value for vote, value in votes.items() if vote not in self._votes}
+            self._write([_journal_line(*vote, value) for vote, value in restored.items()])
+            self._votes.update(restored)
+            self.flushing_path.unlink(missing_ok=True)
+
+    async def wait(self, timeout: float) -> None:
+        with suppress(TimeoutError):
+            await asyncio.wait_for(self._full.wait(), timeout)
+
+    def load(self) -> int:
+        # Journals left by this pid or by workers that are no longer running are
+        # replayed oldest first and merged into this process's journal.
+        journals = sorted(self._orphaned_journals(), key=_replay_order)
+        for path in journals:
+            self._votes.update(_read_journal(path))
+
+        self._close_journal()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as journal:
+            journal.writelines(_journal_line(*vote, value) for vote, value in self._votes.items())
+            journal.flush()
+            os.fsync(journal.fileno())
+        os.replace(tmp_path, self.path)
+        for path in journals:
+            if path != self.path:
+                path.unlink(missing_ok=True)
+        return len(self._votes)
+
+    def close(self) -> None:
+        self._close_journal()
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._votes),
+            "max_pending": self.max_pending,
+            "accepted": self.accepted,
+            "flushed": self.flushed,
+        }
+
+    def _enqueue(self, vote: Vote, value: int) -> asyncio.Future[None]:
+        synced = asyncio.get_running_loop().create_future()
+        self._unsynced.append((vote, value, synced))
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._sync_journal())
+        return synced
+
+    async def _sync_journal(self) -> None:
+        # Votes that arrive while a batch is being synced share the next fsync, so the
+        # journal costs one disk sync per batch instead of one per vote.
+        try:
+            while self._unsynced:
+                batch, self._unsynced = self._unsynced, []
+                try:
+                    async with self._journal_lock:
+                        lines = [_journal_line(*vote, value) for vote, value, _ in batch]
+                        await asyncio.to_thread(self._write, lines)
+                        for vote, value, _ in batch:
+                            self._votes[vote] = value
+                except BaseException as exc:
+                    for _, _, synced in batch:
+                        if synced.done():
+                            continue
+                        if isinstance(exc, Exception):
+                            synced.set_exception(exc)
+                        else:
+                            synced.cancel()
+                    if not isinstance(exc, Exception):
+                        raise
+                    continue
+
+                self.accepted += len(batch)
+                if len(self._votes) >= self.max_pending:
+                    self._full.set()
+                for _, _, synced in batch:
+                    if not synced.done():
+                        synced.set_result(None)
+        finally:
+            self._writer = None
+
+    def _write(self, lines: list[str]) -> None:
+        if not lines:
+            return
+        if self._journal is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._journal = self.path.open("a", encoding="utf-8")
+        self._journal.writelines(lines)
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+
+    def _close_journal(self) -> None:
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def _journal_path(self, pid: int) -> Path:
+        return self.base_path.with_name(f"{self.base_path.name}.{pid}")
+
+    def _orphaned_journals(self) -> list[Path]:
+        journals = []
+        prefix = self.base_path.name + "."
+        for path in self.base_path.parent.glob(prefix + "*"):
+            pid = path.name.removeprefix(prefix).removesuffix(".flushing")
+            if not pid.isdigit():
+                continue
+            if int(pid) == os.getpid() or not _is_running(int(pid)):
+                journals.append(path)
+        return journals
+
+
+def _flushing(path: Path) -> Path:
+    return path.with_name(path.name + ".flushing")
+
+
+def _replay_order(path: Path) -> tuple[float, bool]:
+    # A worker's in-flight batch is older than the journal it reopened after draining.
+    try:
+        modified_at = path.stat().st_mtime
+    except OSError:
+        modified_at = 0.0
+    return modified_at, not path.name.endswith(".flushing")
+
+
+def _is_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _journal_line(user_id: str, post_id: str, value: int) -> str:
+    return f"{user_id} {post_id} {value}\n"
+
+
+def _read_journal(path: Path) -> dict[Vote, int]:
+    votes: dict[Vote, int] = {}
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return votes
+
+    for line in lines:
+        # A torn last line from a crash mid-write is skipped.
+        parts = line.split()
+        if len(parts) != 3 or parts[2] not in ("-1", "0", "1"):
+            continue
+        votes[(parts[0], parts[1])] = int(parts[2])
+    return votes
+
+
+rating_buffer = RatingBuffer(
+    settings.rating_buffer_journal_path,
+    settings.rating_buffer_max_pending,
+    settings.rating_buffer_state_ttl_seconds,
+)
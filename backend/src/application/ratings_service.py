@@ -1,21 +1,127 @@
 from fastapi import HTTPException, status
 
+from src.application.post_cache import PostReadCache
+from src.application.rating_buffer import RatingBuffer
+from src.core.pagination import MAX_PAGE_SIZE
+from src.domain.models.posts import PostRatingRead, PostRatingState, RatingBatch, RatingVote
 from src.domain.repositories.rating_repository import RatingRepository
 
 
 class RatingsService:
-    def __init__(self, repository: RatingRepository):
+    def __init__(
+        self,
+        repository: RatingRepository,
+        cache: PostReadCache | None = None,
+        buffer: RatingBuffer | None = None,
+    ):
         self.repository = repository
+        self.cache = cache
+        self.buffer = buffer
 
     async def rate_post(self, user_id: str, post_id: str, value: int) -> dict:
+        self._validate(value)
+
+        if self.buffer is not None:
+            return await self._buffer_rating(self.buffer, user_id, post_id, value)
+
+        if value == 0:
+            state = await self.repository.remove_rating(user_id, post_id)
+        else:
+            state = await self.repository.set_rating(user_id, post_id, value)
+        if state is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
+
+        self._bump(post_id)
+        return {
+            "status": "removed" if value == 0 else "rated",
+            "value": value,
+            "rating": state.rating,
+            "user_rating": state.user_rating,
+        }
+
+    async def _buffer_rating(
+        self, buffer: RatingBuffer, user_id: str, post_id: str, value: int
+    ) -> dict:
+        state = buffer.rating_state(user_id, post_id)
+        if state is None:
+            state = await self.repository.get_rating_state(user_id, post_id)
+            if state is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
+            buffer.remember(user_id, post_id, state)
+
+        await buffer.add(user_id, post_id, value)
+        state = self._with_pending_vote(user_id, post_id, state)
+        return {
+            "status": "removed" if value == 0 else "rated",
+            "value": value,
+            "rating": state.rating,
+            "user_rating": state.user_rating,
+        }
+
+    async def get_ratings(self, post_ids: list[str], user_id: str | None = None) -> RatingBatch:
+        requested = list(dict.fromkeys(post_ids))
+        if len(requested) > MAX_PAGE_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"At most {MAX_PAGE_SIZE} post ids are allowed",
+            )
+
+        found = await self.repository.get_ratings(requested, user_id)
+        return self._batch(requested, found, user_id)
+
+    async def rate_posts(self, user_id: str, votes: list[RatingVote]) -> RatingBatch:
+        for vote in votes:
+            self._validate(vote.value)
+        values = {vote.post_id: vote.value for vote in votes}
+
+        if self.buffer is not None:
+            found = await self.repository.get_ratings(list(values), user_id)
+            await self.buffer.add_all(user_id, {post_id: values[post_id] for post_id in found})
+        else:
+            changed = await self.repository.apply_ratings(
+                {(user_id, post_id): value for post_id, value in values.items()}
+            )
+            for post_id in changed:
+                self._bump(post_id)
+            found = await self.repository.get_ratings(list(values), user_id)
+        return self._batch(list(values), found, user_id)
+
+    def _batch(
+        self, post_ids: list[str], found: dict[str, PostRatingState], user_id: str | None
+    ) -> RatingBatch:
+        return RatingBatch(
+            items=[
+                PostRatingRead(
+                    post_id=post_id,
+                    **self._with_pending_vote(user_id, post_id, found[post_id]).model_dump(),
+                )
+                for post_id in post_ids
+                if post_id in found
+            ],
+            missing=[post_id for post_id in post_ids if post_id not in found],
+        )
+
+    def _with_pending_vote(
+        self, user_id: str | None, post_id: str, state: PostRatingState
+    ) -> PostRatingState:
+        # The total is the last flushed one with the caller's buffered vote swapped
+        # in; other buffered votes show up after the next flush.
+        if self.buffer is None or user_id is None:
+            return state
+        pending = self.buffer.pending(user_id, post_id)
+        if pending is None:
+            return state
+        return PostRatingState(
+            rating=state.rating - (state.user_rating or 0) + pending, user_rating=pending or None
+        )
+
+    @staticmethod
+    def _validate(value: int) -> None:
         if value not in [-1, 0, 1]:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="Rating must be -1, 0, or 1"
             )
 
-        if value == 0:
-            await self.repository.remove_rating(user_id, post_id)
-            return {"status": "removed", "value": 0}
-
-        await self.repository.set_rating(user_id, post_id, value)
-        return {"status": "rated", "value": value}
+    def _bump(self, post_id: str) -> None:
+        if self.cache is not None:
+            self.cache.bump(post_id)
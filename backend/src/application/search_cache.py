@@ -0,0 +1,41 @@
+from collections.abc import Hashable
+
+from src.core.cache import LRUCache
+from src.core.settings import settings
+
+POSTS = "posts"
+USERS = "users"
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.casefold().split())
+
+
+class SearchResultCache:
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = LRUCache(maxsize, ttl)
+        self._versions: dict[str, int] = {POSTS: 0, USERS: 0}
+
+    def key(self, kind: str, query: str, *params: Hashable) -> tuple:
+        return (kind, self._versions[kind], query, *params)
+
+    def get(self, key: tuple) -> tuple[list[str], str | None] | None:
+        return self._cache.get(key)
+
+    def set(self, key: tuple, ids: list[str], next_cursor: str | None) -> None:
+        self._cache.set(key, (ids, next_cursor))
+
+    def bump(self, *kinds: str) -> None:
+        for kind in kinds:
+            self._versions[kind] += 1
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return {**self._cache.stats(), "versions": dict(self._versions)}
+
+
+search_result_cache = SearchResultCache(
+    settings.search_cache_size, settings.search_cache_ttl_seconds
+)
@@ -0,0 +1,29 @@
+from fastapi import HTTPException, status
+
+from src.domain.repositories.subscription_repository import SubscriptionRepository
+from src.domain.repositories.user_repository import UserRepository
+
+
+class SubscriptionsService:
+    def __init__(self, repository: SubscriptionRepository, user_repository: UserRepository):
+        self.repository = repository
+        self.user_repository = user_repository
+
+    async def follow(self, follower_id: str, following_id: str) -> None:
+        if follower_id == following_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot follow yourself"
+            )
+
+        user = await self.user_repository.get_by_id(following_id)
+        if not user:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+
+        followed = await self.repository.follow(follower_id, following_id)
+        if not followed:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Already following")
+
+    async def unfollow(self, follower_id: str, following_id: str) -> None:
+        unfollowed = await self.repository.unfollow(follower_id, following_id)
+        if not unfollowed:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not following")
@@ -0,0 +1,18 @@
+from fastapi import HTTPException, status
+
+from src.domain.models.posts import TagRead
+from src.domain.repositories.tag_repository import TagRepository
+
+
+class TagsService:
+    def __init__(self, repository: TagRepository):
+        self.repository = repository
+
+    async def get_tag(self, name: str) -> TagRead:
+        tag = await self.repository.get_by_name(name.lower())
+        if not tag:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tag not found")
+        return tag
+
+    async def get_popular_tags(self, limit: int) -> list[TagRead]:
+        return await self.repository.get_popular(limit)
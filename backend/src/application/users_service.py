@@ -2,15 +2,36 @@ from datetime import datetime
 
 from fastapi import HTTPException, status
 
-from src.domain.models.users import UserCreate, UserCreateApi, UserProfileUpdate, UserPublic
+from src.application.post_cache import PostReadCache
+from src.application.post_search_index import PostSearchIndex
+from src.application.search_cache import POSTS, USERS, SearchResultCache, normalize_query
+from src.core.etag import make_etag
+from src.core.pagination import DEFAULT_PAGE_SIZE, parse_score_cursor
+from src.domain.models.users import (
+    UserCreate,
+    UserCreateApi,
+    UserPage,
+    UserProfileUpdate,
+    UserPublic,
+)
 from src.domain.password_hasher import PasswordHasher
 from src.domain.repositories.user_repository import UserRepository
 
 
 class UsersService:
-    def __init__(self, repository: UserRepository, password_hasher: PasswordHasher):
+    def __init__(
+        self,
+        repository: UserRepository,
+        password_hasher: PasswordHasher,
+        search_cache: SearchResultCache | None = None,
+        cache: PostReadCache | None = None,
+        search_index: PostSearchIndex | None = None,
+    ):
         self.repository = repository
         self.password_hasher = password_hasher
+        self.search_cache = search_cache
+        self.cache = cache
+        self.search_index = search_index
 
     async def create_user(self, user: UserCreateApi) -> UserPublic:
         existing_email = await self.repository.get_by_email(user.email)
@@ -32,6 +53,7 @@ class UsersService:
             updatedAt=datetime.utcnow(),
         )
         user_read = await self.repository.create(user_create)
+        self._bump_search(USERS)
         return self._to_public(user_read)
 
     async def get_user(self, user_id: str) -> UserPublic:
@@ -64,6 +86,7 @@ class UsersService:
         user = await self.repository.update_profile(user_id, profile)
         if not user:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+        self._bump_search(USERS)
         return user
 
     async def delete_user(self, user_id: str, current_user_id: str) -> None:
@@ -72,12 +95,54 @@ class UsersService:
                 status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
             )
 
+        # The user's posts are deleted with them, so their ids are read first.
+        post_ids = await self.repository.get_post_ids(user_id)
         deleted = await self.repository.delete(user_id)
         if not deleted:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+        self._bump_search(USERS, POSTS)
+        if self.cache is not None:
+            # Feeds also showed counters of other posts the user rated or commented on.
+            self.cache.bump()
+            for post_id in post_ids:
+                self.cache.bump(post_id)
+        if self.search_index is not None:
+            for post_id in post_ids:
+                self.search_index.remove(post_id)
+
+    async def search_users(
+        self,
+        query: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> UserPage:
+        query = normalize_query(query)
+        score_cursor = parse_score_cursor(cursor)
+        if self.search_cache is None:
+            return await self.repository.search(query, limit, score_cursor, fields)
+
+        key = self.search_cache.key(USERS, query, limit, cursor)
+        cached = self.search_cache.get(key)
+        if cached is not None:
+            user_ids, next_cursor = cached
+            found = await self.repository.get_many(user_ids, fields)
+            return UserPage(
+                items=[found[user_id] for user_id in user_ids if user_id in found],
+                next_cursor=next_cursor,
+            )
+
+        page = await self.repository.search(query, limit, score_cursor, fields)
+        self.search_cache.set(key, [user.id for user in page.items], page.next_cursor)
+        return page
+
+    @staticmethod
+    def profile_etag(user: UserPublic) -> str:
+        return make_etag(user.id, user.updatedAt.isoformat(), user.followers_count)
 
-    async def search_users(self, query: str) -> list[UserPublic]:
-        return await self.repository.search(query)
+    def _bump_search(self, *kinds: str) -> None:
+        if self.search_cache is not None:
+            self.search_cache.bump(*kinds)
 
     @staticmethod
     def _to_public(user_read) -> UserPublic:
@@ -0,0 +1,17 @@
+import hashlib
+
+
+def make_etag(*parts: object) -> str:
+    raw = "|".join(str(part) for part in parts).encode()
+    return f'W/"{hashlib.blake2b(raw, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(",")
+    )
@@ -0,0 +1,87 @@
+import base64
+import binascii
+import math
+from datetime import datetime
+from typing import NamedTuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class PageCursor(NamedTuple):
+    created_at: datetime
+    id: UUID
+
+
+class ScoreCursor(NamedTuple):
+    score: float
+    id: UUID
+
+
+def encode_cursor(created_at: datetime, item_id: UUID) -> str:
+    return _encode(created_at.isoformat(), item_id.hex)
+
+
+def decode_cursor(cursor: str) -> PageCursor:
+    created_at, item_id = _decode(cursor)
+    try:
+        return PageCursor(datetime.fromisoformat(created_at), UUID(item_id))
+    except ValueError as err:
+        raise ValueError("Invalid cursor") from err
+
+
+def encode_score_cursor(score: float, item_id: UUID) -> str:
+    return _encode(repr(score), item_id.hex)
+
+
+def decode_score_cursor(cursor: str) -> ScoreCursor:
+    score, item_id = _decode(cursor)
+    try:
+        parsed = ScoreCursor(float(score), UUID(item_id))
+    except ValueError as err:
+        raise ValueError("Invalid cursor") from err
+    # nan compares false against every rank and inf skips past all of them.
+    if not math.isfinite(parsed.score):
+        raise ValueError("Invalid cursor")
+    return parsed
+
+
+def parse_page_cursor(cursor: str | None) -> PageCursor | None:
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError as err:
+        raise _invalid_cursor() from err
+
+
+def parse_score_cursor(cursor: str | None) -> ScoreCursor | None:
+    if cursor is None:
+        return None
+    try:
+        return decode_score_cursor(cursor)
+    except ValueError as err:
+        raise _invalid_cursor() from err
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def _encode(*parts: str) -> str:
+    raw = "|".join(parts).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> list[str]:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        parts = base64.urlsafe_b64decode(padded.encode()).decode().split("|")
+    except (ValueError, binascii.Error) as err:
+        raise ValueError("Invalid cursor") from err
+    if len(parts) != 2:
+        raise ValueError("Invalid cursor")
+    return parts
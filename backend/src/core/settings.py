@@ -1,3 +1,5 @@
+from typing import Literal
+
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -12,6 +14,30 @@ class Settings(BaseSettings):
     secret_key: str
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    post_cache_enabled: bool = True
+    post_cache_size: int = 1024
+    post_cache_ttl_seconds: float = 30.0
+    post_fragment_cache_bytes: int = 8 * 1024 * 1024
+    timeline_fanout_limit: int = 10000
+    timeline_backfill_size: int = 100
+    timeline_fanout_resume_limit: int = 9000
+    timeline_backfill_batch_size: int = 1000
+    timeline_mode_sync_seconds: float = 60.0
+    search_backend: Literal["database", "bm25"] = "database"
+    search_index_path: str = "data/search_index.seg"
+    search_index_save_seconds: float = 60.0
+    search_cache_enabled: bool = True
+    search_cache_size: int = 1024
+    search_cache_ttl_seconds: float = 60.0
+    favorite_cache_enabled: bool = True
+    favorite_cache_max_ids: int = 1_000_000
+    favorite_cache_user_max_ids: int = 10_000
+    favorite_cache_ttl_seconds: float = 300.0
+    rating_buffer_enabled: bool = False
+    rating_buffer_flush_seconds: float = 0.2
+    rating_buffer_max_pending: int = 10000
+    rating_buffer_journal_path: str = "data/rating_votes.log"
+    rating_buffer_state_ttl_seconds: float = 5.0
 
 
 settings = Settings()
@@ -0,0 +1,232 @@
+import math
+import re
+import struct
+import sys
+import zlib
+from array import array
+from uuid import UUID
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+TITLE_WEIGHT = 2
+
+SEGMENT_MAGIC = b"MBBM25"
+SEGMENT_VERSION = 1
+_SEGMENT_HEADER = struct.Struct("<6sHIII")
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.casefold())
+
+
+class BM25Index:
+    def __init__(self):
+        self._postings: dict[str, dict[int, int]] = {}
+        self._doc_ids: list[str | None] = []
+        self._doc_numbers: dict[str, int] = {}
+        self._doc_lengths: list[int] = []
+        self._doc_versions: list[float] = []
+        self._doc_terms: list[tuple[str, ...]] = []
+        self._free_docs: list[int] = []
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_numbers)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._doc_numbers
+
+    def version(self, doc_id: str) -> float | None:
+        doc = self._doc_numbers.get(doc_id)
+        return None if doc is None else self._doc_versions[doc]
+
+    def versions(self) -> dict[str, float]:
+        return {doc_id: self._doc_versions[doc] for doc_id, doc in self._doc_numbers.items()}
+
+    def add(self, doc_id: str, title: str, content: str, version: float = 0.0) -> None:
+        self.remove(doc_id)
+
+        frequencies: dict[str, int] = {}
+        for term in tokenize(title):
+            frequencies[term] = frequencies.get(term, 0) + TITLE_WEIGHT
+        for term in tokenize(content):
+            frequencies[term] = frequencies.get(term, 0) + 1
+        self._append(doc_id, frequencies, version)
+
+    def remove(self, doc_id: str) -> bool:
+        doc = self._doc_numbers.pop(doc_id, None)
+        if doc is None:
+            return False
+
+        for term in self._doc_terms[doc]:
+            postings = self._postings[term]
+            del postings[doc]
+            if not postings:
+                del self._postings[term]
+        self._total_length -= self._doc_lengths[doc]
+        self._doc_ids[doc] = None
+        self._doc_lengths[doc] = 0
+        self._doc_terms[doc] = ()
+        self._free_docs.append(doc)
+        return True
+
+    def search(self, query: str) -> dict[str, float]:
+        if not self._doc_numbers:
+            return {}
+
+        doc_count = len(self._doc_numbers)
+        average_length = self._total_length / doc_count
+        scores: dict[int, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc, frequency in postings.items():
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self._doc_lengths[doc] / average_length)
+                score = idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+                scores[doc] = scores.get(doc, 0.0) + score
+
+        results: dict[str, float] = {}
+        for doc, score in scores.items():
+            doc_id = self._doc_ids[doc]
+            if doc_id is not None:
+                results[doc_id] = score
+        return results
+
+    def to_segment(self) -> bytes:
+        return pack_segment(*self.segment_parts())
+
+    def segment_parts(self) -> tuple[bytes, bytes]:
+        # Returns the header and the uncompressed body; documents are renumbered
+        # densely, so removed slots are not written out.
+        numbers = {doc: number for number, doc in enumerate(self._doc_numbers.values())}
+        doc_ids = b"".join(UUID(doc_id).bytes for doc_id in self._doc_numbers)
+        lengths = array("I", (self._doc_lengths[doc] for doc in numbers))
+        versions = array("d", (self._doc_versions[doc] for doc in numbers))
+
+        terms = sorted(self._postings)
+        offsets = array("I", [0])
+        posting_docs = array("I")
+        posting_frequencies = array("I")
+        for term in terms:
+            postings = self._postings[term]
+            posting_docs.extend(numbers[doc] for doc in postings)
+            posting_frequencies.extend(postings.values())
+            offsets.append(len(posting_docs))
+        term_bytes = "\n".join(terms).encode()
+
+        body = b"".join(
+            [
+                doc_ids,
+                _array_bytes(lengths),
+                _array_bytes(versions),
+                _array_bytes(offsets),
+                _array_bytes(posting_docs),
+                _array_bytes(posting_frequencies),
+                term_bytes,
+            ]
+        )
+        header = _SEGMENT_HEADER.pack(
+            SEGMENT_MAGIC, SEGMENT_VERSION, len(numbers), len(terms), len(posting_docs)
+        )
+        return header, body
+
+    @classmethod
+    def from_segment(cls, data: bytes) -> "BM25Index":
+        try:
+            magic, version, doc_count, term_count, posting_count = _SEGMENT_HEADER.unpack_from(data)
+            body = zlib.decompress(data[_SEGMENT_HEADER.size :])
+        except (struct.error, zlib.error) as err:
+            raise ValueError("Invalid search index segment") from err
+        if magic != SEGMENT_MAGIC or version != SEGMENT_VERSION:
+            raise ValueError("Invalid search index segment")
+
+        reader = _SegmentReader(body)
+        doc_ids_bytes = reader.take(16 * doc_count)
+        lengths = reader.array("I", doc_count)
+        versions = reader.array("d", doc_count)
+        offsets = reader.array("I", term_count + 1)
+        posting_docs = reader.array("I", posting_count)
+        posting_frequencies = reader.array("I", posting_count)
+        term_bytes = reader.rest()
+        terms = term_bytes.decode().split("\n") if term_count else []
+        if len(terms) != term_count:
+            raise ValueError("Invalid search index segment")
+
+        doc_ids = [
+            str(UUID(bytes=doc_ids_bytes[offset : offset + 16]))
+            for offset in range(0, len(doc_ids_bytes), 16)
+        ]
+        index = cls()
+        index._doc_ids = list(doc_ids)
+        index._doc_numbers = {doc_id: doc for doc, doc_id in enumerate(doc_ids)}
+        index._doc_lengths = lengths.tolist()
+        index._doc_versions = versions.tolist()
+        index._total_length = sum(index._doc_lengths)
+
+        doc_terms: list[list[str]] = [[] for _ in range(doc_count)]
+        for number, term in enumerate(terms):
+            start, end = offsets[number], offsets[number + 1]
+            docs = posting_docs[start:end]
+            index._postings[term] = dict(zip(docs, posting_frequencies[start:end], strict=True))
+            for doc in docs:
+                doc_terms[doc].append(term)
+        index._doc_terms = [tuple(doc_term) for doc_term in doc_terms]
+        return index
+
+    def _append(self, doc_id: str, frequencies: dict[str, int], version: float) -> None:
+        # Slots freed by remove() are reused so that edits do not grow the arrays.
+        length = sum(frequencies.values())
+        if self._free_docs:
+            doc = self._free_docs.pop()
+            self._doc_ids[doc] = doc_id
+            self._doc_lengths[doc] = length
+            self._doc_versions[doc] = version
+            self._doc_terms[doc] = tuple(frequencies)
+        else:
+            doc = len(self._doc_ids)
+            self._doc_ids.append(doc_id)
+            self._doc_lengths.append(length)
+            self._doc_versions.append(version)
+            self._doc_terms.append(tuple(frequencies))
+        self._doc_numbers[doc_id] = doc
+        self._total_length += length
+        for term, frequency in frequencies.items():
+            self._postings.setdefault(term, {})[doc] = frequency
+
+
+def pack_segment(header: bytes, body: bytes) -> bytes:
+    return header + zlib.compress(body)
+
+
+def _array_bytes(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+class _SegmentReader:
+    def __init__(self, data: bytes):
+        self._data = memoryview(data)
+        self._offset = 0
+
+    def take(self, size: int) -> bytes:
+        if self._offset + size > len(self._data):
+            raise ValueError("Invalid search index segment")
+        chunk = self._data[self._offset : self._offset + size].tobytes()
+        self._offset += size
+        return chunk
+
+    def array(self, typecode: str, count: int) -> array:
+        values = array(typecode)
+        values.frombytes(self.take(values.itemsize * count))
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values
+
+    def rest(self) -> bytes:
+        return self._data[self._offset :].tobytes()
@@ -0,0 +1,7 @@
+EXCERPT_LENGTH = 300
+
+
+def make_excerpt(content: str) -> tuple[str, bool]:
+    if len(content) <= EXCERPT_LENGTH:
+        return content, False
+    return content[:EXCERPT_LENGTH], True
@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+def parse_fields(fields: str | None, model: type[BaseModel]) -> frozenset[str] | None:
+    if fields is None:
+        return None
+
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - model.model_fields.keys()
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return frozenset(requested | {"id"})
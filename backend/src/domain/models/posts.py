@@ -1,6 +1,11 @@
 from datetime import datetime
+from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from src.core.pagination import MAX_PAGE_SIZE
+
+PostSort = Literal["new", "hot"]
 
 
 class PostRead(BaseModel):
@@ -10,29 +15,54 @@ class PostRead(BaseModel):
     authorAvatar: str | None = None
     title: str
     content: str
+    content_truncated: bool = False
     image_url: str | None = None
     rating: int = 0
     user_rating: int | None = None
     comments_count: int = 0
+    favorites_count: int = 0
     is_favorited: bool = False
+    tags: list[str] = []
     createdAt: datetime
     updatedAt: datetime
 
 
+class PostPage(BaseModel):
+    items: list[PostRead]
+    next_cursor: str | None = None
+
+
+class PostBatchRequest(BaseModel):
+    ids: list[str] = Field(min_length=1, max_length=MAX_PAGE_SIZE)
+
+
+class PostBatch(BaseModel):
+    items: list[PostRead]
+    missing: list[str] = []
+
+
 class PostCreate(BaseModel):
     title: str
     content: str
     image_url: str | None = None
+    tags: list[str] = []
 
 
 class PostUpdate(BaseModel):
     title: str
     content: str
+    tags: list[str] | None = None
 
 
 class PostCreateApi(BaseModel):
     title: str
     content: str
+    tags: list[str] = []
+
+
+class TagRead(BaseModel):
+    name: str
+    post_count: int = 0
 
 
 class CommentRead(BaseModel):
@@ -45,9 +75,37 @@ class CommentRead(BaseModel):
     createdAt: datetime
 
 
+class CommentPage(BaseModel):
+    items: list[CommentRead]
+    next_cursor: str | None = None
+
+
 class CommentCreate(BaseModel):
     content: str
 
 
 class RatingCreate(BaseModel):
     value: int  # -1, 0, 1
+
+
+class PostRatingState(BaseModel):
+    rating: int
+    user_rating: int | None = None
+
+
+class PostRatingRead(PostRatingState):
+    post_id: str
+
+
+class RatingBatch(BaseModel):
+    items: list[PostRatingRead]
+    missing: list[str] = []
+
+
+class RatingVote(BaseModel):
+    post_id: str
+    value: int  # -1, 0, 1
+
+
+class RatingBatchRequest(BaseModel):
+    votes: list[RatingVote] = Field(min_length=1, max_length=MAX_PAGE_SIZE)
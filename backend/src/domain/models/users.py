@@ -46,10 +46,21 @@ class UserPublic(BaseModel):
     login: str
     avatar_url: str | None = None
     bio: str | None = None
+    followers_count: int = 0
     createdAt: datetime
     updatedAt: datetime
 
 
+class UserSuggestion(BaseModel):
+    login: str
+    avatar_url: str | None = None
+
+
+class UserPage(BaseModel):
+    items: list[UserPublic]
+    next_cursor: str | None = None
+
+
 class UserProfileUpdate(BaseModel):
     email: str | None = None
     login: str | None = None
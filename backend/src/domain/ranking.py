@@ -0,0 +1,12 @@
+import math
+from datetime import datetime
+
+HOT_EPOCH = datetime(2024, 1, 1)
+HOT_DECAY_SECONDS = 45000
+
+
+def hot_score(rating: int, created_at: datetime) -> float:
+    order = math.log10(max(abs(rating), 1))
+    sign = (rating > 0) - (rating < 0)
+    age = (created_at.replace(tzinfo=None) - HOT_EPOCH).total_seconds()
+    return round(sign * order + age / HOT_DECAY_SECONDS, 7)
@@ -3,6 +3,8 @@ from src.domain.repositories.comment_repository import CommentRepository
 from src.domain.repositories.favorite_repository import FavoriteRepository
 from src.domain.repositories.post_repository import PostRepository
 from src.domain.repositories.rating_repository import RatingRepository
+from src.domain.repositories.subscription_repository import SubscriptionRepository
+from src.domain.repositories.tag_repository import TagRepository
 from src.domain.repositories.user_repository import UserRepository
 
 __all__ = [
@@ -12,4 +14,6 @@ __all__ = [
     "CommentRepository",
     "FavoriteRepository",
     "RatingRepository",
+    "SubscriptionRepository",
+    "TagRepository",
 ]
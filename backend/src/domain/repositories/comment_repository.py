@@ -1,11 +1,24 @@
 from abc import ABC, abstractmethod
 
-from src.domain.models.posts import CommentCreate, CommentRead
+from src.core.pagination import DEFAULT_PAGE_SIZE, PageCursor
+from src.domain.models.posts import CommentCreate, CommentPage, CommentRead
 
 
 class CommentRepository(ABC):
     @abstractmethod
-    async def get_by_post(self, post_id: str) -> list[CommentRead]:
+    async def get_by_post(
+        self,
+        post_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: PageCursor | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> CommentPage:
+        pass
+
+    @abstractmethod
+    async def get_comments_validators(
+        self, post_id: str, limit: int = DEFAULT_PAGE_SIZE, cursor: PageCursor | None = None
+    ) -> list[tuple]:
         pass
 
     @abstractmethod
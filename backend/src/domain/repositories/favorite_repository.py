@@ -1,11 +1,18 @@
 from abc import ABC, abstractmethod
 
-from src.domain.models.posts import PostRead
+from src.core.pagination import DEFAULT_PAGE_SIZE, PageCursor
+from src.domain.models.posts import PostPage
 
 
 class FavoriteRepository(ABC):
     @abstractmethod
-    async def get_user_favorites(self, user_id: str) -> list[PostRead]:
+    async def get_user_favorites(
+        self,
+        user_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: PageCursor | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> PostPage:
         pass
 
     @abstractmethod
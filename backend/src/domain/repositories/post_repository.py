@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
-from src.domain.models.posts import PostCreate, PostRead, PostUpdate
+from src.core.pagination import DEFAULT_PAGE_SIZE, PageCursor, ScoreCursor
+from src.domain.models.posts import PostCreate, PostPage, PostRead, PostSort, PostUpdate
 
 
 class PostRepository(ABC):
@@ -9,13 +10,65 @@ class PostRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_all(self, current_user_id: str | None = None) -> list[PostRead]:
+    async def get_many(
+        self,
+        post_ids: list[str],
+        current_user_id: str | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> dict[str, PostRead]:
+        pass
+
+    @abstractmethod
+    async def get_all(
+        self,
+        current_user_id: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: PageCursor | ScoreCursor | None = None,
+        sort: PostSort = "new",
+        fields: frozenset[str] | None = None,
+    ) -> PostPage:
+        pass
+
+    @abstractmethod
+    async def get_feed_validators(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: PageCursor | ScoreCursor | None = None,
+        sort: PostSort = "new",
+        viewer_id: str | None = None,
+    ) -> list[tuple]:
         pass
 
     @abstractmethod
     async def get_by_author(
-        self, author_id: str, current_user_id: str | None = None
-    ) -> list[PostRead]:
+        self,
+        author_id: str,
+        current_user_id: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: PageCursor | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> PostPage:
+        pass
+
+    @abstractmethod
+    async def get_timeline(
+        self,
+        user_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: PageCursor | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> PostPage:
+        pass
+
+    @abstractmethod
+    async def get_by_tag(
+        self,
+        tag_name: str,
+        current_user_id: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: PageCursor | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> PostPage:
         pass
 
     @abstractmethod
@@ -31,5 +84,12 @@ class PostRepository(ABC):
         pass
 
     @abstractmethod
-    async def search(self, query: str, current_user_id: str | None = None) -> list[PostRead]:
+    async def search(
+        self,
+        query: str,
+        current_user_id: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: ScoreCursor | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> PostPage:
         pass
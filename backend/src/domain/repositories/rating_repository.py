@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from src.domain.models.posts import PostRatingState
+
 
 class RatingRepository(ABC):
     @abstractmethod
@@ -11,9 +13,23 @@ class RatingRepository(ABC):
         pass
 
     @abstractmethod
-    async def set_rating(self, user_id: str, post_id: str, value: int) -> bool:
+    async def set_rating(self, user_id: str, post_id: str, value: int) -> PostRatingState | None:
+        pass
+
+    @abstractmethod
+    async def remove_rating(self, user_id: str, post_id: str) -> PostRatingState | None:
+        pass
+
+    @abstractmethod
+    async def get_rating_state(self, user_id: str, post_id: str) -> PostRatingState | None:
+        pass
+
+    @abstractmethod
+    async def get_ratings(
+        self, post_ids: list[str], user_id: str | None = None
+    ) -> dict[str, PostRatingState]:
         pass
 
     @abstractmethod
-    async def remove_rating(self, user_id: str, post_id: str) -> bool:
+    async def apply_ratings(self, votes: dict[tuple[str, str], int]) -> list[str]:
         pass
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+
+class SubscriptionRepository(ABC):
+    @abstractmethod
+    async def follow(self, follower_id: str, following_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def unfollow(self, follower_id: str, following_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def is_following(self, follower_id: str, following_id: str) -> bool:
+        pass
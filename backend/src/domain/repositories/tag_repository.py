@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from src.domain.models.posts import TagRead
+
+
+class TagRepository(ABC):
+    @abstractmethod
+    async def get_by_name(self, name: str) -> TagRead | None:
+        pass
+
+    @abstractmethod
+    async def get_popular(self, limit: int) -> list[TagRead]:
+        pass
@@ -1,6 +1,13 @@
 from abc import ABC, abstractmethod
 
-from src.domain.models.users import UserCreate, UserProfileUpdate, UserPublic, UserRead
+from src.core.pagination import DEFAULT_PAGE_SIZE, ScoreCursor
+from src.domain.models.users import (
+    UserCreate,
+    UserPage,
+    UserProfileUpdate,
+    UserPublic,
+    UserRead,
+)
 
 
 class UserRepository(ABC):
@@ -33,7 +40,23 @@ class UserRepository(ABC):
         pass
 
     @abstractmethod
-    async def search(self, query: str) -> list[UserPublic]:
+    async def get_post_ids(self, user_id: str) -> list[str]:
+        pass
+
+    @abstractmethod
+    async def search(
+        self,
+        query: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: ScoreCursor | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> UserPage:
+        pass
+
+    @abstractmethod
+    async def get_many(
+        self, user_ids: list[str], fields: frozenset[str] | None = None
+    ) -> dict[str, UserPublic]:
         pass
 
     @abstractmethod
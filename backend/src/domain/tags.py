@@ -0,0 +1,22 @@
+import re
+
+MAX_TAGS_PER_POST = 10
+MAX_TAG_LENGTH = 50
+
+_TAG_PATTERN = re.compile(r"^[\w-]+$")
+
+
+def normalize_tags(tags: list[str]) -> list[str]:
+    normalized: list[str] = []
+    for tag in tags:
+        name = tag.strip().lstrip("#").lower()
+        if not name:
+            continue
+        if len(name) > MAX_TAG_LENGTH or not _TAG_PATTERN.match(name):
+            raise ValueError(f"Invalid tag: {tag}")
+        if name not in normalized:
+            normalized.append(name)
+
+    if len(normalized) > MAX_TAGS_PER_POST:
+        raise ValueError(f"Too many tags, at most {MAX_TAGS_PER_POST} allowed")
+    return normalized
@@ -1,7 +1,13 @@
 from collections.abc import AsyncGenerator
 from uuid import UUID
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlmodel import SQLModel, select
 
 from src.core.settings import settings
@@ -13,10 +19,25 @@ from src.infrastructure.database.models import (  # noqa: F401
     PostTag,
     Subscription,
     Tag,
+    TimelineEntry,
     User as UserORM,
 )
 
+
+def enable_foreign_keys(engine: AsyncEngine) -> None:
+    # SQLite ignores foreign keys, and with them ON DELETE CASCADE, unless asked per connection.
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enable_foreign_keys(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
 engine = create_async_engine(settings.database_url, echo=False, future=True)
+enable_foreign_keys(engine)
 AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
 
@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
+from sqlalchemy import DDL, Index, event
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -17,6 +18,9 @@ class User(SQLModel, table=True):  # type: ignore[call-arg]
     password_hash: str
     avatar_url: str | None = Field(default=None)
     bio: str | None = Field(default=None)
+    followers_count: int = Field(default=0)
+    # Followers read this author's posts directly instead of getting them pushed.
+    pull_timeline: bool = Field(default=False)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
@@ -33,29 +37,79 @@ class User(SQLModel, table=True):  # type: ignore[call-arg]
     )
 
 
+# Trigram indexes back the infix user search and the pattern index its short prefixes;
+# like the posts search vector they are PostgreSQL-only and SQLite test databases create
+# the table without them.
+event.listen(
+    User.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+for _search_ddl in (
+    "CREATE INDEX ix_users_login_trgm ON users USING GIN (login gin_trgm_ops)",
+    "CREATE INDEX ix_users_email_trgm ON users USING GIN (email gin_trgm_ops)",
+    "CREATE INDEX ix_users_login_prefix ON users (lower(login) text_pattern_ops)",
+):
+    event.listen(User.__table__, "after_create", DDL(_search_ddl).execute_if(dialect="postgresql"))
+
+
 class Post(SQLModel, table=True):  # type: ignore[call-arg]
     __tablename__ = "posts"
+    __table_args__ = (
+        Index("ix_posts_created_at_id", "created_at", "id"),
+        Index("ix_posts_author_id_created_at_id", "author_id", "created_at", "id"),
+        Index("ix_posts_hot_score_id", "hot_score", "id"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    author_id: UUID = Field(foreign_key="users.id", index=True)
+    author_id: UUID = Field(foreign_key="users.id", index=True, ondelete="CASCADE")
     title: str
     content: str
     image_url: str | None = Field(default=None)
+    rating_sum: int = Field(default=0)
+    comments_count: int = Field(default=0)
+    favorites_count: int = Field(default=0)
+    hot_score: float = Field(default=0.0)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
     author: User = Relationship(back_populates="posts")
-    tags: list["PostTag"] = Relationship(back_populates="post")
-    comments: list["Comment"] = Relationship(back_populates="post")
-    favorites: list["Favorite"] = Relationship(back_populates="post")
-    ratings: list["PostRating"] = Relationship(back_populates="post")
+    # Child rows go with the post through ON DELETE CASCADE instead of being loaded first.
+    tags: list["PostTag"] = Relationship(
+        back_populates="post",
+        sa_relationship_kwargs={"cascade": "all, delete-orphan", "passive_deletes": True},
+    )
+    comments: list["Comment"] = Relationship(
+        back_populates="post",
+        sa_relationship_kwargs={"cascade": "all, delete-orphan", "passive_deletes": True},
+    )
+    favorites: list["Favorite"] = Relationship(
+        back_populates="post",
+        sa_relationship_kwargs={"cascade": "all, delete-orphan", "passive_deletes": True},
+    )
+    ratings: list["PostRating"] = Relationship(
+        back_populates="post",
+        sa_relationship_kwargs={"cascade": "all, delete-orphan", "passive_deletes": True},
+    )
+
+
+POST_SEARCH_CONFIG = "russian"
+
+# The tsvector column is PostgreSQL-only, so it is kept out of the mapped columns.
+for _search_ddl in (
+    "ALTER TABLE posts ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+    f"setweight(to_tsvector('{POST_SEARCH_CONFIG}', title), 'A') || "
+    f"setweight(to_tsvector('{POST_SEARCH_CONFIG}', content), 'B')) STORED",
+    "CREATE INDEX ix_posts_search_vector ON posts USING GIN (search_vector)",
+):
+    event.listen(Post.__table__, "after_create", DDL(_search_ddl).execute_if(dialect="postgresql"))
 
 
 class PostRating(SQLModel, table=True):  # type: ignore[call-arg]
     __tablename__ = "post_ratings"
 
-    user_id: UUID = Field(foreign_key="users.id", primary_key=True)
-    post_id: UUID = Field(foreign_key="posts.id", primary_key=True)
+    user_id: UUID = Field(foreign_key="users.id", primary_key=True, ondelete="CASCADE")
+    post_id: UUID = Field(foreign_key="posts.id", primary_key=True, ondelete="CASCADE")
     value: int = Field(ge=-1, le=1)
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
@@ -66,17 +120,22 @@ class PostRating(SQLModel, table=True):  # type: ignore[call-arg]
 class Tag(SQLModel, table=True):  # type: ignore[call-arg]
     __tablename__ = "tags"
 
-    id: int = Field(primary_key=True)
+    id: int | None = Field(default=None, primary_key=True)
     name: str = Field(unique=True, index=True)
+    post_count: int = Field(default=0)
 
     posts: list["PostTag"] = Relationship(back_populates="tag")
 
 
 class PostTag(SQLModel, table=True):  # type: ignore[call-arg]
     __tablename__ = "post_tags"
+    __table_args__ = (
+        Index("ix_post_tags_tag_id_created_at_post_id", "tag_id", "created_at", "post_id"),
+    )
 
-    post_id: UUID = Field(foreign_key="posts.id", primary_key=True)
-    tag_id: int = Field(foreign_key="tags.id", primary_key=True)
+    post_id: UUID = Field(foreign_key="posts.id", primary_key=True, ondelete="CASCADE")
+    tag_id: int = Field(foreign_key="tags.id", primary_key=True, ondelete="CASCADE")
+    created_at: datetime = Field(default_factory=datetime.utcnow)
 
     post: Post = Relationship(back_populates="tags")
     tag: Tag = Relationship(back_populates="posts")
@@ -84,9 +143,12 @@ class PostTag(SQLModel, table=True):  # type: ignore[call-arg]
 
 class Favorite(SQLModel, table=True):  # type: ignore[call-arg]
     __tablename__ = "favorites"
+    __table_args__ = (
+        Index("ix_favorites_user_id_created_at_post_id", "user_id", "created_at", "post_id"),
+    )
 
-    user_id: UUID = Field(foreign_key="users.id", primary_key=True)
-    post_id: UUID = Field(foreign_key="posts.id", primary_key=True)
+    user_id: UUID = Field(foreign_key="users.id", primary_key=True, ondelete="CASCADE")
+    post_id: UUID = Field(foreign_key="posts.id", primary_key=True, ondelete="CASCADE")
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
     user: User = Relationship(back_populates="favorites")
@@ -95,10 +157,11 @@ class Favorite(SQLModel, table=True):  # type: ignore[call-arg]
 
 class Comment(SQLModel, table=True):  # type: ignore[call-arg]
     __tablename__ = "comments"
+    __table_args__ = (Index("ix_comments_post_id_created_at_id", "post_id", "created_at", "id"),)
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    post_id: UUID = Field(foreign_key="posts.id", index=True)
-    author_id: UUID = Field(foreign_key="users.id", index=True)
+    post_id: UUID = Field(foreign_key="posts.id", ondelete="CASCADE")
+    author_id: UUID = Field(foreign_key="users.id", index=True, ondelete="CASCADE")
     content: str
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
@@ -109,8 +172,10 @@ class Comment(SQLModel, table=True):  # type: ignore[call-arg]
 class Subscription(SQLModel, table=True):  # type: ignore[call-arg]
     __tablename__ = "subscriptions"
 
-    follower_id: UUID = Field(foreign_key="users.id", primary_key=True)
-    following_id: UUID = Field(foreign_key="users.id", primary_key=True)
+    follower_id: UUID = Field(foreign_key="users.id", primary_key=True, ondelete="CASCADE")
+    following_id: UUID = Field(
+        foreign_key="users.id", primary_key=True, index=True, ondelete="CASCADE"
+    )
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
     follower: User = Relationship(
@@ -121,3 +186,16 @@ class Subscription(SQLModel, table=True):  # type: ignore[call-arg]
         back_populates="subscriptions_followers",
         sa_relationship_kwargs={"foreign_keys": "Subscription.following_id"},
     )
+
+
+class TimelineEntry(SQLModel, table=True):  # type: ignore[call-arg]
+    __tablename__ = "timeline_entries"
+    __table_args__ = (
+        Index("ix_timeline_entries_user_id_created_at_post_id", "user_id", "created_at", "post_id"),
+        Index("ix_timeline_entries_user_id_author_id", "user_id", "author_id"),
+    )
+
+    user_id: UUID = Field(foreign_key="users.id", primary_key=True, ondelete="CASCADE")
+    post_id: UUID = Field(foreign_key="posts.id", primary_key=True, index=True, ondelete="CASCADE")
+    author_id: UUID = Field(foreign_key="users.id", ondelete="CASCADE")
+    created_at: datetime
@@ -0,0 +1,19 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from src.application.login_index import LoginIndex
+from src.core.logs import logger
+from src.infrastructure.database.database import AsyncSessionLocal
+from src.infrastructure.database.models import User
+
+
+async def build_login_index(session: AsyncSession, index: LoginIndex) -> int:
+    result = await session.stream(select(User.id, User.login, User.avatar_url))
+    index.rebuild([(str(user_id), login, avatar) async for user_id, login, avatar in result])
+    return len(index)
+
+
+async def load_login_index(index: LoginIndex) -> None:
+    async with AsyncSessionLocal() as session:
+        indexed = await build_login_index(session, index)
+    logger.info("Login index built with %s users", indexed)
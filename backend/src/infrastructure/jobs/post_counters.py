@@ -0,0 +1,53 @@
+import asyncio
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.logs import logger
+from src.infrastructure.database.database import AsyncSessionLocal, engine
+from src.infrastructure.database.models import Comment, Favorite, Post, PostRating, PostTag, Tag
+from src.infrastructure.repositories.post_counters import hot_score_expression
+
+
+async def rebuild_post_counters(session: AsyncSession) -> int:
+    rating_sum = (
+        select(func.coalesce(func.sum(PostRating.value), 0))
+        .where(PostRating.post_id == Post.id)
+        .scalar_subquery()
+    )
+    comments_count = (
+        select(func.count()).select_from(Comment).where(Comment.post_id == Post.id)
+    ).scalar_subquery()
+    favorites_count = (
+        select(func.count()).select_from(Favorite).where(Favorite.post_id == Post.id)
+    ).scalar_subquery()
+
+    statement = update(Post).values(
+        rating_sum=rating_sum,
+        comments_count=comments_count,
+        favorites_count=favorites_count,
+    )
+    result = await session.execute(statement)
+
+    score = hot_score_expression(Post.rating_sum, Post.created_at, session.get_bind().dialect.name)
+    await session.execute(
+        update(Post).where(Post.hot_score.is_distinct_from(score)).values(hot_score=score)
+    )
+
+    post_count = (
+        select(func.count()).select_from(PostTag).where(PostTag.tag_id == Tag.id)
+    ).scalar_subquery()
+    await session.execute(update(Tag).values(post_count=post_count))
+    await session.commit()
+    return result.rowcount
+
+
+async def main() -> None:
+    async with AsyncSessionLocal() as session:
+        updated = await rebuild_post_counters(session)
+    await engine.dispose()
+    logger.info("Post counters rebuilt for %s posts", updated)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
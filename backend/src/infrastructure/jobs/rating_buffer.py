@@ -0,0 +1,75 @@
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.post_cache import PostReadCache, post_read_cache
+from src.application.rating_buffer import RatingBuffer, rating_buffer
+from src.core.logs import logger
+from src.infrastructure.database.database import AsyncSessionLocal, engine
+from src.infrastructure.repositories.rating_repository_impl import RatingRepositoryImpl
+
+
+async def flush_rating_buffer(
+    session: AsyncSession, buffer: RatingBuffer, cache: PostReadCache | None = None
+) -> int:
+    votes = await buffer.drain()
+    if not votes:
+        return 0
+
+    try:
+        post_ids = await RatingRepositoryImpl(session).apply_ratings(votes)
+    except BaseException:
+        # Cancellation mid-flush lands here too; the batch goes back to the
+        # buffer and its journal so shutdown or the next tick retries it.
+        await session.rollback()
+        await buffer.restore(votes)
+        raise
+    buffer.commit(votes)
+
+    if cache is not None:
+        for post_id in post_ids:
+            cache.bump(post_id)
+    return len(votes)
+
+
+async def flush_rating_buffer_now(buffer: RatingBuffer, cache: PostReadCache | None = None) -> int:
+    async with AsyncSessionLocal() as session:
+        return await flush_rating_buffer(session, buffer, cache)
+
+
+async def load_rating_buffer(buffer: RatingBuffer, cache: PostReadCache | None = None) -> None:
+    replayed = buffer.load()
+    if replayed:
+        await flush_rating_buffer_now(buffer, cache)
+        logger.info("Rating buffer replayed %s votes from %s", replayed, buffer.path)
+
+
+async def run_rating_buffer_flusher(
+    buffer: RatingBuffer, interval: float, cache: PostReadCache | None = None
+) -> None:
+    while True:
+        await buffer.wait(interval)
+        try:
+            await flush_rating_buffer_now(buffer, cache)
+        except Exception:
+            logger.exception("Rating buffer flush failed")
+
+
+async def shutdown_rating_buffer(buffer: RatingBuffer, cache: PostReadCache | None = None) -> None:
+    try:
+        await flush_rating_buffer_now(buffer, cache)
+    except Exception:
+        logger.exception(
+            "Rating buffer flush failed, %s votes stay in %s", len(buffer), buffer.path
+        )
+    buffer.close()
+
+
+async def main() -> None:
+    await load_rating_buffer(rating_buffer, post_read_cache)
+    rating_buffer.close()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,67 @@
+import asyncio
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from src.application.post_search_index import PostSearchIndex, post_search_index
+from src.core.logs import logger
+from src.infrastructure.database.database import AsyncSessionLocal, engine
+from src.infrastructure.database.models import Post
+
+
+async def sync_search_index(
+    session: AsyncSession, index: PostSearchIndex, batch_size: int = 1000
+) -> int:
+    result = await session.execute(select(Post.id, Post.updated_at))
+    versions = {str(post_id): updated_at for post_id, updated_at in result.all()}
+
+    for post_id in index.post_ids() - versions.keys():
+        index.remove(post_id)
+
+    stale = [
+        UUID(post_id)
+        for post_id, updated_at in versions.items()
+        if not index.is_current(post_id, updated_at)
+    ]
+    for start in range(0, len(stale), batch_size):
+        result = await session.execute(
+            select(Post.id, Post.title, Post.content, Post.updated_at).where(
+                Post.id.in_(stale[start : start + batch_size])
+            )
+        )
+        for post_id, title, content, updated_at in result.all():
+            index.add(str(post_id), title, content, updated_at)
+
+    return len(stale)
+
+
+async def load_search_index(index: PostSearchIndex) -> None:
+    loaded = index.load()
+    async with AsyncSessionLocal() as session:
+        reindexed = await sync_search_index(session, index)
+    await index.save()
+    logger.info(
+        "Search index %s with %s posts, %s reindexed",
+        "loaded" if loaded else "built",
+        len(index),
+        reindexed,
+    )
+
+
+async def run_search_index_saver(index: PostSearchIndex, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await index.save()
+        except OSError:
+            logger.exception("Search index save failed")
+
+
+async def main() -> None:
+    await load_search_index(post_search_index)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
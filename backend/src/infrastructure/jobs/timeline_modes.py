@@ -0,0 +1,121 @@
+import asyncio
+from uuid import UUID
+
+from sqlalchemy import exists, insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from src.core.logs import logger
+from src.core.settings import settings
+from src.infrastructure.database.database import AsyncSessionLocal, engine
+from src.infrastructure.database.models import Post, Subscription, TimelineEntry, User
+
+
+async def backfill_followers(
+    session: AsyncSession, author_id: UUID, after: UUID | None = None, limit: int | None = None
+) -> UUID | None:
+    # Pushes the author's recent posts to followers past ``after`` that are missing
+    # them, and returns the last follower covered when ``limit`` cut the pass short.
+    followers = select(Subscription.follower_id).where(Subscription.following_id == author_id)
+    if after is not None:
+        followers = followers.where(Subscription.follower_id > after)
+    followers = followers.order_by(Subscription.follower_id)
+    if limit is not None:
+        followers = followers.limit(limit)
+    follower_ids = list((await session.execute(followers)).scalars())
+    if not follower_ids:
+        return None
+
+    recent_posts = (
+        select(Post.id, Post.author_id, Post.created_at)
+        .where(Post.author_id == author_id)
+        .order_by(Post.created_at.desc(), Post.id.desc())
+        .limit(settings.timeline_backfill_size)
+        .subquery()
+    )
+    entries = (
+        select(
+            Subscription.follower_id,
+            recent_posts.c.id,
+            recent_posts.c.author_id,
+            recent_posts.c.created_at,
+        )
+        .join(recent_posts, recent_posts.c.author_id == Subscription.following_id)
+        .where(
+            Subscription.following_id == author_id,
+            Subscription.follower_id.in_(follower_ids),
+            ~exists().where(
+                TimelineEntry.user_id == Subscription.follower_id,
+                TimelineEntry.post_id == recent_posts.c.id,
+            ),
+        )
+    )
+    await session.execute(
+        insert(TimelineEntry).from_select(
+            ["user_id", "post_id", "author_id", "created_at"], entries
+        )
+    )
+    return follower_ids[-1] if limit is not None and len(follower_ids) == limit else None
+
+
+async def resume_fanout(session: AsyncSession, author_id: UUID) -> None:
+    # Posts written while the author was pulled have no timeline rows, so followers are
+    # backfilled in committed batches while the author is still pulled. The last pass
+    # fills what was posted or followed in the meantime and switches the author back
+    # to push in the same transaction.
+    after = None
+    while True:
+        after = await backfill_followers(
+            session, author_id, after, settings.timeline_backfill_batch_size
+        )
+        await session.commit()
+        if after is None:
+            break
+
+    await session.execute(update(User).where(User.id == author_id).values(pull_timeline=False))
+    await backfill_followers(session, author_id)
+    await session.commit()
+
+
+async def sync_timeline_modes(session: AsyncSession) -> int:
+    # Authors switch back to push only once they are well below the fan-out limit, so
+    # a count that hovers around it does not backfill over and over.
+    await session.execute(
+        update(User)
+        .where(User.pull_timeline.is_(False), User.followers_count > settings.timeline_fanout_limit)
+        .values(pull_timeline=True)
+    )
+    await session.commit()
+
+    result = await session.execute(
+        select(User.id).where(
+            User.pull_timeline, User.followers_count <= settings.timeline_fanout_resume_limit
+        )
+    )
+    author_ids = list(result.scalars())
+    for author_id in author_ids:
+        await resume_fanout(session, author_id)
+    return len(author_ids)
+
+
+async def run_timeline_mode_sync(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with AsyncSessionLocal() as session:
+                resumed = await sync_timeline_modes(session)
+            if resumed:
+                logger.info("Timeline fan-out resumed for %s authors", resumed)
+        except Exception:
+            logger.exception("Timeline mode sync failed")
+
+
+async def main() -> None:
+    async with AsyncSessionLocal() as session:
+        resumed = await sync_timeline_modes(session)
+    await engine.dispose()
+    logger.info("Timeline fan-out resumed for %s authors", resumed)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
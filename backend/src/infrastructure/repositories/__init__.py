@@ -2,6 +2,10 @@ from src.infrastructure.repositories.comment_repository_impl import CommentRepos
 from src.infrastructure.repositories.favorite_repository_impl import FavoriteRepositoryImpl
 from src.infrastructure.repositories.post_repository_impl import PostRepositoryImpl
 from src.infrastructure.repositories.rating_repository_impl import RatingRepositoryImpl
+from src.infrastructure.repositories.subscription_repository_impl import (
+    SubscriptionRepositoryImpl,
+)
+from src.infrastructure.repositories.tag_repository_impl import TagRepositoryImpl
 from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
 
 __all__ = [
@@ -10,4 +14,6 @@ __all__ = [
     "CommentRepositoryImpl",
     "FavoriteRepositoryImpl",
     "RatingRepositoryImpl",
+    "SubscriptionRepositoryImpl",
+    "TagRepositoryImpl",
 ]
@@ -1,34 +1,107 @@
 from uuid import UUID, uuid4
 
+from sqlalchemy import tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
-from src.domain.models.posts import CommentRead, CommentCreate
+from src.core.pagination import DEFAULT_PAGE_SIZE, PageCursor, encode_cursor
+from src.domain.models.posts import CommentCreate, CommentPage, CommentRead
 from src.domain.repositories.comment_repository import CommentRepository
-from src.infrastructure.database.models import Comment as CommentORM, User
+from src.infrastructure.database.models import Comment as CommentORM, Post, User
+from src.infrastructure.repositories.post_counters import adjust_post_counters
+from src.infrastructure.repositories.projection import project, row_values, wants
+
+_COMMENT_COLUMNS = {
+    "id": CommentORM.id,
+    "postId": CommentORM.post_id,
+    "authorId": CommentORM.author_id,
+    "authorLogin": User.login,
+    "authorAvatar": User.avatar_url,
+    "content": CommentORM.content,
+    "createdAt": CommentORM.created_at,
+}
+_CURSOR_COLUMNS = (
+    CommentORM.created_at.label("cursor_created_at"),
+    CommentORM.id.label("cursor_id"),
+)
 
 
 class CommentRepositoryImpl(CommentRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def get_by_post(self, post_id: str) -> list[CommentRead]:
+    async def get_by_post(
+        self,
+        post_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: PageCursor | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> CommentPage:
+        try:
+            post_uuid = UUID(post_id)
+        except ValueError:
+            return CommentPage(items=[])
+
+        if fields is None:
+            statement = select(CommentORM, User, *_CURSOR_COLUMNS).join(
+                User, CommentORM.author_id == User.id
+            )
+        else:
+            statement = select(*project(_COMMENT_COLUMNS, fields), *_CURSOR_COLUMNS).select_from(
+                CommentORM
+            )
+            if wants(fields, "authorLogin", "authorAvatar"):
+                statement = statement.join(User, CommentORM.author_id == User.id)
+
+        statement = statement.where(CommentORM.post_id == post_uuid)
+        if cursor is not None:
+            statement = statement.where(
+                tuple_(CommentORM.created_at, CommentORM.id) < tuple_(cursor.created_at, cursor.id)
+            )
+        statement = statement.order_by(CommentORM.created_at.desc(), CommentORM.id.desc()).limit(
+            limit + 1
+        )
+
+        result = await self.session.execute(statement)
+        rows = result.all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].cursor_created_at, rows[-1].cursor_id)
+
+        if fields is None:
+            items = [self._to_read(comment, user) for comment, user, *_ in rows]
+        else:
+            items = [CommentRead.model_construct(**row_values(row, fields)) for row in rows]
+        return CommentPage(items=items, next_cursor=next_cursor)
+
+    async def get_comments_validators(
+        self, post_id: str, limit: int = DEFAULT_PAGE_SIZE, cursor: PageCursor | None = None
+    ) -> list[tuple]:
         try:
             post_uuid = UUID(post_id)
         except ValueError:
             return []
 
+        # The rows of the requested page, with their authors' updated_at for the login and
+        # avatar shown next to them; comments_count covers deletions on other pages.
+        comments_count = select(Post.comments_count).where(Post.id == post_uuid).scalar_subquery()
         statement = (
-            select(CommentORM, User)
+            select(CommentORM.id, User.updated_at, comments_count)
             .join(User, CommentORM.author_id == User.id)
             .where(CommentORM.post_id == post_uuid)
-            .order_by(CommentORM.created_at.desc())
+        )
+        if cursor is not None:
+            statement = statement.where(
+                tuple_(CommentORM.created_at, CommentORM.id) < tuple_(cursor.created_at, cursor.id)
+            )
+        statement = statement.order_by(CommentORM.created_at.desc(), CommentORM.id.desc()).limit(
+            limit + 1
         )
 
         result = await self.session.execute(statement)
-        rows = result.all()
-
-        return [self._to_read(comment, user) for comment, user in rows]
+        return [tuple(row) for row in result.all()]
 
     async def create(self, post_id: str, author_id: str, comment: CommentCreate) -> CommentRead:
         post_uuid = UUID(post_id)
@@ -41,6 +114,7 @@ class CommentRepositoryImpl(CommentRepository):
             content=comment.content,
         )
         self.session.add(comment_orm)
+        await self.session.execute(adjust_post_counters(post_uuid, comments_count=1))
         await self.session.commit()
         await self.session.refresh(comment_orm)
 
@@ -58,6 +132,7 @@ class CommentRepositoryImpl(CommentRepository):
             return False
 
         await self.session.delete(comment)
+        await self.session.execute(adjust_post_counters(comment.post_id, comments_count=-1))
         await self.session.commit()
         return True
 
@@ -76,7 +151,7 @@ class CommentRepositoryImpl(CommentRepository):
 
     @staticmethod
     def _to_read(comment: CommentORM, user: User | None) -> CommentRead:
-        return CommentRead(
+        return CommentRead.model_construct(
             id=str(comment.id),
             postId=str(comment.post_id),
             authorId=str(comment.author_id),
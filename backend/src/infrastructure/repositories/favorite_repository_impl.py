@@ -1,60 +1,64 @@
+from datetime import datetime
 from uuid import UUID
 
+from sqlalchemy import delete, literal, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select, func
+from sqlmodel import select
 
-from src.domain.models.posts import PostRead
+from src.application.favorite_cache import FavoriteMembershipCache
+from src.core.pagination import DEFAULT_PAGE_SIZE, PageCursor, encode_cursor
+from src.domain.models.posts import PostPage
 from src.domain.repositories.favorite_repository import FavoriteRepository
-from src.infrastructure.database.models import Favorite, Post, User, PostRating, Comment
+from src.infrastructure.database.models import Favorite, Post
+from src.infrastructure.repositories.post_counters import adjust_post_counters
+from src.infrastructure.repositories.post_repository_impl import PostRepositoryImpl
 
 
 class FavoriteRepositoryImpl(FavoriteRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, favorites: FavoriteMembershipCache | None = None):
         self.session = session
-
-    async def get_user_favorites(self, user_id: str) -> list[PostRead]:
+        self.favorites = favorites
+        self.posts = PostRepositoryImpl(session, favorites)
+
+    async def get_user_favorites(
+        self,
+        user_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: PageCursor | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> PostPage:
         try:
             user_uuid = UUID(user_id)
         except ValueError:
-            return []
-
-        statement = (
-            select(
-                Post,
-                User,
-                func.coalesce(func.sum(PostRating.value), 0).label("rating"),
-                func.count(Comment.id.distinct()).label("comments_count"),
+            return PostPage(items=[])
+
+        statement = select(Favorite.post_id, Favorite.created_at).where(
+            Favorite.user_id == user_uuid
+        )
+        if cursor is not None:
+            statement = statement.where(
+                tuple_(Favorite.created_at, Favorite.post_id) < tuple_(cursor.created_at, cursor.id)
             )
-            .join(Favorite, Favorite.post_id == Post.id)
-            .join(User, Post.author_id == User.id)
-            .outerjoin(PostRating, PostRating.post_id == Post.id)
-            .outerjoin(Comment, Comment.post_id == Post.id)
-            .where(Favorite.user_id == user_uuid)
-            .group_by(Post.id, User.id)
-            .order_by(Post.created_at.desc())
+        statement = statement.order_by(Favorite.created_at.desc(), Favorite.post_id.desc()).limit(
+            limit + 1
         )
 
         result = await self.session.execute(statement)
-        rows = result.all()
-
-        return [
-            PostRead(
-                id=str(post.id),
-                authorId=str(post.author_id),
-                authorLogin=user.login,
-                authorAvatar=user.avatar_url,
-                title=post.title,
-                content=post.content,
-                image_url=post.image_url,
-                rating=rating or 0,
-                user_rating=None,
-                comments_count=comments_count or 0,
-                is_favorited=True,
-                createdAt=post.created_at,
-                updatedAt=post.updated_at,
-            )
-            for post, user, rating, comments_count in rows
-        ]
+        entries = result.all()
+
+        next_cursor = None
+        if len(entries) > limit:
+            entries = entries[:limit]
+            next_cursor = encode_cursor(entries[-1].created_at, entries[-1].post_id)
+
+        post_ids = [str(entry.post_id) for entry in entries]
+        posts = await self.posts.get_many(post_ids, user_id, fields)
+        return PostPage(
+            items=[posts[post_id] for post_id in post_ids if post_id in posts],
+            next_cursor=next_cursor,
+        )
 
     async def add(self, user_id: str, post_id: str) -> bool:
         try:
@@ -63,15 +67,22 @@ class FavoriteRepositoryImpl(FavoriteRepository):
         except ValueError:
             return False
 
-        existing = await self.session.execute(
-            select(Favorite).where(Favorite.user_id == user_uuid, Favorite.post_id == post_uuid)
+        insert = pg_insert if self._is_postgresql() else sqlite_insert
+        new_row = select(
+            literal(user_uuid, Favorite.__table__.c.user_id.type),
+            Post.id,
+            literal(datetime.utcnow(), Favorite.__table__.c.created_at.type),
+        ).where(Post.id == post_uuid)
+        added = (
+            insert(Favorite)
+            .from_select(["user_id", "post_id", "created_at"], new_row)
+            .on_conflict_do_nothing()
+            .returning(Favorite.post_id)
         )
-        if existing.scalar_one_or_none():
+        if not await self._count_change(added, post_uuid, 1):
             return False
-
-        favorite = Favorite(user_id=user_uuid, post_id=post_uuid)
-        self.session.add(favorite)
-        await self.session.commit()
+        if self.favorites is not None:
+            self.favorites.add(user_uuid, post_uuid)
         return True
 
     async def remove(self, user_id: str, post_id: str) -> bool:
@@ -81,16 +92,15 @@ class FavoriteRepositoryImpl(FavoriteRepository):
         except ValueError:
             return False
 
-        result = await self.session.execute(
-            select(Favorite).where(Favorite.user_id == user_uuid, Favorite.post_id == post_uuid)
+        removed = (
+            delete(Favorite)
+            .where(Favorite.user_id == user_uuid, Favorite.post_id == post_uuid)
+            .returning(Favorite.post_id)
         )
-        favorite = result.scalar_one_or_none()
-
-        if not favorite:
+        if not await self._count_change(removed, post_uuid, -1):
             return False
-
-        await self.session.delete(favorite)
-        await self.session.commit()
+        if self.favorites is not None:
+            self.favorites.discard(user_uuid, post_uuid)
         return True
 
     async def is_favorited(self, user_id: str, post_id: str) -> bool:
@@ -104,3 +114,27 @@ class FavoriteRepositoryImpl(FavoriteRepository):
             select(Favorite).where(Favorite.user_id == user_uuid, Favorite.post_id == post_uuid)
         )
         return result.scalar_one_or_none() is not None
+
+    async def _count_change(self, write, post_id: UUID, delta: int) -> bool:
+        # On PostgreSQL the write runs as a CTE feeding the counter update, so a repeated
+        # add or remove is a no-op in a single round trip.
+        if self._is_postgresql():
+            written = write.cte("written")
+            result = await self.session.execute(
+                adjust_post_counters(post_id, favorites_count=delta)
+                .where(Post.id.in_(select(written.c.post_id)))
+                .returning(Post.id)
+                .execution_options(synchronize_session=False)
+            )
+            changed = result.first() is not None
+        else:
+            result = await self.session.execute(write)
+            changed = result.first() is not None
+            if changed:
+                await self.session.execute(adjust_post_counters(post_id, favorites_count=delta))
+
+        await self.session.commit()
+        return changed
+
+    def _is_postgresql(self) -> bool:
+        return self.session.get_bind().dialect.name == "postgresql"
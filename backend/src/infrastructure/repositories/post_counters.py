@@ -0,0 +1,73 @@
+from datetime import UTC, datetime
+from uuid import UUID
+
+from sqlalchemy import Float, Numeric, Update, case, cast, func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.ranking import HOT_DECAY_SECONDS, HOT_EPOCH, hot_score
+from src.infrastructure.database.models import Post
+
+HOT_EPOCH_SECONDS = HOT_EPOCH.replace(tzinfo=UTC).timestamp()
+
+
+def hot_score_expression(rating_sum, created_at, dialect: str):
+    # SQL twin of src.domain.ranking.hot_score; log() is base 10 on both backends.
+    magnitude = case((func.abs(rating_sum) > 1, func.abs(rating_sum)), else_=1)
+    sign = case((rating_sum > 0, 1), (rating_sum < 0, -1), else_=0)
+    if dialect == "postgresql":
+        epoch = func.extract("epoch", created_at)
+    else:
+        epoch = (func.julianday(created_at) - 2440587.5) * 86400
+    score = (
+        sign * func.log(cast(magnitude, Float)) + (epoch - HOT_EPOCH_SECONDS) / HOT_DECAY_SECONDS
+    )
+    return cast(func.round(cast(score, Numeric), 7), Float)
+
+
+def adjust_post_counters(post_id: UUID, **deltas: int) -> Update:
+    return (
+        update(Post)
+        .where(Post.id == post_id)
+        .values({name: getattr(Post, name) + delta for name, delta in deltas.items()})
+    )
+
+
+async def adjust_post_rating(session: AsyncSession, post_id: UUID, delta: int) -> int | None:
+    result = await session.execute(
+        adjust_post_counters(post_id, rating_sum=delta).returning(Post.rating_sum, Post.created_at)
+    )
+    row = result.first()
+    if row is None:
+        return None
+    await refresh_hot_score(session, post_id, *row)
+    return row.rating_sum
+
+
+async def adjust_post_ratings(session: AsyncSession, deltas: dict[UUID, int]) -> None:
+    deltas = {post_id: delta for post_id, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    result = await session.execute(
+        update(Post)
+        .where(Post.id.in_(deltas))
+        .values(rating_sum=Post.rating_sum + case(deltas, value=Post.id, else_=0))
+        .returning(Post.id, Post.rating_sum, Post.created_at)
+    )
+    rows = result.all()
+    if rows:
+        await session.execute(
+            update(Post),
+            [
+                {"id": post_id, "hot_score": hot_score(rating_sum, created_at)}
+                for post_id, rating_sum, created_at in rows
+            ],
+        )
+
+
+async def refresh_hot_score(
+    session: AsyncSession, post_id: UUID, rating_sum: int, created_at: datetime
+) -> None:
+    await session.execute(
+        update(Post).where(Post.id == post_id).values(hot_score=hot_score(rating_sum, created_at))
+    )
@@ -0,0 +1,9 @@
+from sqlalchemy import func
+
+from src.domain.excerpt import EXCERPT_LENGTH
+from src.infrastructure.database.models import Post
+
+
+def post_excerpt():
+    # One extra character tells make_excerpt whether the body was cut.
+    return func.substr(Post.content, 1, EXCERPT_LENGTH + 1).label("content")
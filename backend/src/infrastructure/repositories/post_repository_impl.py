@@ -1,17 +1,55 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
+from sqlalchemy import delete, func, insert, literal, tuple_, union_all, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select, func, or_
-
-from src.domain.models.posts import PostCreate, PostRead, PostUpdate
+from sqlmodel import and_, exists, select
+
+from src.application.favorite_cache import FavoriteMembershipCache
+from src.core.pagination import (
+    DEFAULT_PAGE_SIZE,
+    PageCursor,
+    ScoreCursor,
+    encode_cursor,
+    encode_score_cursor,
+)
+from src.domain.excerpt import make_excerpt
+from src.domain.models.posts import PostCreate, PostPage, PostRead, PostSort, PostUpdate
+from src.domain.ranking import hot_score
 from src.domain.repositories.post_repository import PostRepository
-from src.infrastructure.database.models import Post as PostORM, User, PostRating, Favorite, Comment
+from src.infrastructure.database.models import (
+    Favorite,
+    Post as PostORM,
+    PostRating,
+    PostTag,
+    Subscription,
+    Tag,
+    TimelineEntry,
+    User,
+)
+from src.infrastructure.repositories.post_excerpt import post_excerpt
+from src.infrastructure.repositories.post_search import post_search
+from src.infrastructure.repositories.projection import project, row_values, wants
+
+_POST_COLUMNS = {
+    "authorId": PostORM.author_id,
+    "authorLogin": User.login,
+    "authorAvatar": User.avatar_url,
+    "title": PostORM.title,
+    "image_url": PostORM.image_url,
+    "rating": PostORM.rating_sum,
+    "comments_count": PostORM.comments_count,
+    "favorites_count": PostORM.favorites_count,
+    "createdAt": PostORM.created_at,
+    "updatedAt": PostORM.updated_at,
+}
 
 
 class PostRepositoryImpl(PostRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, favorites: FavoriteMembershipCache | None = None):
         self.session = session
+        self.favorites = favorites
 
     async def get_by_id(self, post_id: str, current_user_id: str | None = None) -> PostRead | None:
         try:
@@ -19,115 +57,200 @@ class PostRepositoryImpl(PostRepository):
         except ValueError:
             return None
 
-        post = await self.session.get(PostORM, post_uuid)
-        if not post:
-            return None
-
-        user = await self.session.get(User, post.author_id)
-        rating = await self._get_rating(post_uuid)
-        comments_count = await self._get_comments_count(post_uuid)
-
-        is_favorited = False
-        user_rating = None
-
+        user_uuid = None
         if current_user_id:
             try:
                 user_uuid = UUID(current_user_id)
-                is_favorited = await self._is_favorited(user_uuid, post_uuid)
-                user_rating = await self._get_user_rating(user_uuid, post_uuid)
             except ValueError:
                 pass
 
-        return self._to_read(post, user, rating, user_rating, comments_count, is_favorited)
-
-    async def get_all(self, current_user_id: str | None = None) -> list[PostRead]:
-        statement = (
-            select(
-                PostORM,
-                User,
-                func.coalesce(func.sum(PostRating.value), 0).label("rating"),
-                func.count(Comment.id.distinct()).label("comments_count"),
+        favorited = None
+        if user_uuid is not None and self.favorites is not None:
+            favorited = self.favorites.get(user_uuid)
+
+        statement = self._listing_statement(full_content=True).where(PostORM.id == post_uuid)
+        if user_uuid is not None:
+            if favorited is None:
+                statement = statement.add_columns(
+                    exists()
+                    .where(Favorite.user_id == user_uuid, Favorite.post_id == PostORM.id)
+                    .label("is_favorited")
+                )
+            statement = statement.add_columns(
+                select(PostRating.value)
+                .where(PostRating.user_id == user_uuid, PostRating.post_id == PostORM.id)
+                .scalar_subquery()
+                .label("user_rating"),
             )
-            .join(User, PostORM.author_id == User.id)
-            .outerjoin(PostRating, PostRating.post_id == PostORM.id)
-            .outerjoin(Comment, Comment.post_id == PostORM.id)
-            .group_by(PostORM.id, User.id)
-            .order_by(PostORM.created_at.desc())
-        )
 
         result = await self.session.execute(statement)
-        rows = result.all()
+        row = result.first()
+        if row is None:
+            return None
 
-        posts = []
-        for post, user, rating, comments_count in rows:
-            is_favorited = False
-            user_rating = None
-
-            if current_user_id:
-                try:
-                    user_uuid = UUID(current_user_id)
-                    is_favorited = await self._is_favorited(user_uuid, post.id)
-                    user_rating = await self._get_user_rating(user_uuid, post.id)
-                except ValueError:
-                    pass
-
-            posts.append(
-                self._to_read(
-                    post, user, rating or 0, user_rating, comments_count or 0, is_favorited
+        viewer_state = None
+        if user_uuid is not None:
+            is_favorited = post_uuid in favorited if favorited is not None else row.is_favorited
+            viewer_state = (bool(is_favorited), row.user_rating)
+        return self._row_to_read(row, viewer_state, full_content=True)
+
+    async def get_many(
+        self,
+        post_ids: list[str],
+        current_user_id: str | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> dict[str, PostRead]:
+        post_uuids: dict[str, UUID] = {}
+        for post_id in post_ids:
+            try:
+                post_uuids[post_id] = UUID(post_id)
+            except ValueError:
+                continue
+        if not post_uuids:
+            return {}
+
+        result = await self.session.execute(
+            self._listing_statement(fields=fields).where(PostORM.id.in_(post_uuids.values()))
+        )
+        rows_by_id = {row.id: row for row in result.all()}
+        found = [
+            (post_id, rows_by_id[post_uuid])
+            for post_id, post_uuid in post_uuids.items()
+            if post_uuid in rows_by_id
+        ]
+        posts = await self._hydrate([row for _, row in found], current_user_id, fields)
+        return {post_id: post for (post_id, _), post in zip(found, posts, strict=True)}
+
+    async def get_all(
+        self,
+        current_user_id: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: PageCursor | ScoreCursor | None = None,
+        sort: PostSort = "new",
+        fields: frozenset[str] | None = None,
+    ) -> PostPage:
+        statement = self._listing_statement(fields=fields)
+        return await self._fetch_page(statement, current_user_id, limit, cursor, sort, fields)
+
+    async def get_feed_validators(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: PageCursor | ScoreCursor | None = None,
+        sort: PostSort = "new",
+        viewer_id: str | None = None,
+    ) -> list[tuple]:
+        statement = select(
+            PostORM.id,
+            PostORM.updated_at,
+            PostORM.rating_sum,
+            PostORM.comments_count,
+            PostORM.favorites_count,
+            User.updated_at,
+        ).join(User, PostORM.author_id == User.id)
+        try:
+            viewer_uuid = UUID(viewer_id) if viewer_id else None
+        except ValueError:
+            viewer_uuid = None
+        if viewer_uuid is not None:
+            # user_rating and is_favorited are rendered per viewer, so their rows are
+            # part of the validator.
+            statement = (
+                statement.add_columns(PostRating.value, Favorite.created_at)
+                .outerjoin(
+                    PostRating,
+                    and_(PostRating.post_id == PostORM.id, PostRating.user_id == viewer_uuid),
+                )
+                .outerjoin(
+                    Favorite, and_(Favorite.post_id == PostORM.id, Favorite.user_id == viewer_uuid)
                 )
             )
 
-        return posts
+        result = await self.session.execute(self._apply_keyset(statement, limit, cursor, sort))
+        return [tuple(row) for row in result.all()]
 
     async def get_by_author(
-        self, author_id: str, current_user_id: str | None = None
-    ) -> list[PostRead]:
+        self,
+        author_id: str,
+        current_user_id: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: PageCursor | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> PostPage:
         try:
             author_uuid = UUID(author_id)
         except ValueError:
-            return []
+            return PostPage(items=[])
+
+        statement = self._listing_statement(fields=fields).where(PostORM.author_id == author_uuid)
+        return await self._fetch_page(statement, current_user_id, limit, cursor, fields=fields)
+
+    async def get_timeline(
+        self,
+        user_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: PageCursor | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> PostPage:
+        try:
+            user_uuid = UUID(user_id)
+        except ValueError:
+            return PostPage(items=[])
 
+        pulled_authors = (
+            select(Subscription.following_id)
+            .join(User, User.id == Subscription.following_id)
+            .where(Subscription.follower_id == user_uuid, User.pull_timeline)
+        )
+        pushed = self._keyset_branch(
+            select(TimelineEntry.post_id, TimelineEntry.created_at).where(
+                TimelineEntry.user_id == user_uuid,
+                TimelineEntry.author_id.not_in(pulled_authors),
+            ),
+            TimelineEntry.created_at,
+            TimelineEntry.post_id,
+            limit,
+            cursor,
+        )
+        pulled = self._keyset_branch(
+            select(PostORM.id.label("post_id"), PostORM.created_at).where(
+                PostORM.author_id.in_(pulled_authors)
+            ),
+            PostORM.created_at,
+            PostORM.id,
+            limit,
+            cursor,
+        )
+        timeline = union_all(select(pushed), select(pulled)).subquery()
         statement = (
-            select(
-                PostORM,
-                User,
-                func.coalesce(func.sum(PostRating.value), 0).label("rating"),
-                func.count(Comment.id.distinct()).label("comments_count"),
-            )
-            .join(User, PostORM.author_id == User.id)
-            .outerjoin(PostRating, PostRating.post_id == PostORM.id)
-            .outerjoin(Comment, Comment.post_id == PostORM.id)
-            .where(PostORM.author_id == author_uuid)
-            .group_by(PostORM.id, User.id)
-            .order_by(PostORM.created_at.desc())
+            select(timeline.c.post_id, timeline.c.created_at)
+            .order_by(timeline.c.created_at.desc(), timeline.c.post_id.desc())
+            .limit(limit + 1)
         )
 
-        result = await self.session.execute(statement)
-        rows = result.all()
-
-        posts = []
-        for post, user, rating, comments_count in rows:
-            is_favorited = False
-            user_rating = None
-
-            if current_user_id:
-                try:
-                    user_uuid = UUID(current_user_id)
-                    is_favorited = await self._is_favorited(user_uuid, post.id)
-                    user_rating = await self._get_user_rating(user_uuid, post.id)
-                except ValueError:
-                    pass
-
-            posts.append(
-                self._to_read(
-                    post, user, rating or 0, user_rating, comments_count or 0, is_favorited
-                )
+        return await self._fetch_entries_page(statement, user_id, limit, fields)
+
+    async def get_by_tag(
+        self,
+        tag_name: str,
+        current_user_id: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: PageCursor | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> PostPage:
+        tag_id = select(Tag.id).where(Tag.name == tag_name).scalar_subquery()
+        statement = select(PostTag.post_id, PostTag.created_at).where(PostTag.tag_id == tag_id)
+        if cursor is not None:
+            statement = statement.where(
+                tuple_(PostTag.created_at, PostTag.post_id) < tuple_(cursor.created_at, cursor.id)
             )
-
-        return posts
+        statement = statement.order_by(PostTag.created_at.desc(), PostTag.post_id.desc()).limit(
+            limit + 1
+        )
+        return await self._fetch_entries_page(statement, current_user_id, limit, fields)
 
     async def create(self, post: PostCreate, author_id: str) -> PostRead:
         author_uuid = UUID(author_id)
+        now = datetime.utcnow()
 
         post_orm = PostORM(
             id=uuid4(),
@@ -135,15 +258,18 @@ class PostRepositoryImpl(PostRepository):
             title=post.title,
             content=post.content,
             image_url=post.image_url,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            hot_score=hot_score(0, now),
+            created_at=now,
+            updated_at=now,
         )
         self.session.add(post_orm)
+        await self._fan_out(post_orm)
+        await self._attach_tags(post_orm, post.tags)
         await self.session.commit()
         await self.session.refresh(post_orm)
 
         user = await self.session.get(User, author_uuid)
-        return self._to_read(post_orm, user, 0, None, 0, False)
+        return self._to_read(post_orm, user, None, False, sorted(post.tags))
 
     async def update(self, post_id: str, post: PostUpdate) -> PostRead | None:
         try:
@@ -160,14 +286,21 @@ class PostRepositoryImpl(PostRepository):
         post_orm.updated_at = datetime.utcnow()
 
         self.session.add(post_orm)
+        current_tags = await self._get_post_tags(post_uuid)
+        if post.tags is not None:
+            removed = [tag_id for name, tag_id in current_tags.items() if name not in post.tags]
+            await self._detach_tags(post_uuid, removed)
+            await self._attach_tags(
+                post_orm, [name for name in post.tags if name not in current_tags]
+            )
+            tags = post.tags
+        else:
+            tags = list(current_tags)
         await self.session.commit()
         await self.session.refresh(post_orm)
 
         user = await self.session.get(User, post_orm.author_id)
-        rating = await self._get_rating(post_uuid)
-        comments_count = await self._get_comments_count(post_uuid)
-
-        return self._to_read(post_orm, user, rating, None, comments_count, False)
+        return self._to_read(post_orm, user, None, False, sorted(tags))
 
     async def delete(self, post_id: str) -> bool:
         try:
@@ -175,91 +308,330 @@ class PostRepositoryImpl(PostRepository):
         except ValueError:
             return False
 
-        post = await self.session.get(PostORM, post_uuid)
-        if not post:
-            return False
-
-        await self.session.delete(post)
+        # Comments, favorites, ratings and timeline rows are removed by ON DELETE CASCADE.
+        current_tags = await self._get_post_tags(post_uuid)
+        await self._detach_tags(post_uuid, list(current_tags.values()))
+        result = await self.session.execute(delete(PostORM).where(PostORM.id == post_uuid))
         await self.session.commit()
-        return True
+        return result.rowcount > 0
+
+    async def search(
+        self,
+        query: str,
+        current_user_id: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: ScoreCursor | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> PostPage:
+        match, rank = post_search(query, self.session.get_bind().dialect.name)
+        rank = rank.label("rank")
+
+        statement = self._listing_statement(fields=fields).add_columns(rank).where(match)
+        if cursor is not None:
+            statement = statement.where(tuple_(rank, PostORM.id) < tuple_(*cursor))
+        statement = statement.order_by(rank.desc(), PostORM.id.desc()).limit(limit + 1)
+
+        result = await self.session.execute(statement)
+        rows = result.all()
 
-    async def search(self, query: str, current_user_id: str | None = None) -> list[PostRead]:
-        search_term = f"%{query}%"
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_score_cursor(rows[-1].rank, rows[-1].id)
 
-        statement = (
-            select(
-                PostORM,
-                User,
-                func.coalesce(func.sum(PostRating.value), 0).label("rating"),
-                func.count(Comment.id.distinct()).label("comments_count"),
+        items = await self._hydrate(rows, current_user_id, fields)
+        return PostPage(items=items, next_cursor=next_cursor)
+
+    @staticmethod
+    def _listing_statement(full_content: bool = False, fields: frozenset[str] | None = None):
+        columns = [
+            PostORM.id,
+            PostORM.created_at,
+            PostORM.hot_score,
+            *project(_POST_COLUMNS, fields),
+        ]
+        if wants(fields, "tags"):
+            columns.append(
+                select(func.aggregate_strings(Tag.name, ","))
+                .join(PostTag, PostTag.tag_id == Tag.id)
+                .where(PostTag.post_id == PostORM.id)
+                .scalar_subquery()
+                .label("tags")
             )
-            .join(User, PostORM.author_id == User.id)
-            .outerjoin(PostRating, PostRating.post_id == PostORM.id)
-            .outerjoin(Comment, Comment.post_id == PostORM.id)
-            .where(or_(PostORM.title.ilike(search_term), PostORM.content.ilike(search_term)))
-            .group_by(PostORM.id, User.id)
-            .order_by(PostORM.created_at.desc())
+        if wants(fields, "content", "content_truncated"):
+            columns.append(PostORM.content if full_content else post_excerpt())
+
+        statement = select(*columns)
+        if wants(fields, "authorLogin", "authorAvatar"):
+            statement = statement.join(User, PostORM.author_id == User.id)
+        return statement
+
+    async def _get_post_tags(self, post_id: UUID) -> dict[str, int]:
+        result = await self.session.execute(
+            select(Tag.name, Tag.id)
+            .join(PostTag, PostTag.tag_id == Tag.id)
+            .where(PostTag.post_id == post_id)
+        )
+        return {name: tag_id for name, tag_id in result.all()}
+
+    async def _attach_tags(self, post: PostORM, names: list[str]) -> None:
+        if not names:
+            return
+
+        tag_ids = await self._get_or_create_tags(names)
+        await self.session.execute(
+            insert(PostTag).values(
+                [
+                    {"post_id": post.id, "tag_id": tag_id, "created_at": post.created_at}
+                    for tag_id in tag_ids
+                ]
+            )
+        )
+        await self.session.execute(
+            update(Tag).where(Tag.id.in_(tag_ids)).values(post_count=Tag.post_count + 1)
         )
 
-        result = await self.session.execute(statement)
-        rows = result.all()
+    async def _detach_tags(self, post_id: UUID, tag_ids: list[int]) -> None:
+        if not tag_ids:
+            return
+
+        await self.session.execute(
+            delete(PostTag).where(PostTag.post_id == post_id, PostTag.tag_id.in_(tag_ids))
+        )
+        await self.session.execute(
+            update(Tag).where(Tag.id.in_(tag_ids)).values(post_count=Tag.post_count - 1)
+        )
 
-        posts = []
-        for post, user, rating, comments_count in rows:
-            is_favorited = False
-            user_rating = None
-
-            if current_user_id:
-                try:
-                    user_uuid = UUID(current_user_id)
-                    is_favorited = await self._is_favorited(user_uuid, post.id)
-                    user_rating = await self._get_user_rating(user_uuid, post.id)
-                except ValueError:
-                    pass
-
-            posts.append(
-                self._to_read(
-                    post, user, rating or 0, user_rating, comments_count or 0, is_favorited
+    async def _get_or_create_tags(self, names: list[str]) -> list[int]:
+        if self.session.get_bind().dialect.name == "postgresql":
+            inserted = (
+                pg_insert(Tag)
+                .values([{"name": name} for name in names])
+                .on_conflict_do_nothing(index_elements=[Tag.name])
+                .returning(Tag.id, Tag.name)
+                .cte("inserted")
+            )
+            statement = select(inserted.c.id, inserted.c.name).union_all(
+                select(Tag.id, Tag.name).where(Tag.name.in_(names))
+            )
+            result = await self.session.execute(statement)
+            tag_ids = {name: tag_id for tag_id, name in result.all()}
+        else:
+            existing = await self.session.execute(
+                select(Tag.name, Tag.id).where(Tag.name.in_(names))
+            )
+            tag_ids = {name: tag_id for name, tag_id in existing.all()}
+            missing = [name for name in names if name not in tag_ids]
+            if missing:
+                created = await self.session.execute(
+                    insert(Tag)
+                    .values([{"name": name} for name in missing])
+                    .returning(Tag.name, Tag.id)
                 )
+                tag_ids.update({name: tag_id for name, tag_id in created.all()})
+
+        missing = [name for name in names if name not in tag_ids]
+        if missing:
+            # Created by a concurrent transaction after this statement's snapshot.
+            result = await self.session.execute(
+                select(Tag.name, Tag.id).where(Tag.name.in_(missing))
             )
+            tag_ids.update({name: tag_id for name, tag_id in result.all()})
 
-        return posts
+        return [tag_ids[name] for name in names]
 
-    async def _get_rating(self, post_id: UUID) -> int:
-        result = await self.session.execute(
-            select(func.coalesce(func.sum(PostRating.value), 0)).where(
-                PostRating.post_id == post_id
+    async def _fan_out(self, post: PostORM) -> None:
+        followers = (
+            select(
+                Subscription.follower_id,
+                literal(post.id, TimelineEntry.__table__.c.post_id.type),
+                literal(post.author_id, TimelineEntry.__table__.c.author_id.type),
+                literal(post.created_at, TimelineEntry.__table__.c.created_at.type),
+            )
+            .join(User, User.id == Subscription.following_id)
+            .where(Subscription.following_id == post.author_id, User.pull_timeline.is_(False))
+        )
+        await self.session.execute(
+            insert(TimelineEntry).from_select(
+                ["user_id", "post_id", "author_id", "created_at"], followers
             )
         )
-        return result.scalar() or 0
 
-    async def _get_comments_count(self, post_id: UUID) -> int:
-        result = await self.session.execute(
-            select(func.count(Comment.id)).where(Comment.post_id == post_id)
+    @staticmethod
+    def _keyset_branch(statement, created_at, item_id, limit: int, cursor: PageCursor | None):
+        if cursor is not None:
+            statement = statement.where(
+                tuple_(created_at, item_id) < tuple_(cursor.created_at, cursor.id)
+            )
+        return statement.order_by(created_at.desc(), item_id.desc()).limit(limit + 1).subquery()
+
+    @staticmethod
+    def _apply_keyset(
+        statement,
+        limit: int,
+        cursor: PageCursor | ScoreCursor | None,
+        sort: PostSort = "new",
+    ):
+        sort_key = (
+            (PostORM.hot_score, PostORM.id) if sort == "hot" else (PostORM.created_at, PostORM.id)
         )
-        return result.scalar() or 0
+        if cursor is not None:
+            statement = statement.where(tuple_(*sort_key) < tuple_(*cursor))
+        return statement.order_by(*(column.desc() for column in sort_key)).limit(limit + 1)
+
+    async def _fetch_entries_page(
+        self,
+        statement,
+        current_user_id: str | None,
+        limit: int,
+        fields: frozenset[str] | None = None,
+    ) -> PostPage:
+        result = await self.session.execute(statement)
+        entries = result.all()
+
+        next_cursor = None
+        if len(entries) > limit:
+            entries = entries[:limit]
+            next_cursor = encode_cursor(entries[-1].created_at, entries[-1].post_id)
+
+        post_ids = [entry.post_id for entry in entries]
+        if not post_ids:
+            return PostPage(items=[], next_cursor=next_cursor)
 
-    async def _is_favorited(self, user_id: UUID, post_id: UUID) -> bool:
         result = await self.session.execute(
-            select(Favorite).where(Favorite.user_id == user_id, Favorite.post_id == post_id)
+            self._listing_statement(fields=fields).where(PostORM.id.in_(post_ids))
+        )
+        rows_by_id = {row.id: row for row in result.all()}
+        rows = [rows_by_id[post_id] for post_id in post_ids if post_id in rows_by_id]
+
+        items = await self._hydrate(rows, current_user_id, fields)
+        return PostPage(items=items, next_cursor=next_cursor)
+
+    async def _fetch_page(
+        self,
+        statement,
+        current_user_id: str | None,
+        limit: int,
+        cursor: PageCursor | ScoreCursor | None,
+        sort: PostSort = "new",
+        fields: frozenset[str] | None = None,
+    ) -> PostPage:
+        result = await self.session.execute(self._apply_keyset(statement, limit, cursor, sort))
+        rows = result.all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last_post = rows[-1]
+            if sort == "hot":
+                next_cursor = encode_score_cursor(last_post.hot_score, last_post.id)
+            else:
+                next_cursor = encode_cursor(last_post.created_at, last_post.id)
+
+        items = await self._hydrate(rows, current_user_id, fields)
+        return PostPage(items=items, next_cursor=next_cursor)
+
+    async def _hydrate(
+        self, rows, current_user_id: str | None, fields: frozenset[str] | None = None
+    ) -> list[PostRead]:
+        viewer_state: dict[UUID, tuple[bool, int | None]] | None = None
+        if current_user_id and rows and wants(fields, "user_rating", "is_favorited"):
+            try:
+                user_uuid = UUID(current_user_id)
+            except ValueError:
+                pass
+            else:
+                viewer_state = await self._get_viewer_state(
+                    user_uuid, [row.id for row in rows], fields
+                )
+
+        return [
+            self._row_to_read(
+                row,
+                viewer_state.get(row.id, (False, None)) if viewer_state is not None else None,
+            )
+            for row in rows
+        ]
+
+    async def _get_viewer_state(
+        self, user_id: UUID, post_ids: list[UUID], fields: frozenset[str] | None = None
+    ) -> dict[UUID, tuple[bool, int | None]]:
+        favorited = await self._get_favorited(user_id)
+        if favorited is not None:
+            ratings = {}
+            if wants(fields, "user_rating"):
+                result = await self.session.execute(
+                    select(PostRating.post_id, PostRating.value).where(
+                        PostRating.user_id == user_id, PostRating.post_id.in_(post_ids)
+                    )
+                )
+                ratings = dict(result.all())
+            return {post_id: (post_id in favorited, ratings.get(post_id)) for post_id in post_ids}
+
+        statement = (
+            select(PostORM.id, Favorite.post_id, PostRating.value)
+            .outerjoin(Favorite, and_(Favorite.post_id == PostORM.id, Favorite.user_id == user_id))
+            .outerjoin(
+                PostRating, and_(PostRating.post_id == PostORM.id, PostRating.user_id == user_id)
+            )
+            .where(PostORM.id.in_(post_ids))
         )
-        return result.scalar_one_or_none() is not None
 
-    async def _get_user_rating(self, user_id: UUID, post_id: UUID) -> int | None:
+        result = await self.session.execute(statement)
+        return {
+            post_id: (favorite_post_id is not None, user_rating)
+            for post_id, favorite_post_id, user_rating in result.all()
+        }
+
+    async def _get_favorited(self, user_id: UUID) -> set[UUID] | None:
+        if self.favorites is None:
+            return None
+        favorited = self.favorites.get(user_id)
+        if favorited is not None or not self.favorites.should_load(user_id):
+            return favorited
+
+        version = self.favorites.version
         result = await self.session.execute(
-            select(PostRating).where(PostRating.user_id == user_id, PostRating.post_id == post_id)
+            select(Favorite.post_id)
+            .where(Favorite.user_id == user_id)
+            .limit(self.favorites.max_user_ids + 1)
         )
-        rating = result.scalar_one_or_none()
-        return rating.value if rating else None
+        return self.favorites.load(user_id, result.scalars().all(), version)
+
+    @staticmethod
+    def _split_tags(tag_names: str | None) -> list[str]:
+        return sorted(tag_names.split(",")) if tag_names else []
+
+    @classmethod
+    def _row_to_read(
+        cls,
+        row,
+        viewer_state: tuple[bool, int | None] | None,
+        full_content: bool = False,
+    ) -> PostRead:
+        values = row_values(row, ("id", *_POST_COLUMNS))
+        if "tags" in row._mapping:
+            values["tags"] = cls._split_tags(row.tags)
+        if "content" in row._mapping:
+            if full_content:
+                values["content"] = row.content
+            else:
+                values["content"], values["content_truncated"] = make_excerpt(row.content)
+        if viewer_state is not None:
+            values["is_favorited"], values["user_rating"] = viewer_state
+
+        # Values come straight from typed columns, so validation would only repeat work.
+        return PostRead.model_construct(**values)
 
     @staticmethod
     def _to_read(
         post: PostORM,
         user: User | None,
-        rating: int,
         user_rating: int | None,
-        comments_count: int,
         is_favorited: bool,
+        tags: list[str] | None = None,
+        content: str | None = None,
+        content_truncated: bool = False,
     ) -> PostRead:
         return PostRead(
             id=str(post.id),
@@ -267,12 +639,15 @@ class PostRepositoryImpl(PostRepository):
             authorLogin=user.login if user else None,
             authorAvatar=user.avatar_url if user else None,
             title=post.title,
-            content=post.content,
+            content=post.content if content is None else content,
+            content_truncated=content_truncated,
             image_url=post.image_url,
-            rating=rating,
+            rating=post.rating_sum,
             user_rating=user_rating,
-            comments_count=comments_count,
+            comments_count=post.comments_count,
+            favorites_count=post.favorites_count,
             is_favorited=is_favorited,
+            tags=tags or [],
             createdAt=post.created_at,
             updatedAt=post.updated_at,
         )
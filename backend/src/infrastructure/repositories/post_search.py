@@ -0,0 +1,19 @@
+from sqlalchemy import case, func, literal_column, or_
+from sqlalchemy.dialects.postgresql import TSVECTOR, websearch_to_tsquery
+
+from src.infrastructure.database.models import POST_SEARCH_CONFIG, Post
+
+
+def post_search(query: str, dialect: str):
+    if dialect == "postgresql":
+        search_vector = literal_column("posts.search_vector", TSVECTOR)
+        tsquery = websearch_to_tsquery(POST_SEARCH_CONFIG, query)
+        return search_vector.bool_op("@@")(tsquery), func.ts_rank(search_vector, tsquery)
+
+    # SQLite has no tsvector; substring matching ranks title hits above body-only hits.
+    search_term = f"%{query}%"
+    title_match = Post.title.ilike(search_term)
+    return (
+        or_(title_match, Post.content.ilike(search_term)),
+        case((title_match, 1.0), else_=0.0),
+    )
@@ -0,0 +1,19 @@
+from typing import Any
+from uuid import UUID
+
+
+def wants(fields: frozenset[str] | None, *names: str) -> bool:
+    return fields is None or any(name in fields for name in names)
+
+
+def project(columns: dict[str, Any], fields: frozenset[str] | None) -> list:
+    return [column.label(name) for name, column in columns.items() if wants(fields, name)]
+
+
+def row_values(row, names) -> dict[str, Any]:
+    mapping = row._mapping
+    return {
+        name: str(mapping[name]) if isinstance(mapping[name], UUID) else mapping[name]
+        for name in names
+        if name in mapping
+    }
@@ -1,10 +1,34 @@
+from datetime import datetime
 from uuid import UUID
 
+from sqlalchemy import (
+    and_,
+    any_,
+    bindparam,
+    case,
+    column,
+    delete,
+    func,
+    insert,
+    literal,
+    literal_column,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select, func
+from sqlmodel import select
 
+from src.domain.models.posts import PostRatingState
 from src.domain.repositories.rating_repository import RatingRepository
-from src.infrastructure.database.models import PostRating
+from src.infrastructure.database.models import Post, PostRating
+from src.infrastructure.repositories.post_counters import (
+    adjust_post_counters,
+    adjust_post_rating,
+    adjust_post_ratings,
+    hot_score_expression,
+)
 
 
 class RatingRepositoryImpl(RatingRepository):
@@ -17,11 +41,7 @@ class RatingRepositoryImpl(RatingRepository):
         except ValueError:
             return 0
 
-        result = await self.session.execute(
-            select(func.coalesce(func.sum(PostRating.value), 0)).where(
-                PostRating.post_id == post_uuid
-            )
-        )
+        result = await self.session.execute(select(Post.rating_sum).where(Post.id == post_uuid))
         return result.scalar() or 0
 
     async def get_user_rating(self, user_id: str, post_id: str) -> int | None:
@@ -39,46 +59,247 @@ class RatingRepositoryImpl(RatingRepository):
         rating = result.scalar_one_or_none()
         return rating.value if rating else None
 
-    async def set_rating(self, user_id: str, post_id: str, value: int) -> bool:
+    async def set_rating(self, user_id: str, post_id: str, value: int) -> PostRatingState | None:
         try:
             user_uuid = UUID(user_id)
             post_uuid = UUID(post_id)
         except ValueError:
-            return False
+            return None
 
-        result = await self.session.execute(
-            select(PostRating).where(
-                PostRating.user_id == user_uuid, PostRating.post_id == post_uuid
+        if self._is_postgresql():
+            vote = self._upsert_votes([(user_uuid, post_uuid, value)]).cte("vote")
+            rating_sum = await self._apply_delta(post_uuid, select(vote.c.delta))
+        else:
+            existing = await self.session.execute(
+                select(PostRating.value).where(
+                    PostRating.user_id == user_uuid, PostRating.post_id == post_uuid
+                )
             )
-        )
-        existing = result.scalar_one_or_none()
+            previous = existing.scalar()
+            rating_sum = await adjust_post_rating(self.session, post_uuid, value - (previous or 0))
+            if rating_sum is not None and previous is None:
+                await self.session.execute(
+                    insert(PostRating).values(
+                        user_id=user_uuid,
+                        post_id=post_uuid,
+                        value=value,
+                        created_at=datetime.utcnow(),
+                    )
+                )
+            elif rating_sum is not None and previous != value:
+                await self.session.execute(
+                    update(PostRating)
+                    .where(PostRating.user_id == user_uuid, PostRating.post_id == post_uuid)
+                    .values(value=value)
+                )
 
-        if existing:
-            existing.value = value
-            self.session.add(existing)
+        if rating_sum is None:
+            await self.session.rollback()
+            return None
+        await self.session.commit()
+        return PostRatingState(rating=rating_sum, user_rating=value)
+
+    async def remove_rating(self, user_id: str, post_id: str) -> PostRatingState | None:
+        try:
+            user_uuid = UUID(user_id)
+            post_uuid = UUID(post_id)
+        except ValueError:
+            return None
+
+        removed = delete(PostRating).where(
+            PostRating.user_id == user_uuid, PostRating.post_id == post_uuid
+        )
+        if self._is_postgresql():
+            removed = removed.returning((-PostRating.value).label("delta")).cte("removed")
+            rating_sum = await self._apply_delta(post_uuid, select(removed.c.delta))
         else:
-            rating = PostRating(user_id=user_uuid, post_id=post_uuid, value=value)
-            self.session.add(rating)
+            result = await self.session.execute(removed.returning(PostRating.value))
+            rating_sum = await adjust_post_rating(self.session, post_uuid, -(result.scalar() or 0))
 
+        if rating_sum is None:
+            await self.session.rollback()
+            return None
         await self.session.commit()
-        return True
+        return PostRatingState(rating=rating_sum, user_rating=None)
 
-    async def remove_rating(self, user_id: str, post_id: str) -> bool:
+    async def get_rating_state(self, user_id: str, post_id: str) -> PostRatingState | None:
         try:
             user_uuid = UUID(user_id)
             post_uuid = UUID(post_id)
         except ValueError:
-            return False
+            return None
 
         result = await self.session.execute(
-            select(PostRating).where(
-                PostRating.user_id == user_uuid, PostRating.post_id == post_uuid
+            select(Post.rating_sum, PostRating.value)
+            .outerjoin(
+                PostRating, and_(PostRating.post_id == Post.id, PostRating.user_id == user_uuid)
             )
+            .where(Post.id == post_uuid)
         )
-        rating = result.scalar_one_or_none()
+        row = result.first()
+        if row is None:
+            return None
+        return PostRatingState(rating=row.rating_sum, user_rating=row.value)
 
-        if rating:
-            await self.session.delete(rating)
-            await self.session.commit()
+    async def get_ratings(
+        self, post_ids: list[str], user_id: str | None = None
+    ) -> dict[str, PostRatingState]:
+        post_uuids: dict[str, UUID] = {}
+        for post_id in post_ids:
+            try:
+                post_uuids[post_id] = UUID(post_id)
+            except ValueError:
+                continue
+        if not post_uuids:
+            return {}
+        try:
+            user_uuid = UUID(user_id) if user_id else None
+        except ValueError:
+            user_uuid = None
 
-        return True
+        statement = select(Post.id, Post.rating_sum, PostRating.value).outerjoin(
+            PostRating, and_(PostRating.post_id == Post.id, PostRating.user_id == user_uuid)
+        )
+        if self._is_postgresql():
+            ids = bindparam("post_ids", list(post_uuids.values()), type_=ARRAY(PG_UUID))
+            statement = statement.where(Post.id == any_(ids))
+        else:
+            statement = statement.where(Post.id.in_(post_uuids.values()))
+
+        result = await self.session.execute(statement)
+        states = {
+            post_id: PostRatingState(rating=rating_sum, user_rating=value)
+            for post_id, rating_sum, value in result.all()
+        }
+        return {
+            post_id: states[post_uuid]
+            for post_id, post_uuid in post_uuids.items()
+            if post_uuid in states
+        }
+
+    async def apply_ratings(self, votes: dict[tuple[str, str], int]) -> list[str]:
+        rows = []
+        for (user_key, post_key), value in votes.items():
+            try:
+                rows.append((UUID(user_key), UUID(post_key), value))
+            except ValueError:
+                continue
+        # A stable row order keeps concurrent flushes from deadlocking on each other.
+        rows.sort()
+        upserts = [row for row in rows if row[2]]
+        removals = [(user_id, post_id) for user_id, post_id, value in rows if not value]
+
+        written = []
+        if upserts and self._is_postgresql():
+            written += (await self.session.execute(self._upsert_votes(upserts))).all()
+        elif upserts:
+            written += await self._write_votes(upserts)
+        if removals:
+            result = await self.session.execute(
+                delete(PostRating)
+                .where(tuple_(PostRating.user_id, PostRating.post_id).in_(removals))
+                .returning(PostRating.post_id, (-PostRating.value).label("delta"))
+            )
+            written += result.all()
+
+        deltas: dict[UUID, int] = {}
+        for post_id, delta in written:
+            deltas[post_id] = deltas.get(post_id, 0) + delta
+        await adjust_post_ratings(self.session, deltas)
+        await self.session.commit()
+        return [str(post_id) for post_id in sorted(deltas)]
+
+    async def _write_votes(self, rows: list[tuple[UUID, UUID, int]]) -> list[tuple[UUID, int]]:
+        result = await self.session.execute(
+            select(PostRating.user_id, PostRating.post_id, PostRating.value).where(
+                tuple_(PostRating.user_id, PostRating.post_id).in_(
+                    [(user_id, post_id) for user_id, post_id, _ in rows]
+                )
+            )
+        )
+        existing = {(user_id, post_id): value for user_id, post_id, value in result.all()}
+        result = await self.session.execute(
+            select(Post.id).where(Post.id.in_({post_id for _, post_id, _ in rows}))
+        )
+        post_ids = set(result.scalars())
+
+        written = []
+        inserts = []
+        updates = []
+        for user_id, post_id, value in rows:
+            previous = existing.get((user_id, post_id))
+            if post_id not in post_ids or previous == value:
+                continue
+            if previous is None:
+                inserts.append(
+                    {
+                        "user_id": user_id,
+                        "post_id": post_id,
+                        "value": value,
+                        "created_at": datetime.utcnow(),
+                    }
+                )
+            else:
+                updates.append({"user_id": user_id, "post_id": post_id, "value": value})
+            written.append((post_id, value - (previous or 0)))
+
+        if inserts:
+            await self.session.execute(insert(PostRating), inserts)
+        if updates:
+            await self.session.execute(update(PostRating), updates)
+        return written
+
+    def _is_postgresql(self) -> bool:
+        return self.session.get_bind().dialect.name == "postgresql"
+
+    @staticmethod
+    def _upsert_votes(rows: list[tuple[UUID, UUID, int]]):
+        columns = PostRating.__table__.c
+        vote_rows = values(
+            column("user_id", columns.user_id.type),
+            column("post_id", columns.post_id.type),
+            column("value", columns.value.type),
+            name="vote_rows",
+        ).data(rows)
+        # Joining posts drops votes for posts that no longer exist instead of
+        # failing the whole statement on the foreign key.
+        new_rows = (
+            select(
+                vote_rows.c.user_id,
+                vote_rows.c.post_id,
+                vote_rows.c.value,
+                literal(datetime.utcnow(), columns.created_at.type),
+            )
+            .join(Post, Post.id == vote_rows.c.post_id)
+            .order_by(vote_rows.c.user_id, vote_rows.c.post_id)
+        )
+        statement = pg_insert(PostRating).from_select(
+            ["user_id", "post_id", "value", "created_at"], new_rows
+        )
+        # Only a changed vote is written, and votes are ±1, so an updated row always
+        # moved the total by twice the new value; xmax is 0 only for a fresh insert.
+        return statement.on_conflict_do_update(
+            index_elements=[PostRating.user_id, PostRating.post_id],
+            set_={"value": statement.excluded.value},
+            where=PostRating.value != statement.excluded.value,
+        ).returning(
+            PostRating.post_id,
+            case((literal_column("xmax") == 0, PostRating.value), else_=2 * PostRating.value).label(
+                "delta"
+            ),
+        )
+
+    async def _apply_delta(self, post_id: UUID, delta) -> int | None:
+        # The vote CTE, the counter and the hot score are written by one statement;
+        # SET reads the pre-update rating_sum, so the delta is added again for the score.
+        delta = func.coalesce(delta.scalar_subquery(), 0)
+        result = await self.session.execute(
+            adjust_post_counters(post_id, rating_sum=delta)
+            .values(
+                hot_score=hot_score_expression(
+                    Post.rating_sum + delta, Post.created_at, "postgresql"
+                )
+            )
+            .returning(Post.rating_sum)
+        )
+        return result.scalar()
@@ -0,0 +1,103 @@
+from uuid import UUID
+
+from sqlalchemy import delete, insert, literal, or_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from src.core.settings import settings
+from src.domain.repositories.subscription_repository import SubscriptionRepository
+from src.infrastructure.database.models import Post, Subscription, TimelineEntry, User
+
+
+class SubscriptionRepositoryImpl(SubscriptionRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def follow(self, follower_id: str, following_id: str) -> bool:
+        try:
+            follower_uuid = UUID(follower_id)
+            following_uuid = UUID(following_id)
+        except ValueError:
+            return False
+
+        existing = await self.session.get(Subscription, (follower_uuid, following_uuid))
+        if existing:
+            return False
+
+        self.session.add(Subscription(follower_id=follower_uuid, following_id=following_uuid))
+        # An author switches to pull as soon as they pass the fan-out limit; switching
+        # back is left to the timeline mode job, which backfills the followers first.
+        result = await self.session.execute(
+            update(User)
+            .where(User.id == following_uuid)
+            .values(
+                followers_count=User.followers_count + 1,
+                pull_timeline=or_(
+                    User.pull_timeline, User.followers_count + 1 > settings.timeline_fanout_limit
+                ),
+            )
+            .returning(User.pull_timeline)
+        )
+        if not result.scalar_one():
+            await self._backfill_timeline(follower_uuid, following_uuid)
+
+        await self.session.commit()
+        return True
+
+    async def unfollow(self, follower_id: str, following_id: str) -> bool:
+        try:
+            follower_uuid = UUID(follower_id)
+            following_uuid = UUID(following_id)
+        except ValueError:
+            return False
+
+        subscription = await self.session.get(Subscription, (follower_uuid, following_uuid))
+        if not subscription:
+            return False
+
+        await self.session.delete(subscription)
+        await self.session.execute(
+            update(User)
+            .where(User.id == following_uuid)
+            .values(followers_count=User.followers_count - 1)
+        )
+        await self.session.execute(
+            delete(TimelineEntry).where(
+                TimelineEntry.user_id == follower_uuid, TimelineEntry.author_id == following_uuid
+            )
+        )
+        await self.session.commit()
+        return True
+
+    async def is_following(self, follower_id: str, following_id: str) -> bool:
+        try:
+            follower_uuid = UUID(follower_id)
+            following_uuid = UUID(following_id)
+        except ValueError:
+            return False
+
+        result = await self.session.execute(
+            select(Subscription.follower_id).where(
+                Subscription.follower_id == follower_uuid,
+                Subscription.following_id == following_uuid,
+            )
+        )
+        return result.first() is not None
+
+    async def _backfill_timeline(self, follower_id: UUID, following_id: UUID) -> None:
+        recent_posts = (
+            select(
+                literal(follower_id, TimelineEntry.__table__.c.user_id.type),
+                Post.id,
+                Post.author_id,
+                Post.created_at,
+            )
+            .where(Post.author_id == following_id)
+            .order_by(Post.created_at.desc(), Post.id.desc())
+            .limit(settings.timeline_backfill_size)
+        )
+        await self.session.execute(
+            insert(TimelineEntry).from_select(
+                ["user_id", "post_id", "author_id", "created_at"], recent_posts
+            )
+        )
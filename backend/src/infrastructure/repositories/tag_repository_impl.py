@@ -0,0 +1,29 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from src.domain.models.posts import TagRead
+from src.domain.repositories.tag_repository import TagRepository
+from src.infrastructure.database.models import Tag
+
+
+class TagRepositoryImpl(TagRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_by_name(self, name: str) -> TagRead | None:
+        result = await self.session.execute(
+            select(Tag.name, Tag.post_count).where(Tag.name == name)
+        )
+        row = result.first()
+        if row is None:
+            return None
+        return TagRead(name=row.name, post_count=row.post_count)
+
+    async def get_popular(self, limit: int) -> list[TagRead]:
+        result = await self.session.execute(
+            select(Tag.name, Tag.post_count)
+            .where(Tag.post_count > 0)
+            .order_by(Tag.post_count.desc(), Tag.name)
+            .limit(limit)
+        )
+        return [TagRead(name=row.name, post_count=row.post_count) for row in result.all()]
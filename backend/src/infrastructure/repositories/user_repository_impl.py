@@ -1,17 +1,50 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
+from sqlalchemy import delete, func, or_, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import or_, select
+from sqlmodel import select
 
-from src.domain.models.users import UserCreate, UserProfileUpdate, UserPublic, UserRead
+from src.application.login_index import LoginIndex
+from src.core.pagination import DEFAULT_PAGE_SIZE, ScoreCursor, encode_score_cursor
+from src.domain.models.users import (
+    UserCreate,
+    UserPage,
+    UserProfileUpdate,
+    UserPublic,
+    UserRead,
+)
 from src.domain.repositories.user_repository import UserRepository
-from src.infrastructure.database.models import User as UserORM
+from src.infrastructure.database.models import (
+    Comment,
+    Favorite,
+    Post,
+    PostRating,
+    PostTag,
+    Subscription,
+    Tag,
+    User as UserORM,
+)
+from src.infrastructure.repositories.post_counters import hot_score_expression
+from src.infrastructure.repositories.projection import project, row_values
+from src.infrastructure.repositories.user_search import user_search
+
+_PUBLIC_COLUMNS = {
+    "id": UserORM.id,
+    "email": UserORM.email,
+    "login": UserORM.login,
+    "avatar_url": UserORM.avatar_url,
+    "bio": UserORM.bio,
+    "followers_count": UserORM.followers_count,
+    "createdAt": UserORM.created_at,
+    "updatedAt": UserORM.updated_at,
+}
 
 
 class UserRepositoryImpl(UserRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, login_index: LoginIndex | None = None):
         self.session = session
+        self.login_index = login_index
 
     async def get_by_id(self, user_id: str) -> UserRead | None:
         try:
@@ -45,6 +78,7 @@ class UserRepositoryImpl(UserRepository):
         self.session.add(user_orm)
         await self.session.commit()
         await self.session.refresh(user_orm)
+        self._index(user_orm)
         return self._to_read(user_orm)
 
     async def update_profile(self, user_id: str, profile: UserProfileUpdate) -> UserPublic | None:
@@ -68,6 +102,7 @@ class UserRepositoryImpl(UserRepository):
         self.session.add(user)
         await self.session.commit()
         await self.session.refresh(user)
+        self._index(user)
         return self._to_public(user)
 
     async def update_avatar(self, user_id: str, avatar_url: str) -> bool:
@@ -84,6 +119,7 @@ class UserRepositoryImpl(UserRepository):
         user.updated_at = datetime.utcnow()
         self.session.add(user)
         await self.session.commit()
+        self._index(user)
         return True
 
     async def delete(self, user_id: str) -> bool:
@@ -96,21 +132,125 @@ class UserRepositoryImpl(UserRepository):
         if not user:
             return False
 
-        await self.session.delete(user)
+        await self._release_counters(user_uuid)
+        await self.session.execute(delete(UserORM).where(UserORM.id == user_uuid))
         await self.session.commit()
+        if self.login_index is not None:
+            self.login_index.remove(str(user_uuid))
         return True
 
-    async def search(self, query: str) -> list[UserPublic]:
-        search_term = f"%{query}%"
-        statement = (
-            select(UserORM)
-            .where(or_(UserORM.login.ilike(search_term), UserORM.email.ilike(search_term)))
-            .order_by(UserORM.login)
+    async def get_post_ids(self, user_id: str) -> list[str]:
+        try:
+            user_uuid = UUID(user_id)
+        except ValueError:
+            return []
+
+        result = await self.session.execute(select(Post.id).where(Post.author_id == user_uuid))
+        return [str(post_id) for post_id in result.scalars()]
+
+    async def _release_counters(self, user_uuid: UUID) -> None:
+        # Counters fed by the user's votes, comments, favorites, follows and post tags are
+        # taken back in the same transaction that removes those rows.
+        dialect = self.session.get_bind().dialect.name
+        on_other_posts = Post.author_id != user_uuid
+        new_rating = Post.rating_sum - PostRating.value
+        comments = (
+            select(Comment.post_id, func.count().label("count"))
+            .where(Comment.author_id == user_uuid)
+            .group_by(Comment.post_id)
+            .subquery()
         )
+        tags = (
+            select(PostTag.tag_id, func.count().label("count"))
+            .join(Post, Post.id == PostTag.post_id)
+            .where(Post.author_id == user_uuid)
+            .group_by(PostTag.tag_id)
+            .subquery()
+        )
+
+        for statement in (
+            update(Post)
+            .where(Post.id == PostRating.post_id, PostRating.user_id == user_uuid, on_other_posts)
+            .values(
+                rating_sum=new_rating,
+                hot_score=hot_score_expression(new_rating, Post.created_at, dialect),
+            ),
+            update(Post)
+            .where(Post.id == comments.c.post_id, on_other_posts)
+            .values(comments_count=Post.comments_count - comments.c.count),
+            update(Post)
+            .where(Post.id == Favorite.post_id, Favorite.user_id == user_uuid, on_other_posts)
+            .values(favorites_count=Post.favorites_count - 1),
+            update(UserORM)
+            .where(UserORM.id == Subscription.following_id, Subscription.follower_id == user_uuid)
+            .values(followers_count=UserORM.followers_count - 1),
+            update(Tag)
+            .where(Tag.id == tags.c.tag_id)
+            .values(post_count=Tag.post_count - tags.c.count),
+            delete(PostRating).where(PostRating.user_id == user_uuid),
+            delete(Comment).where(Comment.author_id == user_uuid),
+            delete(Favorite).where(Favorite.user_id == user_uuid),
+            delete(Subscription).where(
+                or_(Subscription.follower_id == user_uuid, Subscription.following_id == user_uuid)
+            ),
+        ):
+            await self.session.execute(statement)
+
+    async def search(
+        self,
+        query: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: ScoreCursor | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> UserPage:
+        match, score = user_search(query, self.session.get_bind().dialect.name)
+        score = score.label("score")
+
+        columns = project(_PUBLIC_COLUMNS, fields) if fields is not None else [UserORM]
+        statement = select(*columns, UserORM.id.label("user_id"), score).where(match)
+        if cursor is not None:
+            statement = statement.where(tuple_(score, UserORM.id) < tuple_(*cursor))
+        statement = statement.order_by(score.desc(), UserORM.id.desc()).limit(limit + 1)
 
         result = await self.session.execute(statement)
-        users = result.scalars().all()
-        return [self._to_public(user) for user in users]
+        rows = result.all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_score_cursor(rows[-1].score, rows[-1].user_id)
+
+        if fields is not None:
+            items = [UserPublic.model_construct(**row_values(row, fields)) for row in rows]
+        else:
+            items = [self._to_public(row.User) for row in rows]
+        return UserPage(items=items, next_cursor=next_cursor)
+
+    async def get_many(
+        self, user_ids: list[str], fields: frozenset[str] | None = None
+    ) -> dict[str, UserPublic]:
+        user_uuids = {}
+        for user_id in user_ids:
+            try:
+                user_uuids[UUID(user_id)] = user_id
+            except ValueError:
+                continue
+        if not user_uuids:
+            return {}
+
+        if fields is not None:
+            result = await self.session.execute(
+                select(*project(_PUBLIC_COLUMNS, fields), UserORM.id.label("user_id")).where(
+                    UserORM.id.in_(list(user_uuids))
+                )
+            )
+            return {
+                user_uuids[row.user_id]: UserPublic.model_construct(**row_values(row, fields))
+                for row in result.all()
+            }
+
+        result = await self.session.execute(select(UserORM).where(UserORM.id.in_(list(user_uuids))))
+        return {user_uuids[user.id]: self._to_public(user) for user in result.scalars().all()}
 
     async def get_public_profile(self, user_id: str) -> UserPublic | None:
         try:
@@ -121,6 +261,10 @@ class UserRepositoryImpl(UserRepository):
         user = await self.session.get(UserORM, user_uuid)
         return self._to_public(user) if user else None
 
+    def _index(self, user: UserORM) -> None:
+        if self.login_index is not None:
+            self.login_index.upsert(str(user.id), user.login, user.avatar_url)
+
     @staticmethod
     def _to_read(user: UserORM) -> UserRead:
         return UserRead(
@@ -134,12 +278,13 @@ class UserRepositoryImpl(UserRepository):
 
     @staticmethod
     def _to_public(user: UserORM) -> UserPublic:
-        return UserPublic(
+        return UserPublic.model_construct(
             id=str(user.id),
             email=user.email,
             login=user.login,
             avatar_url=user.avatar_url,
             bio=user.bio,
+            followers_count=user.followers_count,
             createdAt=user.created_at,
             updatedAt=user.updated_at,
         )
@@ -0,0 +1,40 @@
+from sqlalchemy import bindparam, case, func, or_
+
+from src.infrastructure.database.models import User
+
+# Shorter queries hold no full trigram, so pg_trgm cannot narrow an ILIKE '%q%' for them
+# and similarity() would be computed and sorted for almost every user. They match login
+# prefixes instead, served by the lower(login) text_pattern_ops index on PostgreSQL.
+MIN_SUBSTRING_LENGTH = 3
+
+
+def user_search(query: str, dialect: str):
+    if len(query) < MIN_SUBSTRING_LENGTH:
+        login = func.lower(User.login)
+        # The pattern is rendered inline so every prefix gets its own plan: a generic plan
+        # for a bound LIKE pattern cannot use the index, and one- and two-character
+        # prefixes only make a few thousand distinct statements.
+        prefix = bindparam("login_prefix", _prefix_pattern(query), literal_execute=True)
+        return login.like(prefix, escape="/"), case((login == query.lower(), 1.0), else_=0.5)
+
+    match = or_(
+        User.login.icontains(query, autoescape=True),
+        User.email.icontains(query, autoescape=True),
+    )
+    if dialect == "postgresql":
+        # The ILIKE '%q%' match is served by the pg_trgm GIN indexes on PostgreSQL.
+        return match, func.greatest(
+            func.similarity(User.login, query), func.similarity(User.email, query)
+        )
+
+    # SQLite has no pg_trgm; exact logins rank first, then login prefixes.
+    return match, case(
+        (func.lower(User.login) == query.lower(), 1.0),
+        (User.login.istartswith(query, autoescape=True), 0.5),
+        else_=0.0,
+    )
+
+
+def _prefix_pattern(query: str) -> str:
+    escaped = query.lower().replace("/", "//").replace("%", "/%").replace("_", "/_")
+    return escaped + "%"
@@ -1,14 +1,42 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
-from src.api import auth, comments, favorites, posts, ratings, search, uploads, users
+from src.api import (
+    auth,
+    cache,
+    comments,
+    favorites,
+    feed,
+    posts,
+    ratings,
+    search,
+    subscriptions,
+    tags,
+    uploads,
+    users,
+)
+from src.api.pagination import NEXT_CURSOR_HEADER
+from src.application.login_index import login_index
+from src.application.post_cache import post_read_cache
+from src.application.post_search_index import post_search_index
+from src.application.rating_buffer import rating_buffer
 from src.core.settings import settings
 from src.infrastructure.database.database import init_db
+from src.infrastructure.jobs.login_index import load_login_index
+from src.infrastructure.jobs.rating_buffer import (
+    load_rating_buffer,
+    run_rating_buffer_flusher,
+    shutdown_rating_buffer,
+)
+from src.infrastructure.jobs.search_index import load_search_index, run_search_index_saver
+from src.infrastructure.jobs.timeline_modes import run_timeline_mode_sync
 
 
 @asynccontextmanager
@@ -16,10 +44,41 @@ async def lifespan(app: FastAPI):
     await init_db()
     static_dir = Path("/app/static/uploads")
     static_dir.mkdir(parents=True, exist_ok=True)
+    await load_login_index(login_index)
+
+    background_tasks = [
+        asyncio.create_task(run_timeline_mode_sync(settings.timeline_mode_sync_seconds))
+    ]
+    if settings.search_backend == "bm25":
+        await load_search_index(post_search_index)
+        background_tasks.append(
+            asyncio.create_task(
+                run_search_index_saver(post_search_index, settings.search_index_save_seconds)
+            )
+        )
+    if settings.rating_buffer_enabled:
+        await load_rating_buffer(rating_buffer, post_read_cache)
+        background_tasks.append(
+            asyncio.create_task(
+                run_rating_buffer_flusher(
+                    rating_buffer, settings.rating_buffer_flush_seconds, post_read_cache
+                )
+            )
+        )
+
     yield
 
+    for task in background_tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    if settings.search_backend == "bm25":
+        await post_search_index.save()
+    if settings.rating_buffer_enabled:
+        await shutdown_rating_buffer(rating_buffer, post_read_cache)
+
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -27,6 +86,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
 )
 
 try:
@@ -36,12 +96,17 @@ except RuntimeError:
 
 app.include_router(auth.router, prefix="/auth", tags=["Auth"])
 app.include_router(users.router, prefix="/users", tags=["Users"])
+app.include_router(subscriptions.router, prefix="/users", tags=["Subscriptions"])
+app.include_router(feed.router, prefix="/feed", tags=["Feed"])
 app.include_router(posts.router, prefix="/posts", tags=["Posts"])
 app.include_router(comments.router, prefix="/posts", tags=["Comments"])
 app.include_router(favorites.router, prefix="/favorites", tags=["Favorites"])
 app.include_router(ratings.router, prefix="/posts", tags=["Ratings"])
+app.include_router(ratings.bulk_router, prefix="/ratings", tags=["Ratings"])
+app.include_router(tags.router, prefix="/tags", tags=["Tags"])
 app.include_router(search.router, prefix="/search", tags=["Search"])
 app.include_router(uploads.router, prefix="/uploads", tags=["Uploads"])
+app.include_router(cache.router, prefix="/cache", tags=["Cache"])
 
 if __name__ == "__main__":
     server_address = settings.server_address
@@ -40,6 +40,11 @@ def mock_rating_repository():
     return AsyncMock()
 
 
+@pytest.fixture
+def mock_subscription_repository():
+    return AsyncMock()
+
+
 @pytest.fixture
 def mock_password_hasher():
     hasher = AsyncMock()
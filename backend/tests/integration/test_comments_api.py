@@ -66,3 +66,55 @@ async def test_delete_comment(client: AsyncClient, test_user, auth_headers):
     response = await client.delete(f"/posts/{post_id}/comments/{comment_id}", headers=auth_headers)
 
     assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_get_comments_paginates_newest_first(client: AsyncClient, test_user, auth_headers):
+    post_response = await client.post(
+        "/posts", headers=auth_headers, json={"title": "Test Post", "content": "Content"}
+    )
+    post_id = post_response.json()["id"]
+    for i in range(5):
+        await client.post(
+            f"/posts/{post_id}/comments", headers=auth_headers, json={"content": f"Comment {i}"}
+        )
+
+    contents = []
+    cursor: str | None = None
+    for fields in (None, "content", None):
+        params: dict[str, str | int] = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        if fields:
+            params["fields"] = fields
+        response = await client.get(f"/posts/{post_id}/comments", params=params)
+        contents += [comment["content"] for comment in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+
+    assert contents == [f"Comment {i}" for i in range(4, -1, -1)]
+    assert cursor is None
+
+    invalid = await client.get(f"/posts/{post_id}/comments", params={"cursor": "bogus"})
+    assert invalid.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_comments_etag_follows_commenter_profile(
+    client: AsyncClient, test_user, auth_headers
+):
+    post_response = await client.post(
+        "/posts", headers=auth_headers, json={"title": "Test Post", "content": "Content"}
+    )
+    post_id = post_response.json()["id"]
+    await client.post(f"/posts/{post_id}/comments", headers=auth_headers, json={"content": "Hi"})
+
+    response = await client.get(f"/posts/{post_id}/comments")
+    etag = response.headers["ETag"]
+    not_modified = await client.get(f"/posts/{post_id}/comments", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+
+    await client.put("/users/me", headers=auth_headers, json={"login": "renamed"})
+
+    modified = await client.get(f"/posts/{post_id}/comments", headers={"If-None-Match": etag})
+    assert modified.status_code == 200
+    assert modified.json()[0]["authorLogin"] == "renamed"
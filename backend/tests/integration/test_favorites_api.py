@@ -53,3 +53,50 @@ async def test_remove_from_favorites(client: AsyncClient, test_user, auth_header
     response = await client.delete(f"/favorites/{post_id}", headers=auth_headers)
 
     assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_favorites_are_paged_by_when_they_were_added(
+    client: AsyncClient, test_user, auth_headers
+):
+    post_ids = []
+    for title in ("Oldest", "Middle", "Newest"):
+        response = await client.post(
+            "/posts", headers=auth_headers, json={"title": title, "content": "Content"}
+        )
+        post_ids.append(response.json()["id"])
+    for post_id in post_ids:
+        await client.post(f"/favorites/{post_id}", headers=auth_headers)
+    await client.delete(f"/favorites/{post_ids[2]}", headers=auth_headers)
+    await client.post(f"/favorites/{post_ids[2]}", headers=auth_headers)
+    await client.delete(f"/favorites/{post_ids[0]}", headers=auth_headers)
+    await client.post(f"/favorites/{post_ids[0]}", headers=auth_headers)
+
+    first = await client.get("/favorites", headers=auth_headers, params={"limit": 2})
+    cursor = first.headers["X-Next-Cursor"]
+    second = await client.get(
+        "/favorites", headers=auth_headers, params={"limit": 2, "cursor": cursor}
+    )
+
+    assert [post["id"] for post in first.json()] == [post_ids[0], post_ids[2]]
+    assert [post["id"] for post in second.json()] == [post_ids[1]]
+    assert "X-Next-Cursor" not in second.headers
+    assert all(post["is_favorited"] for post in first.json() + second.json())
+
+
+@pytest.mark.asyncio
+async def test_favorite_writes_are_idempotent(client: AsyncClient, test_user, auth_headers):
+    post_response = await client.post(
+        "/posts", headers=auth_headers, json={"title": "Test Post", "content": "Content"}
+    )
+    post_id = post_response.json()["id"]
+    missing = "00000000-0000-0000-0000-000000000000"
+
+    assert (await client.post(f"/favorites/{post_id}", headers=auth_headers)).status_code == 200
+    assert (await client.post(f"/favorites/{post_id}", headers=auth_headers)).status_code == 400
+    assert (await client.post(f"/favorites/{missing}", headers=auth_headers)).status_code == 400
+    assert (await client.get(f"/posts/{post_id}")).json()["favorites_count"] == 1
+
+    assert (await client.delete(f"/favorites/{post_id}", headers=auth_headers)).status_code == 200
+    assert (await client.delete(f"/favorites/{post_id}", headers=auth_headers)).status_code == 404
+    assert (await client.get(f"/posts/{post_id}")).json()["favorites_count"] == 0
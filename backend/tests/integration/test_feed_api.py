@@ -0,0 +1,91 @@
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+
+from src.core.security import create_access_token
+from src.infrastructure.database.models import User as UserORM
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+async def follower_headers(test_session):
+    follower = UserORM(
+        id=uuid4(),
+        email=f"follower-{uuid4().hex[:8]}@example.com",
+        login=f"follower-{uuid4().hex[:8]}",
+        password_hash="hash",
+    )
+    test_session.add(follower)
+    await test_session.commit()
+
+    token = create_access_token(data={"sub": str(follower.id)})
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.mark.asyncio
+async def test_feed_contains_followed_posts(
+    client: AsyncClient, test_user, auth_headers, follower_headers
+):
+    await client.post("/posts", headers=auth_headers, json={"title": "Before", "content": "C"})
+
+    response = await client.post(f"/users/{test_user.id}/follow", headers=follower_headers)
+    assert response.status_code == 200
+
+    await client.post("/posts", headers=auth_headers, json={"title": "After", "content": "C"})
+
+    response = await client.get("/feed", headers=follower_headers)
+
+    assert response.status_code == 200
+    titles = [post["title"] for post in response.json()]
+    assert titles[:2] == ["After", "Before"]
+
+
+@pytest.mark.asyncio
+async def test_unfollow_clears_feed(client: AsyncClient, test_user, auth_headers, follower_headers):
+    await client.post(f"/users/{test_user.id}/follow", headers=follower_headers)
+    await client.post("/posts", headers=auth_headers, json={"title": "Post", "content": "C"})
+
+    response = await client.delete(f"/users/{test_user.id}/follow", headers=follower_headers)
+    assert response.status_code == 200
+
+    response = await client.get("/feed", headers=follower_headers)
+    assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_follow_yourself(client: AsyncClient, test_user, auth_headers):
+    response = await client.post(f"/users/{test_user.id}/follow", headers=auth_headers)
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_feed_keeps_pulled_posts_when_author_returns_to_push(
+    client: AsyncClient, test_user, auth_headers, follower_headers, test_session, monkeypatch
+):
+    from src.core.settings import settings
+    from src.infrastructure.jobs.timeline_modes import sync_timeline_modes
+
+    monkeypatch.setattr(settings, "timeline_fanout_limit", 1)
+    monkeypatch.setattr(settings, "timeline_fanout_resume_limit", 1)
+    monkeypatch.setattr(settings, "timeline_backfill_batch_size", 1)
+    other = UserORM(id=uuid4(), email="other@example.com", login="other", password_hash="hash")
+    test_session.add(other)
+    await test_session.commit()
+    other_headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(other.id)})}"}
+
+    await client.post(f"/users/{test_user.id}/follow", headers=follower_headers)
+    await client.post(f"/users/{test_user.id}/follow", headers=other_headers)
+    await client.post("/posts", headers=auth_headers, json={"title": "Pulled", "content": "C"})
+    await client.delete(f"/users/{test_user.id}/follow", headers=other_headers)
+
+    response = await client.get("/feed", headers=follower_headers)
+    assert [post["title"] for post in response.json()] == ["Pulled"]
+
+    assert await sync_timeline_modes(test_session) == 1
+    await client.post("/posts", headers=auth_headers, json={"title": "Pushed", "content": "C"})
+
+    response = await client.get("/feed", headers=follower_headers)
+    assert [post["title"] for post in response.json()] == ["Pushed", "Pulled"]
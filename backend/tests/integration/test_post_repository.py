@@ -0,0 +1,73 @@
+import pytest
+
+from src.application.favorite_cache import FavoriteMembershipCache
+from src.domain.models.posts import PostCreate
+from src.infrastructure.repositories.favorite_repository_impl import FavoriteRepositoryImpl
+from src.infrastructure.repositories.post_repository_impl import PostRepositoryImpl
+from src.infrastructure.repositories.rating_repository_impl import RatingRepositoryImpl
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_is_single_query(test_session, test_user, query_counter):
+    repo = PostRepositoryImpl(test_session)
+    user_id = str(test_user.id)
+    post = await repo.create(PostCreate(title="Test Post", content="Content"), user_id)
+    await RatingRepositoryImpl(test_session).set_rating(user_id, post.id, 1)
+    await FavoriteRepositoryImpl(test_session).add(user_id, post.id)
+
+    query_counter.clear()
+    result = await repo.get_by_id(post.id, user_id)
+
+    assert len(query_counter) == 1
+    assert result is not None
+    assert result.authorLogin == test_user.login
+    assert result.rating == 1
+    assert result.user_rating == 1
+    assert result.is_favorited is True
+
+    query_counter.clear()
+    anonymous = await repo.get_by_id(post.id)
+
+    assert len(query_counter) == 1
+    assert anonymous.user_rating is None
+    assert anonymous.is_favorited is False
+
+
+@pytest.mark.asyncio
+async def test_warm_favorites_cache_replaces_favorite_lookups(
+    test_session, test_user, query_counter
+):
+    favorites = FavoriteMembershipCache(max_ids=100, max_user_ids=10, ttl=60)
+    repo = PostRepositoryImpl(test_session, favorites)
+    favorite_repo = FavoriteRepositoryImpl(test_session, favorites)
+    user_id = str(test_user.id)
+    kept = await repo.create(PostCreate(title="Kept", content="Content"), user_id)
+    dropped = await repo.create(PostCreate(title="Dropped", content="Content"), user_id)
+    await favorite_repo.add(user_id, kept.id)
+    await favorite_repo.add(user_id, dropped.id)
+
+    await repo.get_many([kept.id], user_id)
+    await favorite_repo.remove(user_id, dropped.id)
+    added = await repo.create(PostCreate(title="Added", content="Content"), user_id)
+    await favorite_repo.add(user_id, added.id)
+
+    query_counter.clear()
+    posts = await repo.get_many(
+        [kept.id, dropped.id, added.id], user_id, frozenset({"id", "is_favorited"})
+    )
+
+    assert len(query_counter) == 1
+    assert {post_id: post.is_favorited for post_id, post in posts.items()} == {
+        kept.id: True,
+        dropped.id: False,
+        added.id: True,
+    }
+
+    query_counter.clear()
+    post = await repo.get_by_id(added.id, user_id)
+
+    assert len(query_counter) == 1
+    assert post.is_favorited is True
+    assert "EXISTS" not in query_counter[0].upper()
@@ -1,5 +1,12 @@
+from uuid import uuid4
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from src.core.security import create_access_token
+from src.domain.excerpt import EXCERPT_LENGTH
+from src.infrastructure.database.models import User as UserORM
 
 pytestmark = pytest.mark.integration
 
@@ -59,6 +66,26 @@ async def test_get_post_by_id(client: AsyncClient, test_user, auth_headers):
     assert data["title"] == "Test Post"
 
 
+@pytest.mark.asyncio
+async def test_list_returns_excerpt(client: AsyncClient, test_user, auth_headers):
+    content = "x" * (EXCERPT_LENGTH + 50)
+    create_response = await client.post(
+        "/posts", headers=auth_headers, json={"title": "Long Post", "content": content}
+    )
+    post_id = create_response.json()["id"]
+
+    response = await client.get("/posts")
+
+    listed = next(post for post in response.json() if post["id"] == post_id)
+    assert listed["content"] == content[:EXCERPT_LENGTH]
+    assert listed["content_truncated"] is True
+
+    response = await client.get(f"/posts/{post_id}")
+
+    assert response.json()["content"] == content
+    assert response.json()["content_truncated"] is False
+
+
 @pytest.mark.asyncio
 async def test_update_post(client: AsyncClient, test_user, auth_headers):
     # Create a post first
@@ -98,3 +125,214 @@ async def test_delete_post(client: AsyncClient, test_user, auth_headers):
     # Verify post is deleted
     get_response = await client.get(f"/posts/{post_id}")
     assert get_response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_delete_post_removes_its_rows_without_loading_them(
+    client: AsyncClient, test_user, auth_headers, test_session, query_counter
+):
+    from uuid import UUID
+
+    from src.infrastructure.database.models import Comment, Favorite, PostRating, PostTag, Tag
+
+    create_response = await client.post(
+        "/posts",
+        headers=auth_headers,
+        json={"title": "To Delete", "content": "Content", "tags": ["cascade"]},
+    )
+    post_id = create_response.json()["id"]
+    await client.post(f"/posts/{post_id}/comments", headers=auth_headers, json={"content": "Reply"})
+    await client.post(f"/favorites/{post_id}", headers=auth_headers)
+    test_session.add(PostRating(user_id=test_user.id, post_id=UUID(post_id), value=1))
+    await test_session.commit()
+
+    query_counter.clear()
+    response = await client.delete(f"/posts/{post_id}", headers=auth_headers)
+    assert response.status_code == 200
+
+    # The child rows are removed by the database, not loaded and deleted one by one.
+    for table in ("comments", "favorites", "post_ratings", "timeline_entries"):
+        assert not any(f"FROM {table}" in query for query in query_counter)
+
+    for model in (Comment, Favorite, PostRating, PostTag):
+        result = await test_session.execute(
+            select(func.count()).select_from(model).where(model.post_id == UUID(post_id))
+        )
+        assert result.scalar_one() == 0
+    tag = (await test_session.execute(select(Tag).where(Tag.name == "cascade"))).scalar_one()
+    await test_session.refresh(tag)
+    assert tag.post_count == 0
+
+
+@pytest.mark.asyncio
+async def test_list_posts_query_count_is_constant(
+    client: AsyncClient, test_user, auth_headers, query_counter
+):
+    async def create_posts(count: int):
+        for i in range(count):
+            response = await client.post(
+                "/posts", headers=auth_headers, json={"title": f"Post {i}", "content": "Content"}
+            )
+            await client.post(f"/favorites/{response.json()['id']}", headers=auth_headers)
+
+    await create_posts(2)
+    # the first render also loads the viewer's favorites into the membership cache
+    await client.get("/posts", headers=auth_headers)
+    query_counter.clear()
+    await client.get("/posts", headers=auth_headers)
+    small_feed_queries = len(query_counter)
+
+    await create_posts(5)
+    query_counter.clear()
+    response = await client.get("/posts", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert all(post["is_favorited"] for post in response.json())
+    assert len(query_counter) == small_feed_queries
+
+
+@pytest.mark.asyncio
+async def test_get_posts_not_modified(client: AsyncClient, test_user, auth_headers):
+    create_response = await client.post(
+        "/posts", headers=auth_headers, json={"title": "Test Post", "content": "Content"}
+    )
+    post_id = create_response.json()["id"]
+
+    response = await client.get("/posts")
+    etag = response.headers["ETag"]
+
+    not_modified = await client.get("/posts", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    await client.post(f"/posts/{post_id}/rate", headers=auth_headers, json={"value": 1})
+
+    modified = await client.get("/posts", headers={"If-None-Match": etag})
+    assert modified.status_code == 200
+    assert modified.headers["ETag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_get_posts_etag_follows_viewer_state(
+    client: AsyncClient, test_session, test_user, auth_headers
+):
+    other = UserORM(id=uuid4(), email="other@example.com", login="other", password_hash="hash")
+    test_session.add(other)
+    await test_session.commit()
+    other_headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(other.id)})}"}
+
+    create_response = await client.post(
+        "/posts", headers=auth_headers, json={"title": "Test Post", "content": "Content"}
+    )
+    post_id = create_response.json()["id"]
+    await client.post(f"/favorites/{post_id}", headers=other_headers)
+    await client.post(f"/posts/{post_id}/rate", headers=other_headers, json={"value": 1})
+
+    response = await client.get("/posts", headers=auth_headers)
+    etag = response.headers["ETag"]
+
+    # The totals stay the same; only the viewer's own vote and favorite change.
+    await client.delete(f"/favorites/{post_id}", headers=other_headers)
+    await client.post(f"/favorites/{post_id}", headers=auth_headers)
+    await client.post(f"/posts/{post_id}/rate", headers=other_headers, json={"value": 0})
+    await client.post(f"/posts/{post_id}/rate", headers=auth_headers, json={"value": 1})
+
+    modified = await client.get("/posts", headers={**auth_headers, "If-None-Match": etag})
+    assert modified.status_code == 200
+    assert modified.json()[0]["is_favorited"] is True
+    assert modified.json()[0]["user_rating"] == 1
+
+
+@pytest.mark.asyncio
+async def test_list_posts_sparse_fields(
+    client: AsyncClient, test_user, auth_headers, query_counter
+):
+    await client.post("/posts", headers=auth_headers, json={"title": "Sparse", "content": "C"})
+    await client.get("/posts", headers=auth_headers)
+
+    query_counter.clear()
+    response = await client.get("/posts", headers=auth_headers, params={"fields": "title,rating"})
+    sparse_queries = len(query_counter)
+
+    assert response.status_code == 200
+    assert set(response.json()[0]) == {"id", "title", "rating"}
+
+    query_counter.clear()
+    await client.get("/posts", headers=auth_headers)
+
+    # the viewer-state lookup is skipped when no viewer field is requested
+    assert sparse_queries == len(query_counter) - 1
+
+
+@pytest.mark.asyncio
+async def test_list_posts_unknown_field(client: AsyncClient):
+    response = await client.get("/posts", params={"fields": "title,secret"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_posts_batch(client: AsyncClient, test_user, auth_headers, query_counter):
+    post_ids = []
+    for i in range(3):
+        response = await client.post(
+            "/posts", headers=auth_headers, json={"title": f"Batch {i}", "content": "C"}
+        )
+        post_ids.append(response.json()["id"])
+    missing_id = "00000000-0000-0000-0000-000000000000"
+
+    query_counter.clear()
+    response = await client.post(
+        "/posts/batch", json={"ids": [post_ids[2], missing_id, post_ids[0], post_ids[1]]}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [post["title"] for post in data["items"]] == ["Batch 2", "Batch 0", "Batch 1"]
+    assert data["missing"] == [missing_id]
+    assert len(query_counter) == 1
+
+
+@pytest.mark.asyncio
+async def test_search_posts_ranks_and_paginates(client: AsyncClient, test_user, auth_headers):
+    for title, content in [
+        ("Zebrafish care", "Tanks"),
+        ("Breeding zebrafish", "Eggs"),
+        ("Aquarium notes", "A zebrafish is small"),
+    ]:
+        await client.post("/posts", headers=auth_headers, json={"title": title, "content": content})
+
+    response = await client.get("/search/posts", params={"q": "zebrafish", "limit": 2})
+
+    assert response.status_code == 200
+    first_page = response.json()
+    assert {post["title"] for post in first_page} == {"Zebrafish care", "Breeding zebrafish"}
+
+    response = await client.get(
+        "/search/posts",
+        params={"q": "zebrafish", "limit": 2, "cursor": response.headers["X-Next-Cursor"]},
+    )
+
+    assert [post["title"] for post in response.json()] == ["Aquarium notes"]
+    assert "X-Next-Cursor" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_search_cache_is_invalidated_by_new_posts(
+    client: AsyncClient, test_user, auth_headers
+):
+    await client.post(
+        "/posts", headers=auth_headers, json={"title": "Quokka facts", "content": "Smiles"}
+    )
+
+    first = await client.get("/search/posts", params={"q": "Quokka"})
+    repeated = await client.get("/search/posts", params={"q": "  quokka "})
+
+    assert repeated.json() == first.json()
+
+    await client.post(
+        "/posts", headers=auth_headers, json={"title": "Quokka photos", "content": "More"}
+    )
+    response = await client.get("/search/posts", params={"q": "quokka"})
+
+    assert {post["title"] for post in response.json()} == {"Quokka facts", "Quokka photos"}
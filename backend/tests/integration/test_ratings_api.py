@@ -1,5 +1,15 @@
+from uuid import UUID
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select, update
+
+from src.application.post_cache import post_read_cache
+from src.application.rating_buffer import RatingBuffer
+from src.domain.ranking import hot_score
+from src.infrastructure.database.models import Post
+from src.infrastructure.jobs.post_counters import rebuild_post_counters
+from src.infrastructure.jobs.rating_buffer import flush_rating_buffer
 
 pytestmark = pytest.mark.integration
 
@@ -56,3 +66,155 @@ async def test_remove_rating(client: AsyncClient, test_user, auth_headers):
     data = response.json()
     assert data["status"] == "removed"
     assert data["value"] == 0
+
+
+@pytest.mark.asyncio
+async def test_post_counters_follow_writes(client: AsyncClient, test_user, auth_headers):
+    post_response = await client.post(
+        "/posts", headers=auth_headers, json={"title": "Test Post", "content": "Content"}
+    )
+    post_id = post_response.json()["id"]
+
+    await client.post(f"/posts/{post_id}/rate", headers=auth_headers, json={"value": 1})
+    await client.post(f"/posts/{post_id}/rate", headers=auth_headers, json={"value": -1})
+    await client.post(f"/posts/{post_id}/comments", headers=auth_headers, json={"content": "Hi"})
+    await client.post(f"/favorites/{post_id}", headers=auth_headers)
+
+    data = (await client.get(f"/posts/{post_id}")).json()
+
+    assert data["rating"] == -1
+    assert data["comments_count"] == 1
+    assert data["favorites_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_rebuild_post_counters_repairs_hot_score(
+    client: AsyncClient, test_session, test_user, auth_headers
+):
+    post_response = await client.post(
+        "/posts", headers=auth_headers, json={"title": "Test Post", "content": "Content"}
+    )
+    post_id = UUID(post_response.json()["id"])
+    await client.post(f"/posts/{post_id}/rate", headers=auth_headers, json={"value": 1})
+
+    await test_session.execute(
+        update(Post).where(Post.id == post_id).values(rating_sum=7, hot_score=0.0)
+    )
+    await test_session.commit()
+    await rebuild_post_counters(test_session)
+
+    row = (
+        await test_session.execute(
+            select(Post.rating_sum, Post.hot_score, Post.created_at).where(Post.id == post_id)
+        )
+    ).one()
+    assert row.rating_sum == 1
+    assert row.hot_score == pytest.approx(hot_score(1, row.created_at), abs=1e-6)
+
+
+@pytest.mark.asyncio
+async def test_rate_returns_new_total(client: AsyncClient, test_user, auth_headers):
+    post_response = await client.post(
+        "/posts", headers=auth_headers, json={"title": "Test Post", "content": "Content"}
+    )
+    post_id = post_response.json()["id"]
+
+    totals = []
+    for value in (1, 1, -1, 0, 0):
+        response = await client.post(
+            f"/posts/{post_id}/rate", headers=auth_headers, json={"value": value}
+        )
+        totals.append((response.json()["rating"], response.json()["user_rating"]))
+
+    assert totals == [(1, 1), (1, 1), (-1, -1), (0, None), (0, None)]
+    assert (await client.get(f"/posts/{post_id}")).json()["rating"] == 0
+
+
+@pytest.mark.asyncio
+async def test_rate_missing_post(client: AsyncClient, test_user, auth_headers):
+    response = await client.post(
+        "/posts/00000000-0000-0000-0000-000000000000/rate", headers=auth_headers, json={"value": 1}
+    )
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_buffered_votes_flush_as_one_batch(
+    client: AsyncClient, test_session, test_user, auth_headers, tmp_path
+):
+    post_response = await client.post(
+        "/posts", headers=auth_headers, json={"title": "Test Post", "content": "Content"}
+    )
+    post_id = post_response.json()["id"]
+    other_id = (
+        await client.post("/posts", headers=auth_headers, json={"title": "Other", "content": "C"})
+    ).json()["id"]
+    user_id = str(test_user.id)
+    await client.post(f"/posts/{other_id}/rate", headers=auth_headers, json={"value": 1})
+
+    buffer = RatingBuffer(str(tmp_path / "votes.log"), 100)
+    await buffer.add(user_id, post_id, 1)
+    await buffer.add(user_id, post_id, -1)
+    await buffer.add(user_id, other_id, 0)
+    await buffer.add(user_id, "00000000-0000-0000-0000-000000000000", 1)
+
+    assert await flush_rating_buffer(test_session, buffer, post_read_cache) == 3
+    assert len(buffer) == 0
+    assert (await client.get(f"/posts/{post_id}")).json()["rating"] == -1
+    assert (await client.get(f"/posts/{other_id}")).json()["rating"] == 0
+
+    await buffer.add(user_id, post_id, 1)
+    await flush_rating_buffer(test_session, buffer, post_read_cache)
+
+    assert (await client.get(f"/posts/{post_id}")).json()["rating"] == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_ratings_read_and_write(client: AsyncClient, test_user, auth_headers):
+    post_ids = []
+    for title in ("First", "Second", "Third"):
+        response = await client.post(
+            "/posts", headers=auth_headers, json={"title": title, "content": "Content"}
+        )
+        post_ids.append(response.json()["id"])
+    first, second, third = post_ids
+    missing = "00000000-0000-0000-0000-000000000000"
+    await client.post(f"/posts/{third}/rate", headers=auth_headers, json={"value": 1})
+
+    response = await client.post(
+        "/ratings/batch",
+        headers=auth_headers,
+        json={
+            "votes": [
+                {"post_id": first, "value": 1},
+                {"post_id": second, "value": -1},
+                {"post_id": third, "value": 0},
+                {"post_id": missing, "value": 1},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [(item["post_id"], item["rating"], item["user_rating"]) for item in data["items"]] == [
+        (first, 1, 1),
+        (second, -1, -1),
+        (third, 0, None),
+    ]
+    assert data["missing"] == [missing]
+
+    response = await client.get(
+        "/ratings", headers=auth_headers, params={"post_ids": f"{second},{first},not-a-uuid"}
+    )
+
+    data = response.json()
+    assert [(item["post_id"], item["user_rating"]) for item in data["items"]] == [
+        (second, -1),
+        (first, 1),
+    ]
+    assert data["missing"] == ["not-a-uuid"]
+
+    anonymous = (await client.get("/ratings", params={"post_ids": first})).json()
+    assert anonymous["items"][0] == {"post_id": first, "rating": 1, "user_rating": None}
+    assert (await client.get(f"/posts/{second}")).json()["rating"] == -1
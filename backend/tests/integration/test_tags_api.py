@@ -0,0 +1,45 @@
+import pytest
+from httpx import AsyncClient
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.asyncio
+async def test_tag_feed_paginates_tagged_posts(client: AsyncClient, auth_headers):
+    for i in range(3):
+        await client.post(
+            "/posts",
+            headers=auth_headers,
+            json={"title": f"Tagged {i}", "content": "C", "tags": ["#Python"]},
+        )
+    await client.post("/posts", headers=auth_headers, json={"title": "Untagged", "content": "C"})
+
+    response = await client.get("/tags/python/posts", params={"limit": 2})
+    assert response.status_code == 200
+    assert [post["title"] for post in response.json()] == ["Tagged 2", "Tagged 1"]
+
+    cursor = response.headers["X-Next-Cursor"]
+    response = await client.get("/tags/python/posts", params={"limit": 2, "cursor": cursor})
+    assert [post["title"] for post in response.json()] == ["Tagged 0"]
+    assert response.json()[0]["tags"] == ["python"]
+
+
+@pytest.mark.asyncio
+async def test_tag_post_count_follows_updates(client: AsyncClient, auth_headers):
+    response = await client.post(
+        "/posts", headers=auth_headers, json={"title": "T", "content": "C", "tags": ["a", "b"]}
+    )
+    post_id = response.json()["id"]
+
+    await client.put(
+        f"/posts/{post_id}",
+        headers=auth_headers,
+        json={"title": "T", "content": "C", "tags": ["b"]},
+    )
+
+    assert (await client.get("/tags/a")).json()["post_count"] == 0
+    assert (await client.get("/tags/b")).json()["post_count"] == 1
+
+    await client.delete(f"/posts/{post_id}", headers=auth_headers)
+
+    assert (await client.get("/tags/b")).json()["post_count"] == 0
@@ -58,3 +58,166 @@ async def test_delete_other_user(client: AsyncClient, test_user, auth_headers):
     response = await client.delete(f"/users/{other_user_id}", headers=auth_headers)
 
     assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_search_users_limit_and_cursor(client: AsyncClient, test_session):
+    from uuid import uuid4
+
+    from src.infrastructure.database.models import User as UserORM
+
+    for login in ["blue_heron", "heron", "heronry_fan"]:
+        test_session.add(
+            UserORM(id=uuid4(), email=f"{login}@example.com", login=login, password_hash="x")
+        )
+    await test_session.commit()
+
+    response = await client.get("/search/users", params={"q": "heron", "limit": 2})
+
+    assert response.status_code == 200
+    first_page = [user["login"] for user in response.json()]
+    assert len(first_page) == 2
+    assert first_page[0] == "heron"
+
+    response = await client.get(
+        "/search/users",
+        params={"q": "heron", "limit": 2, "cursor": response.headers["X-Next-Cursor"]},
+    )
+
+    second_page = [user["login"] for user in response.json()]
+    assert set(first_page + second_page) == {"blue_heron", "heron", "heronry_fan"}
+    assert "X-Next-Cursor" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_tracks_registration_and_profile_updates(client: AsyncClient):
+    response = await client.post(
+        "/users",
+        json={"email": "mention@example.com", "login": "mentionee", "password": "password123"},
+    )
+    user_id = response.json()["id"]
+
+    response = await client.get("/search/users/autocomplete", params={"prefix": "@Mention"})
+
+    assert response.status_code == 200
+    assert {"login": "mentionee", "avatar_url": None} in response.json()
+
+    from src.core.security import create_access_token
+
+    token = create_access_token(data={"sub": user_id})
+    await client.put(
+        "/users/me",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"login": "renamed_mentionee"},
+    )
+
+    response = await client.get("/search/users/autocomplete", params={"prefix": "mentionee"})
+    assert "mentionee" not in [user["login"] for user in response.json()]
+    response = await client.get("/search/users/autocomplete", params={"prefix": "renamed_m"})
+    assert [user["login"] for user in response.json()] == ["renamed_mentionee"]
+
+
+@pytest.mark.asyncio
+async def test_delete_user_releases_counters_on_other_posts(
+    client: AsyncClient, test_user, auth_headers, test_session
+):
+    from uuid import uuid4
+
+    from src.infrastructure.database.models import (
+        Comment,
+        Favorite,
+        Post,
+        PostRating,
+        Subscription,
+        User as UserORM,
+    )
+
+    author = UserORM(
+        id=uuid4(),
+        email="author@example.com",
+        login="author",
+        password_hash="x",
+        followers_count=1,
+    )
+    post = Post(
+        id=uuid4(),
+        author_id=author.id,
+        title="Post",
+        content="Content",
+        rating_sum=2,
+        comments_count=3,
+        favorites_count=1,
+    )
+    author_id, post_id = author.id, post.id
+    test_session.add_all([author, post])
+    await test_session.flush()
+    test_session.add_all(
+        [
+            PostRating(user_id=test_user.id, post_id=post_id, value=1),
+            Comment(post_id=post_id, author_id=test_user.id, content="First"),
+            Comment(post_id=post_id, author_id=test_user.id, content="Second"),
+            Favorite(user_id=test_user.id, post_id=post_id),
+            Subscription(follower_id=test_user.id, following_id=author_id),
+        ]
+    )
+    await test_session.commit()
+
+    response = await client.delete(f"/users/{test_user.id}", headers=auth_headers)
+    assert response.status_code == 200
+
+    test_session.expire_all()
+    post = await test_session.get(Post, post_id)
+    author = await test_session.get(UserORM, author_id)
+    assert (post.rating_sum, post.comments_count, post.favorites_count) == (1, 1, 0)
+    assert author.followers_count == 0
+
+
+@pytest.mark.asyncio
+async def test_search_users_short_query_skips_substring_matches(client: AsyncClient, test_session):
+    from uuid import uuid4
+
+    from src.infrastructure.database.models import User as UserORM
+
+    for login in ["he", "Heron", "blue_heron", "h_x"]:
+        test_session.add(
+            UserORM(id=uuid4(), email=f"{login}@example.com", login=login, password_hash="x")
+        )
+    await test_session.commit()
+
+    response = await client.get("/search/users", params={"q": "he"})
+
+    assert response.status_code == 200
+    assert [user["login"] for user in response.json()] == ["he", "Heron"]
+
+    response = await client.get("/search/users", params={"q": "h_"})
+    assert [user["login"] for user in response.json()] == ["h_x"]
+
+
+@pytest.mark.asyncio
+async def test_delete_user_removes_their_posts(
+    client: AsyncClient, test_user, auth_headers, test_session
+):
+    from uuid import uuid4
+
+    from src.infrastructure.database.models import Comment, Post, PostRating, User as UserORM
+
+    reader = UserORM(id=uuid4(), email="reader@example.com", login="reader", password_hash="x")
+    post = Post(id=uuid4(), author_id=test_user.id, title="Post", content="Content")
+    reader_id, post_id = reader.id, post.id
+    test_session.add_all([reader, post])
+    await test_session.flush()
+    test_session.add_all(
+        [
+            Comment(post_id=post_id, author_id=reader_id, content="Reply"),
+            PostRating(user_id=reader_id, post_id=post_id, value=1),
+        ]
+    )
+    await test_session.commit()
+
+    response = await client.delete(f"/users/{test_user.id}", headers=auth_headers)
+    assert response.status_code == 200
+
+    test_session.expire_all()
+    assert await test_session.get(Post, post_id) is None
+    assert await test_session.get(PostRating, (reader_id, post_id)) is None
+    assert await test_session.get(UserORM, reader_id) is not None
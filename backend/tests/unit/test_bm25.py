@@ -0,0 +1,119 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from src.application.post_search_index import PostSearchIndex
+from src.core.pagination import decode_score_cursor
+from src.domain.bm25 import BM25Index, tokenize
+
+
+def test_tokenize_casefolds_unicode_words():
+    assert tokenize("Привет, World! FastAPI-2") == ["привет", "world", "fastapi", "2"]
+
+
+def test_search_ranks_by_bm25():
+    index = BM25Index()
+    index.add("a", "Python tips", "python python generators")
+    index.add("b", "Cooking", "a python appears once among many other words here")
+    index.add("c", "Cooking", "no match")
+
+    scores = index.search("python")
+
+    assert set(scores) == {"a", "b"}
+    assert scores["a"] > scores["b"]
+
+
+def test_title_terms_outweigh_content_terms():
+    index = BM25Index()
+    index.add("title", "asyncio", "intro")
+    index.add("body", "intro", "asyncio")
+
+    scores = index.search("asyncio")
+
+    assert scores["title"] > scores["body"]
+
+
+def test_add_replaces_and_remove_drops_document():
+    index = BM25Index()
+    index.add("a", "old title", "old body")
+    index.add("a", "new title", "new body")
+
+    assert index.search("old") == {}
+    assert set(index.search("new")) == {"a"}
+
+    assert index.remove("a") is True
+    assert index.remove("a") is False
+    assert index.search("new") == {}
+    assert len(index) == 0
+
+
+def test_edits_reuse_removed_slots():
+    index = BM25Index()
+    index.add("a", "first", "draft")
+    index.add("b", "other", "post")
+    for revision in range(10):
+        index.add("a", "first", f"draft revision{revision}")
+
+    assert len(index._doc_ids) == 2
+    assert set(index.search("revision9")) == {"a"}
+    assert index.search("revision8") == {}
+    assert set(index.search("post")) == {"b"}
+
+
+def test_segment_round_trip_preserves_scores():
+    index = BM25Index()
+    post_ids = [str(uuid4()) for _ in range(3)]
+    index.add(post_ids[0], "Ёжик в тумане", "мультфильм", 1.5)
+    index.add(post_ids[1], "Fog", "hedgehog in the fog", 2.5)
+    index.add(post_ids[2], "Removed", "fog", 3.5)
+    index.remove(post_ids[2])
+
+    loaded = BM25Index.from_segment(index.to_segment())
+
+    assert len(loaded) == 2
+    assert loaded.version(post_ids[1]) == 2.5
+    assert loaded.search("fog ёжик") == index.search("fog ёжик")
+    loaded.remove(post_ids[1])
+    assert loaded.search("fog") == {}
+
+
+def test_invalid_segment_raises_value_error():
+    with pytest.raises(ValueError):
+        BM25Index.from_segment(b"not a segment")
+
+
+def test_post_search_index_paginates_with_score_cursor(tmp_path):
+    search_index = PostSearchIndex(str(tmp_path / "index.seg"))
+    post_ids = [str(uuid4()) for _ in range(3)]
+    for repeat, post_id in enumerate(post_ids, start=1):
+        search_index.add(post_id, "Post", "rust " * repeat, datetime(2024, 1, 1))
+
+    first_page, cursor = search_index.search("rust", limit=2)
+    second_page, last_cursor = search_index.search("rust", 2, decode_score_cursor(cursor))
+
+    assert first_page + second_page == post_ids[::-1]
+    assert last_cursor is None
+
+
+async def test_post_search_index_save_and_load(tmp_path):
+    path = tmp_path / "segments" / "index.seg"
+    search_index = PostSearchIndex(str(path))
+    post_id = str(uuid4())
+    updated_at = datetime(2024, 5, 1, 12, 30)
+    search_index.add(post_id, "Saved", "segment", updated_at)
+
+    await search_index.save()
+    restored = PostSearchIndex(str(path))
+
+    assert search_index.dirty is False
+    assert restored.load() is True
+    assert restored.is_current(post_id, updated_at)
+    assert restored.search("segment", 10) == ([post_id], None)
+
+
+def test_post_search_index_load_missing_segment(tmp_path):
+    search_index = PostSearchIndex(str(tmp_path / "missing.seg"))
+
+    assert search_index.load() is False
+    assert len(search_index) == 0
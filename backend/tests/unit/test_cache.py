@@ -0,0 +1,60 @@
+from unittest.mock import patch
+
+from src.core.cache import ByteBudgetLRUCache, LRUCache
+
+
+def test_lru_cache_hit_and_miss():
+    cache = LRUCache(maxsize=2, ttl=60)
+
+    assert cache.get("a") is None
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lru_cache_expires_entries():
+    cache = LRUCache(maxsize=2, ttl=10)
+
+    with patch("src.core.cache.time.monotonic", return_value=100.0):
+        cache.set("a", 1)
+    with patch("src.core.cache.time.monotonic", return_value=111.0):
+        assert cache.get("a") is None
+
+    assert cache.stats()["expirations"] == 1
+    assert len(cache) == 0
+
+
+def test_byte_budget_cache_evicts_to_budget():
+    cache = ByteBudgetLRUCache(max_bytes=10)
+    cache.set("a", b"1234")
+    cache.set("b", b"5678")
+    cache.get("a")
+    cache.set("c", b"90ab")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1234"
+    assert cache.stats()["bytes"] == 8
+    assert cache.stats()["evictions"] == 1
+
+
+def test_byte_budget_cache_skips_oversized_values():
+    cache = ByteBudgetLRUCache(max_bytes=4)
+    cache.set("a", b"12345")
+
+    assert len(cache) == 0
+    assert cache.stats()["bytes"] == 0
@@ -1,21 +1,68 @@
+from datetime import datetime
 from unittest.mock import AsyncMock
+from uuid import uuid4
 
 import pytest
 from fastapi import HTTPException
 
 from src.application.comments_service import CommentsService
+from src.core.pagination import DEFAULT_PAGE_SIZE, PageCursor, encode_cursor
+from src.domain.models.posts import CommentPage
 
 
 @pytest.mark.asyncio
 async def test_get_comments(mock_comment_repository, sample_post_id, sample_comment_read):
     service = CommentsService(mock_comment_repository)
 
-    mock_comment_repository.get_by_post = AsyncMock(return_value=[sample_comment_read])
+    mock_comment_repository.get_by_post = AsyncMock(
+        return_value=CommentPage(items=[sample_comment_read])
+    )
 
-    results = await service.get_comments(sample_post_id)
+    page = await service.get_comments(sample_post_id)
 
-    assert len(results) == 1
-    mock_comment_repository.get_by_post.assert_called_once_with(sample_post_id)
+    assert len(page.items) == 1
+    mock_comment_repository.get_by_post.assert_called_once_with(
+        sample_post_id, DEFAULT_PAGE_SIZE, None, None
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_comments_decodes_cursor(mock_comment_repository, sample_post_id):
+    service = CommentsService(mock_comment_repository)
+    created_at = datetime(2024, 1, 1)
+    comment_uuid = uuid4()
+
+    mock_comment_repository.get_by_post = AsyncMock(return_value=CommentPage(items=[]))
+
+    await service.get_comments(sample_post_id, 10, encode_cursor(created_at, comment_uuid))
+
+    mock_comment_repository.get_by_post.assert_called_once_with(
+        sample_post_id, 10, PageCursor(created_at, comment_uuid), None
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_comments_invalid_cursor(mock_comment_repository, sample_post_id):
+    service = CommentsService(mock_comment_repository)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.get_comments(sample_post_id, cursor="not-a-cursor")
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_comments_etag_depends_on_page(mock_comment_repository, sample_post_id):
+    service = CommentsService(mock_comment_repository)
+
+    mock_comment_repository.get_comments_validators = AsyncMock(return_value=[])
+    cursor = encode_cursor(datetime(2024, 1, 1), uuid4())
+
+    first = await service.get_comments_etag(sample_post_id)
+    smaller = await service.get_comments_etag(sample_post_id, limit=1)
+    later = await service.get_comments_etag(sample_post_id, cursor=cursor)
+
+    assert len({first, smaller, later}) == 3
 
 
 @pytest.mark.asyncio
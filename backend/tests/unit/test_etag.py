@@ -0,0 +1,20 @@
+from src.core.etag import etag_matches, make_etag
+
+
+def test_make_etag_is_stable_and_weak():
+    etag = make_etag("post", 1, None)
+
+    assert etag == make_etag("post", 1, None)
+    assert etag != make_etag("post", 2, None)
+    assert etag.startswith('W/"')
+
+
+def test_etag_matches():
+    etag = make_etag("post", 1)
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {etag}', etag)
+    assert etag_matches(etag.removeprefix("W/"), etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"other"', etag)
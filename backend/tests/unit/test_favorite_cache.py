@@ -0,0 +1,60 @@
+from uuid import uuid4
+
+from src.application.favorite_cache import FavoriteMembershipCache
+
+
+def test_load_and_keep_current():
+    cache = FavoriteMembershipCache(max_ids=100, max_user_ids=10, ttl=60)
+    user_id, first, second = uuid4(), uuid4(), uuid4()
+
+    assert cache.get(user_id) is None
+    cache.load(user_id, [first], cache.version)
+    cache.add(user_id, second)
+    cache.discard(user_id, first)
+
+    assert cache.get(user_id) == {second}
+    assert cache.stats()["ids"] == 1
+
+
+def test_load_racing_a_write_is_dropped():
+    cache = FavoriteMembershipCache(max_ids=100, max_user_ids=10, ttl=60)
+    user_id = uuid4()
+    version = cache.version
+
+    cache.add(user_id, uuid4())
+
+    assert cache.load(user_id, [], version) is None
+    assert cache.get(user_id) is None
+
+
+def test_least_recently_used_users_are_evicted():
+    cache = FavoriteMembershipCache(max_ids=4, max_user_ids=4, ttl=60)
+    first, second, third = uuid4(), uuid4(), uuid4()
+    cache.load(first, [uuid4(), uuid4()], cache.version)
+    cache.load(second, [uuid4()], cache.version)
+    cache.get(first)
+
+    cache.load(third, [uuid4(), uuid4()], cache.version)
+
+    assert cache.get(second) is None
+    assert cache.get(first) is not None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["ids"] == 4
+
+
+def test_oversized_users_are_not_cached():
+    cache = FavoriteMembershipCache(max_ids=100, max_user_ids=2, ttl=60)
+    user_id = uuid4()
+
+    assert cache.load(user_id, [uuid4(), uuid4(), uuid4()], cache.version) is None
+    assert cache.should_load(user_id) is False
+    assert len(cache) == 0
+
+
+def test_entries_expire():
+    cache = FavoriteMembershipCache(max_ids=100, max_user_ids=10, ttl=0)
+    user_id = uuid4()
+    cache.load(user_id, [uuid4()], cache.version)
+
+    assert cache.get(user_id) is None
+    assert cache.stats()["ids"] == 0
@@ -1,21 +1,55 @@
+from datetime import datetime
 from unittest.mock import AsyncMock
+from uuid import uuid4
 
 import pytest
 from fastapi import HTTPException
 
 from src.application.favorites_service import FavoritesService
+from src.core.pagination import DEFAULT_PAGE_SIZE, PageCursor, encode_cursor
+from src.domain.models.posts import PostPage
 
 
 @pytest.mark.asyncio
 async def test_get_favorites(mock_favorite_repository, sample_user_id, sample_post_read):
     service = FavoritesService(mock_favorite_repository)
 
-    mock_favorite_repository.get_user_favorites = AsyncMock(return_value=[sample_post_read])
+    mock_favorite_repository.get_user_favorites = AsyncMock(
+        return_value=PostPage(items=[sample_post_read], next_cursor="next")
+    )
 
-    results = await service.get_favorites(sample_user_id)
+    page = await service.get_favorites(sample_user_id)
 
-    assert len(results) == 1
-    mock_favorite_repository.get_user_favorites.assert_called_once_with(sample_user_id)
+    assert len(page.items) == 1
+    assert page.next_cursor == "next"
+    mock_favorite_repository.get_user_favorites.assert_called_once_with(
+        sample_user_id, DEFAULT_PAGE_SIZE, None, None
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_favorites_decodes_cursor(mock_favorite_repository, sample_user_id):
+    service = FavoritesService(mock_favorite_repository)
+    favorited_at = datetime(2024, 1, 1)
+    post_uuid = uuid4()
+
+    mock_favorite_repository.get_user_favorites = AsyncMock(return_value=PostPage(items=[]))
+
+    await service.get_favorites(sample_user_id, 5, encode_cursor(favorited_at, post_uuid))
+
+    mock_favorite_repository.get_user_favorites.assert_called_once_with(
+        sample_user_id, 5, PageCursor(favorited_at, post_uuid), None
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_favorites_invalid_cursor(mock_favorite_repository, sample_user_id):
+    service = FavoritesService(mock_favorite_repository)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.get_favorites(sample_user_id, cursor="not-a-cursor")
+
+    assert exc_info.value.status_code == 400
 
 
 @pytest.mark.asyncio
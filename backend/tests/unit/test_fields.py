@@ -0,0 +1,17 @@
+import pytest
+
+from src.domain.fields import parse_fields
+from src.domain.models.posts import PostRead
+
+
+def test_parse_fields_none_means_all():
+    assert parse_fields(None, PostRead) is None
+
+
+def test_parse_fields_always_includes_id():
+    assert parse_fields("title, rating", PostRead) == {"id", "title", "rating"}
+
+
+def test_parse_fields_rejects_unknown():
+    with pytest.raises(ValueError, match="password"):
+        parse_fields("title,password", PostRead)
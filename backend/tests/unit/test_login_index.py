@@ -0,0 +1,52 @@
+from src.application.login_index import LoginIndex
+
+
+def make_index() -> LoginIndex:
+    index = LoginIndex()
+    index.rebuild(
+        [
+            ("1", "alice", "/static/uploads/alice.png"),
+            ("2", "Alfred", None),
+            ("3", "bob", None),
+            ("4", "al", None),
+        ]
+    )
+    return index
+
+
+def test_complete_returns_sorted_prefix_matches():
+    index = make_index()
+
+    suggestions = index.complete("AL")
+
+    assert [suggestion.login for suggestion in suggestions] == ["al", "Alfred", "alice"]
+    assert suggestions[2].avatar_url == "/static/uploads/alice.png"
+
+
+def test_complete_respects_limit_and_empty_prefix():
+    index = make_index()
+
+    assert [suggestion.login for suggestion in index.complete("a", limit=2)] == ["al", "Alfred"]
+    assert index.complete("") == []
+    assert index.complete("zed") == []
+
+
+def test_upsert_renames_and_remove_drops_user():
+    index = make_index()
+
+    index.upsert("3", "albert", "/static/uploads/albert.png")
+    index.remove("1")
+
+    assert [suggestion.login for suggestion in index.complete("al")] == [
+        "al",
+        "albert",
+        "Alfred",
+    ]
+    assert index.complete("bob") == []
+    assert len(index) == 3
+
+
+def test_suggestions_do_not_expose_email():
+    index = make_index()
+
+    assert index.complete("bob")[0].model_dump() == {"login": "bob", "avatar_url": None}
@@ -0,0 +1,53 @@
+import base64
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from src.core.pagination import (
+    PageCursor,
+    ScoreCursor,
+    decode_cursor,
+    encode_cursor,
+    encode_score_cursor,
+    parse_page_cursor,
+    parse_score_cursor,
+)
+
+
+def test_cursor_roundtrip():
+    created_at = datetime(2024, 5, 17, 12, 30, 45, 123456)
+    item_id = uuid4()
+
+    cursor = encode_cursor(created_at, item_id)
+
+    assert decode_cursor(cursor) == PageCursor(created_at, item_id)
+    assert "=" not in cursor
+
+
+@pytest.mark.parametrize("cursor", ["", "garbage", "bm90LWEtY3Vyc29y"])
+def test_decode_invalid_cursor(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_parse_cursors_for_requests():
+    item_id = uuid4()
+
+    assert parse_page_cursor(None) is None
+    assert parse_score_cursor(None) is None
+    assert parse_score_cursor(encode_score_cursor(1.5, item_id)) == ScoreCursor(1.5, item_id)
+    for parse in (parse_page_cursor, parse_score_cursor):
+        with pytest.raises(HTTPException) as exc_info:
+            parse("garbage")
+        assert exc_info.value.status_code == 400
+
+
+@pytest.mark.parametrize("score", ["nan", "inf", "-inf"])
+def test_parse_score_cursor_rejects_non_finite_scores(score):
+    cursor = base64.urlsafe_b64encode(f"{score}|{uuid4().hex}".encode()).decode()
+
+    with pytest.raises(HTTPException) as exc_info:
+        parse_score_cursor(cursor)
+    assert exc_info.value.status_code == 400
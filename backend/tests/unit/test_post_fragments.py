@@ -0,0 +1,28 @@
+import orjson
+
+from src.application.post_fragments import PostFragmentCache
+
+
+def test_render_matches_model_dump(sample_post_read):
+    cache = PostFragmentCache(max_bytes=1024 * 1024)
+    favorited = sample_post_read.model_copy(update={"is_favorited": True, "user_rating": 1})
+
+    rendered = cache.render([sample_post_read, favorited])
+
+    assert orjson.loads(rendered) == orjson.loads(
+        orjson.dumps([sample_post_read.model_dump(), favorited.model_dump()])
+    )
+    # the viewer-independent part is shared between the two viewers
+    assert cache.stats()["size"] == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_new_post_version_gets_new_fragment(sample_post_read):
+    cache = PostFragmentCache(max_bytes=1024 * 1024)
+    cache.render([sample_post_read])
+
+    rated = sample_post_read.model_copy(update={"rating": 5})
+    rendered = cache.render([rated])
+
+    assert orjson.loads(rendered)[0]["rating"] == 5
+    assert cache.stats()["misses"] == 2
@@ -1,10 +1,21 @@
 from unittest.mock import AsyncMock
+from uuid import UUID
 
 import pytest
 from fastapi import HTTPException
 
+from src.application.post_cache import PostReadCache
+from src.application.post_search_index import PostSearchIndex
 from src.application.posts_service import PostsService
-from src.domain.models.posts import PostCreateApi, PostUpdate
+from src.application.search_cache import SearchResultCache
+from src.core.pagination import (
+    DEFAULT_PAGE_SIZE,
+    decode_cursor,
+    decode_score_cursor,
+    encode_cursor,
+    encode_score_cursor,
+)
+from src.domain.models.posts import PostCreateApi, PostPage, PostUpdate
 
 
 @pytest.mark.asyncio
@@ -23,6 +34,32 @@ async def test_create_post_success(mock_post_repository, sample_user_id, sample_
     assert call_args[0][1] == sample_user_id  # author_id
 
 
+@pytest.mark.asyncio
+async def test_create_post_normalizes_tags(mock_post_repository, sample_user_id, sample_post_read):
+    service = PostsService(mock_post_repository)
+
+    mock_post_repository.create = AsyncMock(return_value=sample_post_read)
+
+    post_data = PostCreateApi(title="Test Post", content="Test content", tags=["#Python", "python"])
+
+    await service.create_post(post_data, sample_user_id)
+
+    assert mock_post_repository.create.call_args[0][0].tags == ["python"]
+
+
+@pytest.mark.asyncio
+async def test_create_post_invalid_tag(mock_post_repository, sample_user_id):
+    service = PostsService(mock_post_repository)
+
+    post_data = PostCreateApi(title="Test Post", content="Test content", tags=["no spaces"])
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.create_post(post_data, sample_user_id)
+
+    assert exc_info.value.status_code == 400
+    mock_post_repository.create.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_get_post_success(
     mock_post_repository, sample_post_id, sample_post_read, sample_user_id
@@ -53,12 +90,52 @@ async def test_get_post_not_found(mock_post_repository, sample_post_id):
 async def test_get_all_posts(mock_post_repository, sample_post_read):
     service = PostsService(mock_post_repository)
 
-    mock_post_repository.get_all = AsyncMock(return_value=[sample_post_read])
+    mock_post_repository.get_all = AsyncMock(return_value=PostPage(items=[sample_post_read]))
+
+    page = await service.get_all_posts()
+
+    assert len(page.items) == 1
+    assert page.next_cursor is None
+    mock_post_repository.get_all.assert_called_once_with(None, DEFAULT_PAGE_SIZE, None, "new", None)
+
+
+@pytest.mark.asyncio
+async def test_get_all_posts_with_cursor(mock_post_repository, sample_post_read):
+    service = PostsService(mock_post_repository)
+
+    mock_post_repository.get_all = AsyncMock(return_value=PostPage(items=[sample_post_read]))
+    cursor = encode_cursor(sample_post_read.createdAt, UUID(sample_post_read.id))
+
+    await service.get_all_posts(None, 10, cursor)
+
+    mock_post_repository.get_all.assert_called_once_with(
+        None, 10, decode_cursor(cursor), "new", None
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_all_posts_invalid_cursor(mock_post_repository):
+    service = PostsService(mock_post_repository)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.get_all_posts(None, 10, "not-a-cursor")
+
+    assert exc_info.value.status_code == 400
+    mock_post_repository.get_all.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_user_posts(mock_post_repository, sample_user_id, sample_post_read):
+    service = PostsService(mock_post_repository)
+
+    mock_post_repository.get_by_author = AsyncMock(
+        return_value=PostPage(items=[sample_post_read], next_cursor="next")
+    )
 
-    results = await service.get_all_posts()
+    page = await service.get_user_posts(sample_user_id, limit=5)
 
-    assert len(results) == 1
-    mock_post_repository.get_all.assert_called_once_with(None)
+    assert page.next_cursor == "next"
+    mock_post_repository.get_by_author.assert_called_once_with(sample_user_id, None, 5, None, None)
 
 
 @pytest.mark.asyncio
@@ -130,9 +207,226 @@ async def test_delete_post_not_author(mock_post_repository, sample_post_id, samp
 async def test_search_posts(mock_post_repository, sample_post_read):
     service = PostsService(mock_post_repository)
 
-    mock_post_repository.search = AsyncMock(return_value=[sample_post_read])
+    mock_post_repository.search = AsyncMock(
+        return_value=PostPage(items=[sample_post_read], next_cursor=None)
+    )
+
+    page = await service.search_posts("test")
+
+    assert len(page.items) == 1
+    mock_post_repository.search.assert_called_once_with("test", None, DEFAULT_PAGE_SIZE, None, None)
+
+
+@pytest.mark.asyncio
+async def test_search_posts_passes_score_cursor(mock_post_repository, sample_post_read):
+    service = PostsService(mock_post_repository)
+    cursor = encode_score_cursor(0.5, UUID(sample_post_read.id))
+
+    mock_post_repository.search = AsyncMock(return_value=PostPage(items=[], next_cursor=None))
+
+    await service.search_posts("test", limit=5, cursor=cursor)
+
+    mock_post_repository.search.assert_called_once_with(
+        "test", None, 5, decode_score_cursor(cursor), None
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_posts_invalid_cursor(mock_post_repository):
+    service = PostsService(mock_post_repository)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.search_posts("test", cursor="not-a-cursor")
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_search_posts_uses_search_index(
+    mock_post_repository, sample_user_id, sample_post_read, tmp_path
+):
+    search_index = PostSearchIndex(str(tmp_path / "index.seg"))
+    service = PostsService(mock_post_repository, search_index=search_index)
+
+    mock_post_repository.create = AsyncMock(return_value=sample_post_read)
+    mock_post_repository.get_many = AsyncMock(return_value={sample_post_read.id: sample_post_read})
+
+    await service.create_post(
+        PostCreateApi(title="Test Post", content="Test content"), sample_user_id
+    )
+    page = await service.search_posts("content")
+
+    assert page.items == [sample_post_read]
+    mock_post_repository.search.assert_not_called()
+    mock_post_repository.get_many.assert_called_once_with([sample_post_read.id], None, None)
+
+
+@pytest.mark.asyncio
+async def test_delete_post_removes_from_search_index(
+    mock_post_repository, sample_post_id, sample_user_id, sample_post_read, tmp_path
+):
+    search_index = PostSearchIndex(str(tmp_path / "index.seg"))
+    search_index.add(sample_post_id, "Test Post", "Test content", sample_post_read.updatedAt)
+    service = PostsService(mock_post_repository, search_index=search_index)
+
+    mock_post_repository.get_by_id = AsyncMock(return_value=sample_post_read)
+    mock_post_repository.delete = AsyncMock(return_value=True)
+
+    await service.delete_post(sample_post_id, sample_user_id)
+
+    assert search_index.search("content", DEFAULT_PAGE_SIZE) == ([], None)
+
+
+@pytest.mark.asyncio
+async def test_search_posts_cache_rehydrates_ids(
+    mock_post_repository, sample_user_id, sample_post_read
+):
+    search_cache = SearchResultCache(maxsize=10, ttl=60)
+    service = PostsService(mock_post_repository, search_cache=search_cache)
+
+    mock_post_repository.search = AsyncMock(
+        return_value=PostPage(items=[sample_post_read], next_cursor=None)
+    )
+    mock_post_repository.get_many = AsyncMock(return_value={sample_post_read.id: sample_post_read})
+
+    await service.search_posts("Test  Post")
+    page = await service.search_posts(" test post ", sample_user_id)
+
+    assert page.items == [sample_post_read]
+    mock_post_repository.search.assert_called_once_with(
+        "test post", None, DEFAULT_PAGE_SIZE, None, None
+    )
+    mock_post_repository.get_many.assert_called_once_with(
+        [sample_post_read.id], sample_user_id, None
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_post_invalidates_search_cache(
+    mock_post_repository, sample_user_id, sample_post_read
+):
+    search_cache = SearchResultCache(maxsize=10, ttl=60)
+    service = PostsService(mock_post_repository, search_cache=search_cache)
+
+    mock_post_repository.search = AsyncMock(return_value=PostPage(items=[], next_cursor=None))
+    mock_post_repository.create = AsyncMock(return_value=sample_post_read)
+
+    await service.search_posts("test")
+    await service.create_post(
+        PostCreateApi(title="Test Post", content="Test content"), sample_user_id
+    )
+    await service.search_posts("test")
+
+    assert mock_post_repository.search.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_post_anonymous_uses_cache(
+    mock_post_repository, sample_post_id, sample_post_read
+):
+    cache = PostReadCache(maxsize=10, ttl=60)
+    service = PostsService(mock_post_repository, cache)
+
+    mock_post_repository.get_by_id = AsyncMock(return_value=sample_post_read)
+
+    await service.get_post(sample_post_id)
+    result = await service.get_post(sample_post_id)
+
+    assert result == sample_post_read
+    mock_post_repository.get_by_id.assert_called_once_with(sample_post_id, None)
+    assert cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_post_authenticated_bypasses_cache(
+    mock_post_repository, sample_post_id, sample_user_id, sample_post_read
+):
+    cache = PostReadCache(maxsize=10, ttl=60)
+    service = PostsService(mock_post_repository, cache)
+
+    mock_post_repository.get_by_id = AsyncMock(return_value=sample_post_read)
+
+    await service.get_post(sample_post_id, sample_user_id)
+    await service.get_post(sample_post_id, sample_user_id)
+
+    assert mock_post_repository.get_by_id.call_count == 2
+    assert cache.stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_update_post_invalidates_cached_reads(
+    mock_post_repository, sample_post_id, sample_user_id, sample_post_read
+):
+    cache = PostReadCache(maxsize=10, ttl=60)
+    service = PostsService(mock_post_repository, cache)
+
+    mock_post_repository.get_by_id = AsyncMock(return_value=sample_post_read)
+    mock_post_repository.get_all = AsyncMock(return_value=PostPage(items=[sample_post_read]))
+    mock_post_repository.update = AsyncMock(return_value=sample_post_read)
+
+    await service.get_post(sample_post_id)
+    await service.get_all_posts()
+    await service.update_post(
+        sample_post_id, PostUpdate(title="New", content="New"), sample_user_id
+    )
+    await service.get_post(sample_post_id)
+    await service.get_all_posts()
+
+    assert mock_post_repository.get_all.call_count == 2
+    # two anonymous reads plus the ownership check in update_post
+    assert mock_post_repository.get_by_id.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_get_feed(mock_post_repository, sample_user_id, sample_post_read):
+    service = PostsService(mock_post_repository)
+
+    mock_post_repository.get_timeline = AsyncMock(return_value=PostPage(items=[sample_post_read]))
+
+    page = await service.get_feed(sample_user_id)
+
+    assert len(page.items) == 1
+    mock_post_repository.get_timeline.assert_called_once_with(
+        sample_user_id, DEFAULT_PAGE_SIZE, None, None
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_hot_posts_with_cursor(mock_post_repository, sample_post_read):
+    service = PostsService(mock_post_repository)
+
+    mock_post_repository.get_all = AsyncMock(return_value=PostPage(items=[sample_post_read]))
+    cursor = encode_score_cursor(12.5, UUID(sample_post_read.id))
+
+    await service.get_all_posts(None, 10, cursor, "hot")
+
+    mock_post_repository.get_all.assert_called_once_with(
+        None, 10, decode_score_cursor(cursor), "hot", None
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_tag_posts(mock_post_repository, sample_post_read):
+    service = PostsService(mock_post_repository)
+
+    mock_post_repository.get_by_tag = AsyncMock(return_value=PostPage(items=[sample_post_read]))
+
+    page = await service.get_tag_posts("Python")
+
+    assert len(page.items) == 1
+    mock_post_repository.get_by_tag.assert_called_once_with(
+        "python", None, DEFAULT_PAGE_SIZE, None, None
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_posts_batch_reports_missing(mock_post_repository, sample_post_read):
+    service = PostsService(mock_post_repository)
+
+    mock_post_repository.get_many = AsyncMock(return_value={"a": sample_post_read})
 
-    results = await service.search_posts("test")
+    batch = await service.get_posts_batch(["missing", "a", "a"])
 
-    assert len(results) == 1
-    mock_post_repository.search.assert_called_once_with("test", None)
+    assert batch.items == [sample_post_read]
+    assert batch.missing == ["missing"]
+    mock_post_repository.get_many.assert_called_once_with(["missing", "a"], None, None)
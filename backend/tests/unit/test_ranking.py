@@ -0,0 +1,18 @@
+from datetime import datetime, timedelta
+
+from src.domain.ranking import HOT_DECAY_SECONDS, hot_score
+
+
+def test_hot_score_prefers_higher_rating():
+    created_at = datetime(2024, 6, 1)
+
+    assert hot_score(10, created_at) > hot_score(1, created_at) > hot_score(-5, created_at)
+
+
+def test_hot_score_decays_with_age():
+    created_at = datetime(2024, 6, 1)
+    newer = created_at + timedelta(seconds=HOT_DECAY_SECONDS)
+
+    assert hot_score(0, newer) > hot_score(0, created_at)
+    # ten times the votes buys exactly one decay period
+    assert hot_score(1, newer) == hot_score(10, created_at)
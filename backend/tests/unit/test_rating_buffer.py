@@ -0,0 +1,129 @@
+import asyncio
+import os
+
+import pytest
+
+from src.application.rating_buffer import RatingBuffer
+
+
+def make_buffer(tmp_path, max_pending: int = 100) -> RatingBuffer:
+    return RatingBuffer(str(tmp_path / "votes.log"), max_pending)
+
+
+@pytest.mark.asyncio
+async def test_votes_collapse_to_last_value(tmp_path):
+    buffer = make_buffer(tmp_path)
+
+    await buffer.add("u1", "p1", 1)
+    await buffer.add("u1", "p1", -1)
+    await buffer.add("u2", "p1", 1)
+
+    assert len(buffer) == 2
+    assert buffer.pending("u1", "p1") == -1
+    assert await buffer.drain() == {("u1", "p1"): -1, ("u2", "p1"): 1}
+    assert len(buffer) == 0
+
+
+@pytest.mark.asyncio
+async def test_journal_is_replayed_after_crash(tmp_path):
+    buffer = make_buffer(tmp_path)
+    await buffer.add("u1", "p1", 1)
+    await buffer.add("u1", "p2", 0)
+    buffer.close()
+    with buffer.path.open("a") as journal:
+        journal.write("u2 p1")
+
+    restarted = make_buffer(tmp_path)
+
+    assert restarted.load() == 2
+    assert await restarted.drain() == {("u1", "p1"): 1, ("u1", "p2"): 0}
+
+
+@pytest.mark.asyncio
+async def test_in_flight_batch_is_replayed_until_committed(tmp_path):
+    buffer = make_buffer(tmp_path)
+    await buffer.add("u1", "p1", 1)
+    await buffer.drain()
+
+    assert make_buffer(tmp_path).load() == 1
+
+    committed = make_buffer(tmp_path)
+    committed.load()
+    committed.commit(await committed.drain())
+
+    assert make_buffer(tmp_path).load() == 0
+
+
+@pytest.mark.asyncio
+async def test_load_replays_journals_of_stopped_workers_only(tmp_path):
+    # pid_max on Linux is at most 2**22, so this pid never belongs to a live process.
+    stopped = tmp_path / f"votes.log.{2**22 + 1}"
+    stopped.write_text("u1 p1 1\n")
+    in_flight = tmp_path / f"votes.log.{2**22 + 1}.flushing"
+    in_flight.write_text("u1 p1 -1\nu2 p1 1\n")
+    os.utime(in_flight, (0, 0))
+    running = tmp_path / f"votes.log.{os.getppid()}"
+    running.write_text("u3 p1 1\n")
+
+    buffer = make_buffer(tmp_path)
+
+    assert buffer.path == tmp_path / f"votes.log.{os.getpid()}"
+    assert buffer.load() == 2
+    assert await buffer.drain() == {("u1", "p1"): 1, ("u2", "p1"): 1}
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        [running.name, buffer.flushing_path.name]
+    )
+
+
+@pytest.mark.asyncio
+async def test_restore_keeps_newer_votes(tmp_path):
+    buffer = make_buffer(tmp_path)
+    await buffer.add("u1", "p1", 1)
+    await buffer.add("u2", "p1", 1)
+    votes = await buffer.drain()
+    await buffer.add("u1", "p1", -1)
+
+    await buffer.restore(votes)
+    buffer.close()
+
+    assert await buffer.drain() == {("u1", "p1"): -1, ("u2", "p1"): 1}
+    assert make_buffer(tmp_path).load() == 2
+
+
+@pytest.mark.asyncio
+async def test_wait_returns_early_when_full(tmp_path):
+    buffer = make_buffer(tmp_path, max_pending=2)
+    await buffer.add("u1", "p1", 1)
+    await buffer.add("u2", "p1", 1)
+
+    await buffer.wait(60)
+
+    assert buffer.stats()["pending"] == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_votes_share_one_journal_sync(tmp_path, monkeypatch):
+    buffer = make_buffer(tmp_path)
+    batches = []
+    write = buffer._write
+    monkeypatch.setattr(buffer, "_write", lambda lines: batches.append(lines) or write(lines))
+
+    await asyncio.gather(*(buffer.add(f"u{i}", "p1", 1) for i in range(50)))
+
+    assert len(batches) == 1
+    assert len(buffer) == 50
+    assert make_buffer(tmp_path).load() == 50
+
+
+@pytest.mark.asyncio
+async def test_vote_is_not_accepted_when_the_journal_write_fails(tmp_path, monkeypatch):
+    buffer = make_buffer(tmp_path)
+
+    def fail(lines):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(buffer, "_write", fail)
+
+    with pytest.raises(OSError):
+        await buffer.add("u1", "p1", 1)
+    assert buffer.pending("u1", "p1") is None
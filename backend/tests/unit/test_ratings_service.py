@@ -3,19 +3,26 @@ from unittest.mock import AsyncMock
 import pytest
 from fastapi import HTTPException
 
+from src.application.post_cache import PostReadCache
+from src.application.rating_buffer import RatingBuffer
 from src.application.ratings_service import RatingsService
+from src.domain.models.posts import PostRatingState, RatingVote
 
 
 @pytest.mark.asyncio
 async def test_rate_post_positive(mock_rating_repository, sample_user_id, sample_post_id):
     service = RatingsService(mock_rating_repository)
 
-    mock_rating_repository.set_rating = AsyncMock()
+    mock_rating_repository.set_rating = AsyncMock(
+        return_value=PostRatingState(rating=5, user_rating=1)
+    )
 
     result = await service.rate_post(sample_user_id, sample_post_id, 1)
 
     assert result["status"] == "rated"
     assert result["value"] == 1
+    assert result["rating"] == 5
+    assert result["user_rating"] == 1
     mock_rating_repository.set_rating.assert_called_once_with(sample_user_id, sample_post_id, 1)
 
 
@@ -23,7 +30,9 @@ async def test_rate_post_positive(mock_rating_repository, sample_user_id, sample
 async def test_rate_post_negative(mock_rating_repository, sample_user_id, sample_post_id):
     service = RatingsService(mock_rating_repository)
 
-    mock_rating_repository.set_rating = AsyncMock()
+    mock_rating_repository.set_rating = AsyncMock(
+        return_value=PostRatingState(rating=-1, user_rating=-1)
+    )
 
     result = await service.rate_post(sample_user_id, sample_post_id, -1)
 
@@ -36,15 +45,29 @@ async def test_rate_post_negative(mock_rating_repository, sample_user_id, sample
 async def test_remove_rating(mock_rating_repository, sample_user_id, sample_post_id):
     service = RatingsService(mock_rating_repository)
 
-    mock_rating_repository.remove_rating = AsyncMock()
+    mock_rating_repository.remove_rating = AsyncMock(return_value=PostRatingState(rating=3))
 
     result = await service.rate_post(sample_user_id, sample_post_id, 0)
 
     assert result["status"] == "removed"
     assert result["value"] == 0
+    assert result["rating"] == 3
+    assert result["user_rating"] is None
     mock_rating_repository.remove_rating.assert_called_once_with(sample_user_id, sample_post_id)
 
 
+@pytest.mark.asyncio
+async def test_rate_missing_post(mock_rating_repository, sample_user_id, sample_post_id):
+    service = RatingsService(mock_rating_repository)
+
+    mock_rating_repository.set_rating = AsyncMock(return_value=None)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.rate_post(sample_user_id, sample_post_id, 1)
+
+    assert exc_info.value.status_code == 404
+
+
 @pytest.mark.asyncio
 async def test_rate_post_invalid_value(mock_rating_repository, sample_user_id, sample_post_id):
     service = RatingsService(mock_rating_repository)
@@ -66,3 +89,152 @@ async def test_rate_post_invalid_negative_value(
         await service.rate_post(sample_user_id, sample_post_id, -2)
 
     assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_buffered_rating_swaps_in_the_new_vote(
+    mock_rating_repository, sample_user_id, sample_post_id, tmp_path
+):
+    buffer = RatingBuffer(str(tmp_path / "votes.log"), 100)
+    service = RatingsService(mock_rating_repository, buffer=buffer)
+
+    mock_rating_repository.get_rating_state = AsyncMock(
+        return_value=PostRatingState(rating=4, user_rating=1)
+    )
+
+    result = await service.rate_post(sample_user_id, sample_post_id, -1)
+
+    assert result["rating"] == 2
+    assert result["user_rating"] == -1
+    assert buffer.pending(sample_user_id, sample_post_id) == -1
+    mock_rating_repository.set_rating.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_buffered_rating_reads_the_post_once_per_flush(
+    mock_rating_repository, sample_user_id, sample_post_id, tmp_path
+):
+    buffer = RatingBuffer(str(tmp_path / "votes.log"), 100)
+    service = RatingsService(mock_rating_repository, buffer=buffer)
+
+    mock_rating_repository.get_rating_state = AsyncMock(
+        return_value=PostRatingState(rating=4, user_rating=None)
+    )
+
+    await service.rate_post(sample_user_id, sample_post_id, 1)
+    result = await service.rate_post("other-user", sample_post_id, 1)
+
+    assert result["rating"] == 5
+    assert mock_rating_repository.get_rating_state.await_count == 1
+
+    buffer.commit(await buffer.drain())
+    await service.rate_post("third-user", sample_post_id, 1)
+
+    assert mock_rating_repository.get_rating_state.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_buffered_rating_missing_post(
+    mock_rating_repository, sample_user_id, sample_post_id, tmp_path
+):
+    buffer = RatingBuffer(str(tmp_path / "votes.log"), 100)
+    service = RatingsService(mock_rating_repository, buffer=buffer)
+
+    mock_rating_repository.get_rating_state = AsyncMock(return_value=None)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.rate_post(sample_user_id, sample_post_id, 1)
+
+    assert exc_info.value.status_code == 404
+    assert len(buffer) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_ratings_keeps_order_and_reports_missing(mock_rating_repository, sample_user_id):
+    service = RatingsService(mock_rating_repository)
+
+    mock_rating_repository.get_ratings = AsyncMock(
+        return_value={
+            "p2": PostRatingState(rating=3, user_rating=1),
+            "p1": PostRatingState(rating=0),
+        }
+    )
+
+    result = await service.get_ratings(["p1", "p3", "p2", "p1"], sample_user_id)
+
+    assert [item.post_id for item in result.items] == ["p1", "p2"]
+    assert result.items[1].user_rating == 1
+    assert result.missing == ["p3"]
+    mock_rating_repository.get_ratings.assert_called_once_with(["p1", "p3", "p2"], sample_user_id)
+
+
+@pytest.mark.asyncio
+async def test_get_ratings_rejects_too_many_ids(mock_rating_repository):
+    service = RatingsService(mock_rating_repository)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.get_ratings([str(number) for number in range(101)])
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_rate_posts_writes_last_vote_per_post_in_one_call(
+    mock_rating_repository, sample_user_id
+):
+    cache = PostReadCache(maxsize=10, ttl=60)
+    service = RatingsService(mock_rating_repository, cache)
+
+    mock_rating_repository.apply_ratings = AsyncMock(return_value=["p1"])
+    mock_rating_repository.get_ratings = AsyncMock(
+        return_value={"p1": PostRatingState(rating=0), "p2": PostRatingState(rating=2)}
+    )
+
+    result = await service.rate_posts(
+        sample_user_id,
+        [
+            RatingVote(post_id="p1", value=1),
+            RatingVote(post_id="p2", value=0),
+            RatingVote(post_id="p1", value=0),
+        ],
+    )
+
+    mock_rating_repository.apply_ratings.assert_called_once_with(
+        {(sample_user_id, "p1"): 0, (sample_user_id, "p2"): 0}
+    )
+    assert [item.post_id for item in result.items] == ["p1", "p2"]
+    assert cache.post_version("p1") > 0
+    assert cache.post_version("p2") == 0
+
+
+@pytest.mark.asyncio
+async def test_rate_posts_rejects_invalid_value(mock_rating_repository, sample_user_id):
+    service = RatingsService(mock_rating_repository)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.rate_posts(sample_user_id, [RatingVote(post_id="p1", value=5)])
+
+    assert exc_info.value.status_code == 400
+    mock_rating_repository.apply_ratings.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_buffered_batch_overlays_pending_votes(
+    mock_rating_repository, sample_user_id, tmp_path
+):
+    buffer = RatingBuffer(str(tmp_path / "votes.log"), 100)
+    service = RatingsService(mock_rating_repository, buffer=buffer)
+
+    mock_rating_repository.get_ratings = AsyncMock(
+        return_value={"p1": PostRatingState(rating=5, user_rating=1)}
+    )
+
+    result = await service.rate_posts(
+        sample_user_id, [RatingVote(post_id="p1", value=-1), RatingVote(post_id="p2", value=1)]
+    )
+
+    assert result.items[0].rating == 3
+    assert result.items[0].user_rating == -1
+    assert result.missing == ["p2"]
+    assert len(buffer) == 1
+    mock_rating_repository.apply_ratings.assert_not_called()
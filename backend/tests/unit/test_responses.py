@@ -0,0 +1,25 @@
+from datetime import datetime
+
+import orjson
+from fastapi import Response
+
+from src.api.responses import list_response
+from src.domain.models.posts import CommentRead
+
+
+def test_list_response_keeps_headers_and_fields():
+    comment = CommentRead.model_construct(
+        id="c1",
+        postId="p1",
+        authorId="u1",
+        authorLogin="alice",
+        content="Hello",
+        createdAt=datetime(2024, 1, 1),
+    )
+    response = Response()
+    response.headers["X-Next-Cursor"] = "abc"
+
+    result = list_response([comment], response, frozenset({"id", "createdAt"}))
+
+    assert result.headers["x-next-cursor"] == "abc"
+    assert orjson.loads(result.body) == [{"id": "c1", "createdAt": "2024-01-01T00:00:00"}]
@@ -0,0 +1,28 @@
+from src.application.search_cache import POSTS, USERS, SearchResultCache, normalize_query
+
+
+def test_normalize_query_casefolds_and_collapses_whitespace():
+    assert normalize_query("  Hello\tWORLD \n ") == "hello world"
+    assert normalize_query("Straße") == normalize_query("STRASSE")
+
+
+def test_bump_invalidates_only_its_kind():
+    cache = SearchResultCache(maxsize=10, ttl=60)
+    posts_key = cache.key(POSTS, "python", 20, None)
+    users_key = cache.key(USERS, "python", 20, None)
+    cache.set(posts_key, ["p1"], None)
+    cache.set(users_key, ["u1"], "cursor")
+
+    cache.bump(POSTS)
+
+    assert cache.get(cache.key(POSTS, "python", 20, None)) is None
+    assert cache.get(cache.key(USERS, "python", 20, None)) == (["u1"], "cursor")
+    assert cache.stats()["versions"] == {POSTS: 1, USERS: 0}
+
+
+def test_entries_expire_after_ttl():
+    cache = SearchResultCache(maxsize=10, ttl=0)
+    key = cache.key(POSTS, "python", 20, None)
+    cache.set(key, [], None)
+
+    assert cache.get(key) is None
@@ -0,0 +1,76 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from src.application.subscriptions_service import SubscriptionsService
+
+
+@pytest.mark.asyncio
+async def test_follow_success(
+    mock_subscription_repository, mock_user_repository, sample_user_id, sample_user_read
+):
+    service = SubscriptionsService(mock_subscription_repository, mock_user_repository)
+    follower_id = str(uuid4())
+
+    mock_user_repository.get_by_id = AsyncMock(return_value=sample_user_read)
+    mock_subscription_repository.follow = AsyncMock(return_value=True)
+
+    await service.follow(follower_id, sample_user_id)
+
+    mock_subscription_repository.follow.assert_called_once_with(follower_id, sample_user_id)
+
+
+@pytest.mark.asyncio
+async def test_follow_yourself(mock_subscription_repository, mock_user_repository, sample_user_id):
+    service = SubscriptionsService(mock_subscription_repository, mock_user_repository)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.follow(sample_user_id, sample_user_id)
+
+    assert exc_info.value.status_code == 400
+    mock_subscription_repository.follow.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_follow_unknown_user(
+    mock_subscription_repository, mock_user_repository, sample_user_id
+):
+    service = SubscriptionsService(mock_subscription_repository, mock_user_repository)
+
+    mock_user_repository.get_by_id = AsyncMock(return_value=None)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.follow(str(uuid4()), sample_user_id)
+
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_follow_already_following(
+    mock_subscription_repository, mock_user_repository, sample_user_id, sample_user_read
+):
+    service = SubscriptionsService(mock_subscription_repository, mock_user_repository)
+
+    mock_user_repository.get_by_id = AsyncMock(return_value=sample_user_read)
+    mock_subscription_repository.follow = AsyncMock(return_value=False)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.follow(str(uuid4()), sample_user_id)
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_unfollow_not_following(
+    mock_subscription_repository, mock_user_repository, sample_user_id
+):
+    service = SubscriptionsService(mock_subscription_repository, mock_user_repository)
+
+    mock_subscription_repository.unfollow = AsyncMock(return_value=False)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.unfollow(str(uuid4()), sample_user_id)
+
+    assert exc_info.value.status_code == 404
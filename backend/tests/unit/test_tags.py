@@ -0,0 +1,17 @@
+import pytest
+
+from src.domain.tags import MAX_TAGS_PER_POST, normalize_tags
+
+
+def test_normalize_tags_lowercases_and_dedupes():
+    assert normalize_tags(["#Python", " web ", "python", ""]) == ["python", "web"]
+
+
+def test_normalize_tags_rejects_invalid_names():
+    with pytest.raises(ValueError):
+        normalize_tags(["two words"])
+
+
+def test_normalize_tags_limits_count():
+    with pytest.raises(ValueError):
+        normalize_tags([f"tag{i}" for i in range(MAX_TAGS_PER_POST + 1)])
@@ -0,0 +1,31 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import HTTPException
+
+from src.application.tags_service import TagsService
+from src.domain.models.posts import TagRead
+
+
+@pytest.mark.asyncio
+async def test_get_tag_success():
+    repository = AsyncMock()
+    repository.get_by_name = AsyncMock(return_value=TagRead(name="python", post_count=3))
+    service = TagsService(repository)
+
+    tag = await service.get_tag("Python")
+
+    assert tag.post_count == 3
+    repository.get_by_name.assert_called_once_with("python")
+
+
+@pytest.mark.asyncio
+async def test_get_tag_not_found():
+    repository = AsyncMock()
+    repository.get_by_name = AsyncMock(return_value=None)
+    service = TagsService(repository)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.get_tag("missing")
+
+    assert exc_info.value.status_code == 404
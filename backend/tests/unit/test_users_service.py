@@ -1,10 +1,16 @@
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock
+from uuid import UUID
 
 import pytest
 from fastapi import HTTPException
 
+from src.application.post_cache import PostReadCache
+from src.application.post_search_index import PostSearchIndex
+from src.application.search_cache import SearchResultCache
 from src.application.users_service import UsersService
-from src.domain.models.users import UserCreateApi, UserProfileUpdate, UserPublic
+from src.core.pagination import DEFAULT_PAGE_SIZE, ScoreCursor, encode_score_cursor
+from src.domain.models.users import UserCreateApi, UserPage, UserProfileUpdate, UserPublic
 
 
 @pytest.mark.asyncio
@@ -175,10 +181,95 @@ async def test_delete_user_not_found(mock_user_repository, mock_password_hasher,
 async def test_search_users(mock_user_repository, mock_password_hasher, sample_user_public):
     service = UsersService(mock_user_repository, mock_password_hasher)
 
-    mock_user_repository.search = AsyncMock(return_value=[sample_user_public])
+    mock_user_repository.search = AsyncMock(
+        return_value=UserPage(items=[sample_user_public], next_cursor=None)
+    )
 
-    results = await service.search_users("test")
+    page = await service.search_users("test")
 
-    assert len(results) == 1
-    assert results[0].login == "testuser"
-    mock_user_repository.search.assert_called_once_with("test")
+    assert len(page.items) == 1
+    assert page.items[0].login == "testuser"
+    mock_user_repository.search.assert_called_once_with("test", DEFAULT_PAGE_SIZE, None, None)
+
+
+@pytest.mark.asyncio
+async def test_search_users_passes_score_cursor(
+    mock_user_repository, mock_password_hasher, sample_user_id
+):
+    service = UsersService(mock_user_repository, mock_password_hasher)
+    cursor = encode_score_cursor(0.25, UUID(sample_user_id))
+
+    mock_user_repository.search = AsyncMock(return_value=UserPage(items=[], next_cursor=None))
+
+    await service.search_users("test", limit=5, cursor=cursor)
+
+    mock_user_repository.search.assert_called_once_with(
+        "test", 5, ScoreCursor(0.25, UUID(sample_user_id)), None
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_users_invalid_cursor(mock_user_repository, mock_password_hasher):
+    service = UsersService(mock_user_repository, mock_password_hasher)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.search_users("test", cursor="garbage")
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_search_users_cache_rehydrates_ids(
+    mock_user_repository, mock_password_hasher, sample_user_public
+):
+    search_cache = SearchResultCache(maxsize=10, ttl=60)
+    service = UsersService(mock_user_repository, mock_password_hasher, search_cache)
+
+    mock_user_repository.search = AsyncMock(
+        return_value=UserPage(items=[sample_user_public], next_cursor=None)
+    )
+    mock_user_repository.get_many = AsyncMock(
+        return_value={sample_user_public.id: sample_user_public}
+    )
+
+    await service.search_users("Test")
+    page = await service.search_users("test")
+
+    assert page.items == [sample_user_public]
+    mock_user_repository.search.assert_called_once()
+    mock_user_repository.get_many.assert_called_once_with([sample_user_public.id], None)
+
+
+@pytest.mark.asyncio
+async def test_delete_user_invalidates_user_and_post_searches(
+    mock_user_repository, mock_password_hasher, sample_user_id
+):
+    search_cache = SearchResultCache(maxsize=10, ttl=60)
+    service = UsersService(mock_user_repository, mock_password_hasher, search_cache)
+
+    mock_user_repository.delete = AsyncMock(return_value=True)
+
+    await service.delete_user(sample_user_id, sample_user_id)
+
+    assert search_cache.stats()["versions"] == {"posts": 1, "users": 1}
+
+
+@pytest.mark.asyncio
+async def test_delete_user_unindexes_and_evicts_their_posts(
+    mock_user_repository, mock_password_hasher, sample_user_id, sample_post_id, tmp_path
+):
+    cache = PostReadCache(maxsize=10, ttl=60)
+    search_index = PostSearchIndex(str(tmp_path / "index.seg"))
+    search_index.add(sample_post_id, "Test Post", "Test content", datetime.now(UTC))
+    service = UsersService(
+        mock_user_repository, mock_password_hasher, cache=cache, search_index=search_index
+    )
+
+    mock_user_repository.get_post_ids = AsyncMock(return_value=[sample_post_id])
+    mock_user_repository.delete = AsyncMock(return_value=True)
+
+    await service.delete_user(sample_user_id, sample_user_id)
+
+    assert search_index.search("content", DEFAULT_PAGE_SIZE) == ([], None)
+    assert cache.post_version(sample_post_id) > 0
+    mock_user_repository.get_post_ids.assert_called_once_with(sample_user_id)
@@ -30,6 +30,13 @@ api.interceptors.response.use(
   }
 );
 
+const toPage = (response) => ({
+  items: response.data,
+  nextCursor: response.headers['x-next-cursor'] || null,
+});
+
+const cursorParams = (cursor) => (cursor ? { cursor } : {});
+
 export const authAPI = {
   login: async (username, password) => {
     const formData = new URLSearchParams();
@@ -64,21 +71,21 @@ export const usersAPI = {
     return response.data;
   },
   
-  getUserPosts: async (userId) => {
-    const response = await api.get(`/users/${userId}/posts`);
-    return response.data;
+  getUserPosts: async (userId, cursor) => {
+    const response = await api.get(`/users/${userId}/posts`, { params: cursorParams(cursor) });
+    return toPage(response);
   },
 };
 
 export const postsAPI = {
-  getAll: async () => {
-    const response = await api.get('/posts');
-    return response.data;
+  getAll: async (cursor) => {
+    const response = await api.get('/posts', { params: cursorParams(cursor) });
+    return toPage(response);
   },
   
-  getMy: async () => {
-    const response = await api.get('/posts/my');
-    return response.data;
+  getMy: async (cursor) => {
+    const response = await api.get('/posts/my', { params: cursorParams(cursor) });
+    return toPage(response);
   },
   
   getOne: async (postId) => {
@@ -108,9 +115,11 @@ export const postsAPI = {
 };
 
 export const commentsAPI = {
-  getAll: async (postId) => {
-    const response = await api.get(`/posts/${postId}/comments`);
-    return response.data;
+  getAll: async (postId, cursor) => {
+    const response = await api.get(`/posts/${postId}/comments`, {
+      params: cursorParams(cursor),
+    });
+    return toPage(response);
   },
   
   create: async (postId, content) => {
@@ -125,9 +134,9 @@ export const commentsAPI = {
 };
 
 export const favoritesAPI = {
-  getAll: async () => {
-    const response = await api.get('/favorites');
-    return response.data;
+  getAll: async (cursor) => {
+    const response = await api.get('/favorites', { params: cursorParams(cursor) });
+    return toPage(response);
   },
   
   add: async (postId) => {
@@ -142,14 +151,18 @@ export const favoritesAPI = {
 };
 
 export const searchAPI = {
-  posts: async (query) => {
-    const response = await api.get('/search/posts', { params: { q: query } });
-    return response.data;
+  posts: async (query, cursor) => {
+    const response = await api.get('/search/posts', {
+      params: { q: query, ...cursorParams(cursor) },
+    });
+    return toPage(response);
   },
   
-  users: async (query) => {
-    const response = await api.get('/search/users', { params: { q: query } });
-    return response.data;
+  users: async (query, cursor) => {
+    const response = await api.get('/search/users', {
+      params: { q: query, ...cursorParams(cursor) },
+    });
+    return toPage(response);
   },
 };
 
@@ -0,0 +1,13 @@
+export default function LoadMoreButton({ onClick, loading }) {
+  return (
+    <div className="flex justify-center">
+      <button
+        onClick={onClick}
+        disabled={loading}
+        className="px-6 py-2 text-indigo-600 dark:text-indigo-400 border border-indigo-200 dark:border-indigo-800 rounded-lg font-medium hover:bg-indigo-50 dark:hover:bg-indigo-900/50 transition-colors disabled:opacity-50"
+      >
+        {loading ? 'Загрузка...' : 'Показать ещё'}
+      </button>
+    </div>
+  );
+}
@@ -20,10 +20,8 @@ export default function PostCard({ post, onUpdate }) {
     setRatingLoading(true);
     try {
       const newValue = localPost.user_rating === value ? 0 : value;
-      await postsAPI.rate(localPost.id, newValue);
-      if (onUpdate) {
-        await onUpdate();
-      }
+      const result = await postsAPI.rate(localPost.id, newValue);
+      setLocalPost({ ...localPost, rating: result.rating, user_rating: result.user_rating });
     } catch (err) {
       console.error(err);
     } finally {
@@ -92,7 +90,7 @@ export default function PostCard({ post, onUpdate }) {
         </Link>
 
         <div className="text-gray-700 dark:text-gray-100 mb-4 line-clamp-3 prose prose-sm dark:prose-invert max-w-none">
-          <Markdown content={localPost.content.slice(0, 300) + (localPost.content.length > 300 ? '...' : '')} />
+          <Markdown content={localPost.content.slice(0, 300) + (localPost.content_truncated || localPost.content.length > 300 ? '...' : '')} />
         </div>
 
         <div className="flex items-center justify-between pt-4 border-t border-gray-100 dark:border-gray-700">
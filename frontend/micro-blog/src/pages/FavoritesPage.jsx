@@ -4,6 +4,7 @@ import { favoritesAPI } from '../api';
 import { useAuth } from '../context/AuthContext';
 import Layout from '../components/Layout';
 import PostCard from '../components/PostCard';
+import LoadMoreButton from '../components/LoadMoreButton';
 
 export default function FavoritesPage() {
   const { user } = useAuth();
@@ -11,6 +12,8 @@ export default function FavoritesPage() {
   const [posts, setPosts] = useState([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     if (!user) {
@@ -24,8 +27,9 @@ export default function FavoritesPage() {
     setLoading(true);
     setError('');
     try {
-      const data = await favoritesAPI.getAll();
-      setPosts(data);
+      const page = await favoritesAPI.getAll();
+      setPosts(page.items);
+      setNextCursor(page.nextCursor);
     } catch (err) {
       setError('Не удалось загрузить избранное');
     } finally {
@@ -33,6 +37,20 @@ export default function FavoritesPage() {
     }
   };
 
+  const loadMoreFavorites = async () => {
+    if (!nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const page = await favoritesAPI.getAll(nextCursor);
+      setPosts([...posts, ...page.items]);
+      setNextCursor(page.nextCursor);
+    } catch (err) {
+      console.error('Failed to load favorites', err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   if (!user) return null;
 
   return (
@@ -67,6 +85,7 @@ export default function FavoritesPage() {
             {posts.map((post) => (
               <PostCard key={post.id} post={post} onUpdate={loadFavorites} />
             ))}
+            {nextCursor && <LoadMoreButton onClick={loadMoreFavorites} loading={loadingMore} />}
           </div>
         )}
       </div>
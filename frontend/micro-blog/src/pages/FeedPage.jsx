@@ -3,6 +3,7 @@ import { postsAPI, searchAPI } from '../api';
 import PostCard from '../components/PostCard';
 import SearchBar from '../components/SearchBar';
 import Layout from '../components/Layout';
+import LoadMoreButton from '../components/LoadMoreButton';
 
 export default function FeedPage() {
   const [posts, setPosts] = useState([]);
@@ -10,17 +11,36 @@ export default function FeedPage() {
   const [error, setError] = useState('');
   const [searchQuery, setSearchQuery] = useState('');
   const [isSearching, setIsSearching] = useState(false);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   const loadPosts = async () => {
     setError('');
     try {
-      const data = await postsAPI.getAll();
-      setPosts(data);
+      const page = await postsAPI.getAll();
+      setPosts(page.items);
+      setNextCursor(page.nextCursor);
     } catch (err) {
       setError('Не удалось загрузить посты');
     }
   };
 
+  const loadMorePosts = async () => {
+    if (!nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const page = searchQuery
+        ? await searchAPI.posts(searchQuery, nextCursor)
+        : await postsAPI.getAll(nextCursor);
+      setPosts([...posts, ...page.items]);
+      setNextCursor(page.nextCursor);
+    } catch (err) {
+      console.error('Failed to load posts', err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleSearch = async (query) => {
     if (!query.trim()) {
       setSearchQuery('');
@@ -32,8 +52,9 @@ export default function FeedPage() {
     setIsSearching(true);
     setError('');
     try {
-      const data = await searchAPI.posts(query);
-      setPosts(data);
+      const page = await searchAPI.posts(query);
+      setPosts(page.items);
+      setNextCursor(page.nextCursor);
     } catch (err) {
       setError('Ошибка поиска');
     } finally {
@@ -92,6 +113,7 @@ export default function FeedPage() {
             {posts.map((post) => (
               <PostCard key={post.id} post={post} onUpdate={loadPosts} />
             ))}
+            {nextCursor && <LoadMoreButton onClick={loadMorePosts} loading={loadingMore} />}
           </div>
         )}
       </div>
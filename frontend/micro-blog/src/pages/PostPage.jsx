@@ -4,6 +4,7 @@ import { postsAPI, commentsAPI, favoritesAPI } from '../api';
 import { useAuth } from '../context/AuthContext';
 import Layout from '../components/Layout';
 import Markdown from '../components/Markdown';
+import LoadMoreButton from '../components/LoadMoreButton';
 import { ChatBubbleIcon, ChevronUpIcon, ChevronDownIcon, StarIcon } from '../components/Icons';
 
 export default function PostPage() {
@@ -12,6 +13,8 @@ export default function PostPage() {
   const { user } = useAuth();
   const [post, setPost] = useState(null);
   const [comments, setComments] = useState([]);
+  const [commentsCursor, setCommentsCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [newComment, setNewComment] = useState('');
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
@@ -30,13 +33,28 @@ export default function PostPage() {
 
   const loadComments = async () => {
     try {
-      const data = await commentsAPI.getAll(id);
-      setComments(data);
+      const page = await commentsAPI.getAll(id);
+      setComments(page.items);
+      setCommentsCursor(page.nextCursor);
     } catch (err) {
       console.error('Failed to load comments', err);
     }
   };
 
+  const loadMoreComments = async () => {
+    if (!commentsCursor || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const page = await commentsAPI.getAll(id, commentsCursor);
+      setComments([...comments, ...page.items]);
+      setCommentsCursor(page.nextCursor);
+    } catch (err) {
+      console.error('Failed to load comments', err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   useEffect(() => {
     setLoading(true);
     Promise.all([loadPost(), loadComments()]).finally(() => setLoading(false));
@@ -47,8 +65,8 @@ export default function PostPage() {
     setRatingLoading(true);
     try {
       const newValue = post.user_rating === value ? 0 : value;
-      await postsAPI.rate(post.id, newValue);
-      await loadPost();
+      const result = await postsAPI.rate(post.id, newValue);
+      setPost({ ...post, rating: result.rating, user_rating: result.user_rating });
     } catch (err) {
       console.error(err);
     } finally {
@@ -82,6 +100,7 @@ export default function PostPage() {
     try {
       const comment = await commentsAPI.create(id, newComment);
       setComments([comment, ...comments]);
+      setPost({ ...post, comments_count: post.comments_count + 1 });
       setNewComment('');
     } catch (err) {
       setCommentError('Не удалось добавить комментарий');
@@ -94,6 +113,7 @@ export default function PostPage() {
     try {
       await commentsAPI.delete(id, commentId);
       setComments(comments.filter(c => c.id !== commentId));
+      setPost({ ...post, comments_count: post.comments_count - 1 });
     } catch (err) {
       console.error(err);
     }
@@ -237,7 +257,7 @@ export default function PostPage() {
 
                 <div className="flex items-center space-x-1 text-gray-500 dark:text-gray-400">
                   <ChatBubbleIcon className="w-5 h-5" />
-                  <span>{comments.length} комментариев</span>
+                  <span>{post.comments_count} комментариев</span>
                 </div>
               </div>
 
@@ -335,6 +355,9 @@ export default function PostPage() {
                   </p>
                 </div>
               ))}
+              {commentsCursor && (
+                <LoadMoreButton onClick={loadMoreComments} loading={loadingMore} />
+              )}
             </div>
           )}
         </div>
@@ -4,6 +4,7 @@ import { usersAPI, postsAPI, uploadsAPI } from '../api';
 import { useAuth } from '../context/AuthContext';
 import Layout from '../components/Layout';
 import PostCard from '../components/PostCard';
+import LoadMoreButton from '../components/LoadMoreButton';
 
 export default function ProfilePage() {
   const { user, updateUser } = useAuth();
@@ -18,6 +19,8 @@ export default function ProfilePage() {
   const [serverError, setServerError] = useState('');
   const [saving, setSaving] = useState(false);
   const [uploadingAvatar, setUploadingAvatar] = useState(false);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     if (!user) {
@@ -35,8 +38,9 @@ export default function ProfilePage() {
   const loadPosts = async () => {
     setLoading(true);
     try {
-      const data = await postsAPI.getMy();
-      setPosts(data);
+      const page = await postsAPI.getMy();
+      setPosts(page.items);
+      setNextCursor(page.nextCursor);
     } catch (err) {
       console.error(err);
     } finally {
@@ -44,6 +48,20 @@ export default function ProfilePage() {
     }
   };
 
+  const loadMorePosts = async () => {
+    if (!nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const page = await postsAPI.getMy(nextCursor);
+      setPosts([...posts, ...page.items]);
+      setNextCursor(page.nextCursor);
+    } catch (err) {
+      console.error(err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const validate = () => {
     const newErrors = {};
     
@@ -241,7 +259,7 @@ export default function ProfilePage() {
 
         <div>
           <h2 className="text-xl font-semibold text-gray-900 dark:text-white mb-6">
-            Мои посты ({posts.length})
+            Мои посты ({posts.length}{nextCursor ? '+' : ''})
           </h2>
 
           {loading ? (
@@ -263,6 +281,7 @@ export default function ProfilePage() {
               {posts.map((post) => (
                 <PostCard key={post.id} post={post} onUpdate={loadPosts} />
               ))}
+              {nextCursor && <LoadMoreButton onClick={loadMorePosts} loading={loadingMore} />}
             </div>
           )}
         </div>
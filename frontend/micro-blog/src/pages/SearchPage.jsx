@@ -3,6 +3,7 @@ import { Link } from 'react-router-dom';
 import { searchAPI } from '../api';
 import Layout from '../components/Layout';
 import PostCard from '../components/PostCard';
+import LoadMoreButton from '../components/LoadMoreButton';
 
 export default function SearchPage() {
   const [query, setQuery] = useState('');
@@ -11,6 +12,9 @@ export default function SearchPage() {
   const [users, setUsers] = useState([]);
   const [loading, setLoading] = useState(false);
   const [searched, setSearched] = useState(false);
+  const [searchedQuery, setSearchedQuery] = useState('');
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   const handleSearch = async (e) => {
     e.preventDefault();
@@ -18,13 +22,16 @@ export default function SearchPage() {
     
     setLoading(true);
     setSearched(true);
+    setSearchedQuery(query);
     try {
       if (activeTab === 'posts') {
-        const data = await searchAPI.posts(query);
-        setPosts(data);
+        const page = await searchAPI.posts(query);
+        setPosts(page.items);
+        setNextCursor(page.nextCursor);
       } else {
-        const data = await searchAPI.users(query);
-        setUsers(data);
+        const page = await searchAPI.users(query);
+        setUsers(page.items);
+        setNextCursor(page.nextCursor);
       }
     } catch (err) {
       console.error(err);
@@ -33,11 +40,32 @@ export default function SearchPage() {
     }
   };
 
+  const loadMoreResults = async () => {
+    if (!nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      if (activeTab === 'posts') {
+        const page = await searchAPI.posts(searchedQuery, nextCursor);
+        setPosts([...posts, ...page.items]);
+        setNextCursor(page.nextCursor);
+      } else {
+        const page = await searchAPI.users(searchedQuery, nextCursor);
+        setUsers([...users, ...page.items]);
+        setNextCursor(page.nextCursor);
+      }
+    } catch (err) {
+      console.error(err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleTabChange = (tab) => {
     setActiveTab(tab);
     setPosts([]);
     setUsers([]);
     setSearched(false);
+    setNextCursor(null);
   };
 
   return (
@@ -115,6 +143,7 @@ export default function SearchPage() {
               {posts.map((post) => (
                 <PostCard key={post.id} post={post} />
               ))}
+              {nextCursor && <LoadMoreButton onClick={loadMoreResults} loading={loadingMore} />}
             </div>
           )
         ) : (
@@ -160,6 +189,7 @@ export default function SearchPage() {
                   </div>
                 </Link>
               ))}
+              {nextCursor && <LoadMoreButton onClick={loadMoreResults} loading={loadingMore} />}
             </div>
           )
         )}
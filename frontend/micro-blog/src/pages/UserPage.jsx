@@ -4,6 +4,7 @@ import { usersAPI } from '../api';
 import { useAuth } from '../context/AuthContext';
 import Layout from '../components/Layout';
 import PostCard from '../components/PostCard';
+import LoadMoreButton from '../components/LoadMoreButton';
 
 export default function UserPage() {
   const { id } = useParams();
@@ -13,6 +14,8 @@ export default function UserPage() {
   const [posts, setPosts] = useState([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     if (currentUser && id === currentUser.id) {
@@ -32,7 +35,8 @@ export default function UserPage() {
         usersAPI.getUserPosts(id),
       ]);
       setUser(userData);
-      setPosts(userPosts);
+      setPosts(userPosts.items);
+      setNextCursor(userPosts.nextCursor);
     } catch {
       setError('Пользователь не найден');
     } finally {
@@ -40,6 +44,20 @@ export default function UserPage() {
     }
   };
 
+  const loadMorePosts = async () => {
+    if (!nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const page = await usersAPI.getUserPosts(id, nextCursor);
+      setPosts([...posts, ...page.items]);
+      setNextCursor(page.nextCursor);
+    } catch (err) {
+      console.error('Failed to load posts', err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   useEffect(() => {
     if (currentUser && id === currentUser.id) {
       navigate('/profile');
@@ -129,6 +147,7 @@ export default function UserPage() {
               {posts.map((post) => (
                 <PostCard key={post.id} post={post} />
               ))}
+              {nextCursor && <LoadMoreButton onClick={loadMorePosts} loading={loadingMore} />}
             </div>
           )}
         </div>
@@ -0,0 +1,24 @@
+import { describe, it, expect, vi } from 'vitest';
+import { render, screen } from '@testing-library/react';
+import userEvent from '@testing-library/user-event';
+import LoadMoreButton from '../../components/LoadMoreButton';
+
+describe('LoadMoreButton', () => {
+  it('calls onClick when clicked', async () => {
+    const onClick = vi.fn();
+    const user = userEvent.setup();
+
+    render(<LoadMoreButton onClick={onClick} loading={false} />);
+
+    await user.click(screen.getByRole('button', { name: /показать ещё/i }));
+
+    expect(onClick).toHaveBeenCalledTimes(1);
+  });
+
+  it('is disabled while the next page is loading', () => {
+    render(<LoadMoreButton onClick={() => {}} loading />);
+
+    const button = screen.getByRole('button', { name: /загрузка/i });
+    expect(button).toBeDisabled();
+  });
+});